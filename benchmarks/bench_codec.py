@@ -0,0 +1,62 @@
+"""
+Compare the JSON codec used by usepolvo against the standard library.
+
+Decodes and encodes a synthetic list response shaped like a Salesforce or Certn
+page, as BaseClient does for every response and cache entry.
+
+Usage:
+    python benchmarks/bench_codec.py [--records 1000] [--repeat 20]
+"""
+
+import argparse
+import json
+import timeit
+
+from usepolvo.ink import codec
+
+
+def make_page(records: int) -> dict:
+    return {
+        "totalSize": records,
+        "done": True,
+        "records": [
+            {
+                "Id": f"001{i:015d}",
+                "Name": f"Account {i} — Ünïcode",
+                "AnnualRevenue": i * 1234.5,
+                "IsDeleted": False,
+                "Owner": {"Id": f"005{i:015d}", "Email": f"owner{i}@example.com"},
+                "Tags": ["customer", "enterprise", str(i)],
+            }
+            for i in range(records)
+        ],
+    }
+
+
+def best(func, repeat: int) -> float:
+    """Best time of `repeat` runs, in milliseconds."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.records)
+    body = json.dumps(page).encode("utf-8")
+    print(f"codec backend: {codec.BACKEND}, body: {len(body) / 1024:.0f} KiB, {args.records} records")
+
+    rows = [
+        ("decode", lambda: json.loads(body), lambda: codec.loads(body)),
+        ("encode", lambda: json.dumps(page).encode("utf-8"), lambda: codec.dumps(page)),
+    ]
+    print(f"{'':8}{'json (ms)':>12}{codec.BACKEND + ' (ms)':>16}{'speedup':>10}")
+    for name, stdlib, fast in rows:
+        stdlib_ms, fast_ms = best(stdlib, args.repeat), best(fast, args.repeat)
+        print(f"{name:8}{stdlib_ms:12.2f}{fast_ms:16.2f}{stdlib_ms / fast_ms:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
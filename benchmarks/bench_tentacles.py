@@ -0,0 +1,416 @@
+"""
+End-to-end benchmark of the tentacles against local API emulators.
+
+Runs each tentacle's CRUD, list and webhook paths against the emulators in
+benchmarks/emulators.py and reports throughput, p50/p99 latency and memory per
+operation. Results are written as JSON; pass a previous run as --baseline to fail
+(exit status 1) when a path got slower or hungrier beyond --tolerance.
+
+Client-side caching and the tentacles' own rate limiters are disabled unless
+--cache / --client-limits are given, so every operation reaches the emulator. The
+emulators still enforce --rate-limit with 429s, which exercises the retry path.
+
+Usage:
+    python benchmarks/bench_tentacles.py [--tentacles certn,stripe] [--ops 200] [--concurrency 4]
+        [--latency 0.005] [--rate-limit 500] [--output results.json] [--baseline previous.json]
+"""
+
+import argparse
+import collections
+import hashlib
+import hmac
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from unittest.mock import patch
+
+import requests
+from aiohttp import web
+from emulators import EMULATORS, EmulatorConfig, EmulatorServer, sample
+
+from usepolvo.arms.base_rate_limiter import BaseRateLimiter
+from usepolvo.arms.cache import CachePolicy, CachePolicyTable
+from usepolvo.beak.config import get_settings
+from usepolvo.beak.enums import GraphQLSchemaMode
+from usepolvo.ink import codec
+
+WEBHOOK_SECRET = "whsec_benchmark"
+
+
+class Scenario(NamedTuple):
+    """The operations benchmarked for a tentacle, called with the operation's index."""
+
+    operations: Dict[str, Callable[[int], Any]]
+    max_concurrency: Optional[int] = None  # For clients that cannot be shared between threads
+
+
+class Unlimited(BaseRateLimiter):
+    """Client-side rate limiter that never waits."""
+
+    def wait_if_needed(self, *args, **kwargs):
+        pass
+
+    def get_limits(self):
+        return {}
+
+
+def prepare(client, args):
+    """Disable client-side caching and rate limiting unless asked to keep them."""
+    if not args.cache:
+        client.cache_policies = CachePolicyTable(CachePolicy(ttl=0, cacheable=False))
+    if not args.client_limits:
+        client.rate_limiter = Unlimited()
+    return client
+
+
+def crud(resource, server_ids: List[str], make: Callable[[int], Dict[str, Any]], update: Dict[str, Any], **list_kwargs):
+    """CRUD and list operations on a resource; deletes remove the records created by the create operation."""
+    created = collections.deque()
+
+    def create(i):
+        record = resource.create(make(i))
+        created.append(record_id(record))
+
+    return {
+        "list": lambda i: resource.list(**list_kwargs),
+        "get": lambda i: resource.get(server_ids[i % len(server_ids)]),
+        "create": create,
+        "update": lambda i: resource.update(server_ids[i % len(server_ids)], dict(update)),
+        "delete": lambda i: resource.delete(created.popleft()),
+    }
+
+
+def record_id(record: Any) -> str:
+    if isinstance(record, dict):
+        return record.get("id") or record.get("Id")
+    return getattr(record, "id", None) or getattr(record, "Id")
+
+
+def certn(server, emulator, args) -> Scenario:
+    from usepolvo.tentacles.certn import CertnClient
+
+    client = prepare(CertnClient(api_key="benchmark"), args)
+    client.base_url = server["certn"]
+    applications = client.applications
+    operations = crud(
+        applications,
+        list(emulator.records),
+        lambda i: {"email": f"applicant{i}@example.com"},
+        {"email": "updated@example.com"},
+        page=1,
+        size=args.page_size,
+    )
+    operations["iter_all"] = lambda i: sum(1 for _ in applications.iter_all(size=args.page_size))
+    operations["scan"] = lambda i: sum(1 for _ in applications.scan(size=args.page_size))
+    return Scenario(operations)
+
+
+def stripe(server, emulator, args) -> Scenario:
+    import stripe as stripe_sdk
+
+    from usepolvo.tentacles.stripe import StripeClient
+
+    stripe_sdk.api_base = server["stripe"]
+    client = prepare(StripeClient(api_key="sk_test_benchmark"), args)
+    operations = crud(
+        client.customers,
+        list(emulator.records),
+        lambda i: {"email": f"customer{i}@example.com"},
+        {"name": "Updated"},
+        size=min(args.page_size, 100),
+    )
+    return Scenario(operations)
+
+
+def hubspot(server, emulator, args) -> Scenario:
+    import hubspot as hubspot_sdk
+
+    from usepolvo.tentacles.hubspot import HubSpotClient
+    from usepolvo.tentacles.hubspot.auth import HubSpotAuth
+
+    def authenticate(auth):
+        auth.access_token, auth.token_expiry = "benchmark", time.time() + 24 * 60 * 60
+
+    with patch.object(HubSpotAuth, "start_auth_flow", authenticate):
+        client = prepare(HubSpotClient(client_id="benchmark", client_secret="benchmark", redirect_uri="http://x"), args)
+    client.client = hubspot_sdk.Client.create(access_token="benchmark", host=server["hubspot"])
+    operations = crud(
+        client.contacts,
+        list(emulator.records),
+        lambda i: {"email": f"contact{i}@example.com", "firstname": "Bench"},
+        {"lastname": "Updated"},
+        limit=min(args.page_size, 100),
+    )
+    return Scenario(operations)
+
+
+def salesforce(server, emulator, args) -> Scenario:
+    from usepolvo.tentacles.salesforce import SalesforceClient
+    from usepolvo.tentacles.salesforce.auth import SalesforceAuth
+
+    def authenticate(auth):
+        auth.access_token, auth.token_expiry, auth.instance_url = "benchmark", time.time() + 3600, server["salesforce"]
+
+    with patch.object(SalesforceAuth, "start_oauth_flow", authenticate):
+        client = prepare(SalesforceClient(consumer_key="benchmark", consumer_secret="benchmark"), args)
+    client.base_url = f"{server['salesforce']}/services/data/v61.0"
+    ids = list(emulator.records)
+    operations = crud(client.accounts, ids[: len(ids) // 2], lambda i: {"Name": f"Account {i}"}, {"Industry": "Retail"})
+    # Salesforce answers updates with 204 No Content, which AccountResource.update cannot parse yet
+    del operations["update"]
+    # Creates answer {"id": ...}, which AccountResponse drops, so deletes use seeded records nothing else reads
+    spare = ids[len(ids) // 2 :]
+    operations["delete"] = lambda i: client.accounts.delete(spare.pop())
+    return Scenario(operations)
+
+
+def linear(server, emulator, args) -> Scenario:
+    from usepolvo.tentacles.linear import LinearClient
+
+    client = prepare(LinearClient(api_key="lin_benchmark"), args)
+    client.base_url = f"{server['linear']}/graphql"
+    client._setup_graphql_client()
+    operations = crud(
+        client.issues,
+        list(emulator.records),
+        lambda i: {"title": f"Issue {i}", "team_id": "team-1"},
+        {"title": "Updated"},
+        size=args.page_size,
+    )
+    # gql's synchronous transport holds one connection per client and cannot be used from several threads
+    return Scenario(operations, max_concurrency=1)
+
+
+def llm(server, emulator, args) -> Scenario:
+    from anthropic import Anthropic
+    from openai import OpenAI
+
+    from usepolvo.tentacles.claude import ClaudeClient
+    from usepolvo.tentacles.openai import OpenAIClient
+
+    openai_client = prepare(OpenAIClient(api_key="sk-benchmark"), args)
+    openai_client.client = OpenAI(api_key="sk-benchmark", base_url=f"{server['llm']}/v1")
+    claude_client = prepare(ClaudeClient(api_key="sk-ant-benchmark"), args)
+    claude_client.client = Anthropic(api_key="sk-ant-benchmark", base_url=server["llm"])
+
+    def chat(i):
+        return openai_client.completions.create({"model": "gpt-4", "messages": [{"role": "user", "content": "Hi"}]})
+
+    def complete(i):
+        return claude_client.completions.create(
+            {"model": "claude-2.1", "prompt": "\n\nHuman: Hi\n\nAssistant:", "max_tokens_to_sample": 16}
+        )
+
+    return Scenario({"openai_chat": chat, "claude_complete": complete})
+
+
+def webhooks(server, emulator, args) -> Scenario:
+    from usepolvo.tentacles.certn import CertnWebhook
+    from usepolvo.tentacles.certn.webhook.schemas import CertnWebhookPayload
+    from usepolvo.tentacles.stripe import StripeWebhook
+
+    certn_webhook = CertnWebhook()
+    certn_webhook.set_secret_key(WEBHOOK_SECRET)
+    stripe_webhook = StripeWebhook()
+
+    # Served like BaseWebhook.start_server does, without the ngrok tunnel
+    app = web.Application()
+    app.router.add_post("/certn", certn_webhook._handle_webhook)
+    app.router.add_post("/stripe", stripe_webhook._handle_webhook)
+    url = server.mount("webhooks", app)
+
+    certn_body = codec.dumps({**sample(CertnWebhookPayload), "request_enhanced_identity_verification": True})
+    signature = hmac.new(WEBHOOK_SECRET.encode(), certn_body, hashlib.sha256).hexdigest()
+    stripe_body = codec.dumps({"id": "evt_benchmark", "object": "event", "type": "customer.created", "data": {}})
+    session = requests.Session()
+
+    def deliver(path, body, headers=None):
+        def post(i):
+            response = session.post(f"{url}{path}", data=body, headers=headers)
+            response.raise_for_status()
+
+        return post
+
+    return Scenario(
+        {
+            "certn_signed": deliver("/certn", certn_body, {"Certn-Signature": signature}),
+            "stripe": deliver("/stripe", stripe_body),
+        }
+    )
+
+
+SCENARIOS = {
+    "certn": ("certn", certn),
+    "stripe": ("stripe", stripe),
+    "hubspot": ("hubspot", hubspot),
+    "salesforce": ("salesforce", salesforce),
+    "linear": ("linear", linear),
+    "llm": ("llm", llm),
+    "webhooks": (None, webhooks),
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(operation: Callable[[int], Any], args, concurrency: int, offset: int) -> Dict[str, Any]:
+    """Time `args.ops` calls of an operation, then trace the memory of `args.memory_ops` more."""
+    errors: List[str] = []
+    latencies: List[float] = []
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            operation(offset + i)
+        except Exception as e:
+            errors.append(repr(e))
+        latencies.append(time.perf_counter() - start)
+
+    for i in range(args.warmup):
+        timed(i)
+    errors.clear()
+    latencies.clear()
+    offset += args.warmup
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(timed, range(args.ops)))
+    elapsed = time.perf_counter() - start
+    offset += args.ops
+
+    latencies.sort()
+    result = {
+        "ops": args.ops,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "throughput": args.ops / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+    }
+    if errors:
+        result["first_error"] = errors[0]
+
+    if args.memory_ops:
+        tracemalloc.start()
+        for i in range(args.memory_ops):
+            try:
+                operation(offset + i)
+            except Exception:
+                pass
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_memory_kib"] = peak / 1024
+        result["retained_kib_per_op"] = current / 1024 / args.memory_ops
+    return result
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Describe the paths that regressed against a baseline run."""
+    previous = {(entry["tentacle"], entry["path"]): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["tentacle"], entry["path"]))
+        if before is None:
+            continue
+        name = f"{entry['tentacle']}.{entry['path']}"
+        if entry["errors"] > before["errors"]:
+            regressions.append(f"{name}: {entry['errors']} errors (was {before['errors']})")
+        if entry["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {entry['throughput']:.0f}/s (was {before['throughput']:.0f}/s)")
+        for key in ("p50_ms", "p99_ms", "peak_memory_kib"):
+            if key in entry and key in before and entry[key] > before[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {entry[key]:.2f} (was {before[key]:.2f})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tentacles", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--paths", default=None, help="Comma-separated operations to run (default: all)")
+    parser.add_argument("--ops", type=int, default=200, help="Timed operations per path")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed operations per path, run first")
+    parser.add_argument("--memory-ops", type=int, default=20, help="Operations traced for memory per path")
+    parser.add_argument("--concurrency", type=int, default=4, help="Threads issuing operations")
+    parser.add_argument("--latency", type=float, default=0.0, help="Emulated API latency (in seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to (in seconds)")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Emulated requests per rate window")
+    parser.add_argument("--rate-window", type=float, default=1.0, help="Emulated rate limit window (in seconds)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--page-size", type=int, default=50, help="Records per page for list paths")
+    parser.add_argument("--cache", action="store_true", help="Keep client-side response caching")
+    parser.add_argument("--client-limits", action="store_true", help="Keep the tentacles' own rate limiters")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", default=None, help="Results of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    settings.LOG_LEVEL = "WARNING"  # Keep unhandled-webhook notices out of the report
+    settings.GRAPHQL_SCHEMA_MODE = GraphQLSchemaMode.NONE  # The Linear emulator does not answer introspection
+
+    selected = [name.strip() for name in args.tentacles.split(",") if name.strip()]
+    paths = set(args.paths.split(",")) if args.paths else None
+    per_path = args.warmup + args.ops + args.memory_ops
+    config = EmulatorConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        throttle_rate=args.throttle_rate,
+        records=max(250, 2 * per_path),  # Enough records for gets, updates and deletes never to share an ID
+        page_size=max(args.page_size, 100),
+    )
+    emulators = {name: EMULATORS[name](config) for name, _ in (SCENARIOS[s] for s in selected) if name}
+
+    results = []
+    with EmulatorServer(*emulators.values()) as server:
+        for scenario_name in selected:
+            emulator_name, build = SCENARIOS[scenario_name]
+            scenario = build(server, emulators.get(emulator_name), args)
+            concurrency = min(args.concurrency, scenario.max_concurrency or args.concurrency)
+            for path, operation in scenario.operations.items():
+                if paths and path not in paths:
+                    continue
+                result = {"tentacle": scenario_name, "path": path, **measure(operation, args, concurrency, 0)}
+                results.append(result)
+                memory = f"{result['peak_memory_kib']:9.0f}" if "peak_memory_kib" in result else f"{'-':>9}"
+                print(
+                    f"{scenario_name:11}{path:16}{result['throughput']:9.0f}/s"
+                    f"{result['p50_ms']:9.2f}{result['p99_ms']:9.2f} ms{memory} KiB"
+                    f"{'  errors: ' + str(result['errors']) if result['errors'] else ''}"
+                )
+        throttled = {name: emulator.throttled for name, emulator in emulators.items() if emulator.throttled}
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "codec": codec.BACKEND,
+            "emulator": config._asdict(),
+            "args": vars(args),
+            "throttled": throttled,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(codec.dumps(report))
+
+    if args.baseline:
+        with open(args.baseline, "rb") as f:
+            regressions = compare(results, codec.loads(f.read()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
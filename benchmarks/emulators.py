@@ -0,0 +1,590 @@
+"""
+Local stand-ins for the APIs usepolvo integrates with.
+
+Each emulator is an aiohttp application serving the endpoints a tentacle calls, with
+response shapes taken from the tentacle's schemas. Latency, rate limiting (with the
+provider's rate-limit headers and 429 responses) and page sizes are configurable, so
+benchmarks exercise the same retry, pagination and parsing paths as production traffic.
+
+    with EmulatorServer(CertnEmulator(EmulatorConfig(latency=0.005))) as server:
+        client.base_url = server["certn"]
+
+Emulators keep their records in memory and are not meant to be faithful beyond what
+the tentacles use.
+"""
+
+import asyncio
+import itertools
+import math
+import random
+import threading
+import time
+import typing
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+from aiohttp import web
+from pydantic import BaseModel
+
+from usepolvo.ink import codec
+
+
+class EmulatorConfig(NamedTuple):
+    latency: float = 0.0  # Seconds added to every response
+    jitter: float = 0.0  # Extra random latency, up to this many seconds
+    rate_limit: Optional[int] = None  # Requests allowed per rate_window; further ones get a 429
+    rate_window: float = 1.0  # Length of the rate limit window (in seconds)
+    throttle_rate: float = 0.0  # Fraction of requests answered with a 429 regardless of the rate limit
+    records: int = 250  # Records each emulator starts with
+    page_size: int = 100  # Largest page served by list endpoints
+
+
+def sample(model: typing.Type[BaseModel]) -> Dict[str, Any]:
+    """Build a payload that validates against a pydantic model, filling optional fields too."""
+    return {name: _sample_value(field.annotation) for name, field in model.model_fields.items()}
+
+
+def _sample_value(annotation: Any) -> Any:
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin in (list, List):
+        return [_sample_value(args[0])] if args else []
+    if origin in (dict, Dict):
+        return {}
+    if args and origin is not None:  # Optional/Union: use the first alternative
+        return _sample_value(args[0])
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample(annotation)
+    if annotation is bool:
+        return False
+    if annotation is int:
+        return 1
+    if annotation is float:
+        return 1.0
+    if annotation is str:
+        return "sample"
+    if annotation is datetime:
+        return _now()
+    if getattr(annotation, "__name__", "") == "HttpUrl":
+        return "https://example.com/"
+    return None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    return web.Response(body=codec.dumps(data), status=status, headers=headers, content_type="application/json")
+
+
+class Emulator:
+    """
+    Base class of the API emulators.
+
+    Subclasses set `name`, build their records with `make_record` and register their
+    routes in `routes`. The middleware adds latency, enforces the rate limit and sets
+    rate-limit headers on every response.
+    """
+
+    name = ""
+    id_prefix = ""
+
+    def __init__(self, config: EmulatorConfig = EmulatorConfig()):
+        self.config = config
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.url: Optional[str] = None  # Set when served by an EmulatorServer
+        self.requests = 0
+        self.throttled = 0
+        self._ids = itertools.count(1)
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self.app = web.Application(middlewares=[self._middleware])
+        self.routes(self.app.router)
+        for _ in range(config.records):
+            record_id = self.new_id()
+            self.records[record_id] = self.make_record(record_id)
+
+    def new_id(self) -> str:
+        return f"{self.id_prefix}{next(self._ids):012d}"
+
+    def make_record(self, record_id: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def routes(self, router: web.UrlDispatcher):
+        raise NotImplementedError
+
+    def rate_limit_headers(self, remaining: int, reset: float) -> Dict[str, str]:
+        """Headers describing the rate limit, in the provider's format."""
+        return {
+            "X-RateLimit-Limit": str(self.config.rate_limit),
+            "X-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-RateLimit-Reset": str(math.ceil(reset)),
+        }
+
+    def error(self, status: int, message: str) -> web.Response:
+        """An error response, in the provider's format."""
+        return json_response({"message": message}, status=status)
+
+    def page(self, offset: int, size: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """Get `size` records from `offset`, and whether more follow."""
+        size = max(1, min(size, self.config.page_size))
+        records = list(itertools.islice(self.records.values(), offset, offset + size))
+        return records, offset + size < len(self.records)
+
+    def lookup(self, request: web.Request) -> Dict[str, Any]:
+        record = self.records.get(request.match_info["id"])
+        if record is None:
+            raise web.HTTPNotFound()
+        return record
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests += 1
+        delay = self.config.latency + random.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers: Dict[str, str] = {}
+        if self.config.rate_limit is not None:
+            remaining, reset = self._take()
+            headers = self.rate_limit_headers(remaining, reset)
+            if remaining < 0:
+                return self._throttle(headers, reset)
+        if self.config.throttle_rate and random.random() < self.config.throttle_rate:
+            return self._throttle(headers, self.config.rate_window)
+
+        try:
+            response = await handler(request)
+        except web.HTTPNotFound:
+            response = self.error(404, "Not found")
+        response.headers.update(headers)
+        return response
+
+    def _take(self) -> Tuple[int, float]:
+        """Count a request against the fixed window; returns requests remaining and seconds until reset."""
+        now = time.monotonic()
+        if now - self._window_start >= self.config.rate_window:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        reset = self.config.rate_window - (now - self._window_start)
+        return self.config.rate_limit - self._window_count, reset
+
+    def _throttle(self, headers: Dict[str, str], reset: float) -> web.Response:
+        self.throttled += 1
+        response = self.error(429, "Too many requests")
+        response.headers.update(headers)
+        response.headers["Retry-After"] = f"{max(reset, 0.001):.3f}"
+        return response
+
+
+class CertnEmulator(Emulator):
+    """Certn HR API: applicants, paginated with page/size and count/next/results."""
+
+    name = "certn"
+
+    def __init__(self, config: EmulatorConfig = EmulatorConfig()):
+        from usepolvo.tentacles.certn.resources.applications.schemas import (
+            ApplicationResponse,
+        )
+
+        self.template = sample(ApplicationResponse)
+        super().__init__(config)
+
+    def make_record(self, record_id, data=None):
+        return {**self.template, **(data or {}), "id": record_id, "short_uid": record_id[-8:]}
+
+    def routes(self, router):
+        router.add_get("/hr/v1/applicants/", self.list)
+        router.add_post("/hr/v1/applicants/", self.create)
+        router.add_get("/hr/v1/applicants/{id}/", self.get)
+        router.add_put("/hr/v1/applicants/{id}/", self.update)
+        router.add_delete("/hr/v1/applicants/{id}/", self.delete)
+
+    async def list(self, request):
+        page = int(request.query.get("page", 1))
+        size = int(request.query.get("size", 10))
+        records, more = self.page((page - 1) * size, size)
+        next_url = f"{self.url}{request.path}?{urlencode({'page': page + 1, 'size': size})}" if more else None
+        return json_response({"count": len(self.records), "next": next_url, "previous": None, "results": records})
+
+    async def get(self, request):
+        return json_response(self.lookup(request))
+
+    async def create(self, request):
+        record_id = self.new_id()
+        self.records[record_id] = self.make_record(record_id, await request.json(loads=codec.loads))
+        return json_response(self.records[record_id], status=201)
+
+    async def update(self, request):
+        record = self.lookup(request)
+        record.update(await request.json(loads=codec.loads))
+        return json_response(record)
+
+    async def delete(self, request):
+        self.lookup(request)
+        del self.records[request.match_info["id"]]
+        return web.Response(status=204)
+
+
+class StripeEmulator(Emulator):
+    """Stripe: customers, form-encoded writes and cursor pagination with has_more/starting_after."""
+
+    name = "stripe"
+    id_prefix = "cus_"
+
+    def make_record(self, record_id, data=None):
+        record = {
+            "id": record_id,
+            "object": "customer",
+            "created": int(time.time()),
+            "email": f"{record_id}@example.com",
+            "name": f"Customer {record_id}",
+            "livemode": False,
+            "metadata": {},
+        }
+        record.update(data or {})
+        return record
+
+    def error(self, status, message):
+        error_type = "rate_limit_error" if status == 429 else "invalid_request_error"
+        return json_response({"error": {"type": error_type, "message": message}}, status=status)
+
+    def routes(self, router):
+        router.add_get("/v1/customers", self.list)
+        router.add_post("/v1/customers", self.create)
+        router.add_get("/v1/customers/{id}", self.get)
+        router.add_post("/v1/customers/{id}", self.update)
+        router.add_delete("/v1/customers/{id}", self.delete)
+
+    async def list(self, request):
+        ids = list(self.records)
+        after = request.query.get("starting_after")
+        offset = ids.index(after) + 1 if after in self.records else 0
+        records, more = self.page(offset, int(request.query.get("limit", 10)))
+        return json_response({"object": "list", "url": "/v1/customers", "has_more": more, "data": records})
+
+    async def get(self, request):
+        return json_response(self.lookup(request))
+
+    async def create(self, request):
+        record_id = self.new_id()
+        self.records[record_id] = self.make_record(record_id, dict(await request.post()))
+        return json_response(self.records[record_id])
+
+    async def update(self, request):
+        record = self.lookup(request)
+        record.update(await request.post())
+        return json_response(record)
+
+    async def delete(self, request):
+        self.lookup(request)
+        del self.records[request.match_info["id"]]
+        return json_response({"id": request.match_info["id"], "object": "customer", "deleted": True})
+
+
+class HubSpotEmulator(Emulator):
+    """HubSpot CRM v3: contacts, paginated with limit/after and paging.next."""
+
+    name = "hubspot"
+
+    def rate_limit_headers(self, remaining, reset):
+        return {
+            "X-HubSpot-RateLimit-Max": str(self.config.rate_limit),
+            "X-HubSpot-RateLimit-Remaining": str(max(remaining, 0)),
+            "X-HubSpot-RateLimit-Interval-Milliseconds": str(int(self.config.rate_window * 1000)),
+        }
+
+    def error(self, status, message):
+        category = "RATE_LIMITS" if status == 429 else "OBJECT_NOT_FOUND"
+        return json_response({"status": "error", "message": message, "category": category}, status=status)
+
+    def make_record(self, record_id, data=None):
+        now = _now()
+        properties = {
+            "email": f"contact{record_id}@example.com",
+            "firstname": "Sample",
+            "lastname": f"Contact {record_id}",
+            "hs_object_id": record_id,
+            "createdate": now,
+            "lastmodifieddate": now,
+        }
+        properties.update(data or {})
+        return {"id": record_id, "properties": properties, "createdAt": now, "updatedAt": now, "archived": False}
+
+    def routes(self, router):
+        router.add_get("/crm/v3/objects/contacts", self.list)
+        router.add_post("/crm/v3/objects/contacts", self.create)
+        router.add_get("/crm/v3/objects/contacts/{id}", self.get)
+        router.add_patch("/crm/v3/objects/contacts/{id}", self.update)
+        router.add_delete("/crm/v3/objects/contacts/{id}", self.delete)
+
+    async def list(self, request):
+        offset = int(request.query.get("after", 0))
+        limit = int(request.query.get("limit", 10))
+        records, more = self.page(offset, limit)
+        body: Dict[str, Any] = {"results": records}
+        if more:
+            after = str(offset + limit)
+            body["paging"] = {"next": {"after": after, "link": f"{self.url}{request.path}?after={after}"}}
+        return json_response(body)
+
+    async def get(self, request):
+        return json_response(self.lookup(request))
+
+    async def create(self, request):
+        body = await request.json(loads=codec.loads)
+        record_id = self.new_id()
+        self.records[record_id] = self.make_record(record_id, body.get("properties"))
+        return json_response(self.records[record_id], status=201)
+
+    async def update(self, request):
+        record = self.lookup(request)
+        body = await request.json(loads=codec.loads)
+        record["properties"].update(body.get("properties") or {})
+        record["updatedAt"] = _now()
+        return json_response(record)
+
+    async def delete(self, request):
+        self.lookup(request)
+        del self.records[request.match_info["id"]]
+        return web.Response(status=204)
+
+
+class SalesforceEmulator(Emulator):
+    """Salesforce REST API: Account sObjects, with Sforce-Limit-Info usage headers."""
+
+    name = "salesforce"
+    id_prefix = "001"
+    base_path = "/services/data/v61.0/sobjects/Account"
+
+    def __init__(self, config: EmulatorConfig = EmulatorConfig()):
+        from usepolvo.tentacles.salesforce.resources.accounts.schemas import (
+            ObjectDescribe,
+        )
+
+        self.describe = sample(ObjectDescribe)
+        super().__init__(config)
+
+    def rate_limit_headers(self, remaining, reset):
+        used = self.config.rate_limit - max(remaining, 0)
+        return {"Sforce-Limit-Info": f"api-usage={used}/{self.config.rate_limit}"}
+
+    def error(self, status, message):
+        code = "REQUEST_LIMIT_EXCEEDED" if status == 429 else "NOT_FOUND"
+        return json_response([{"errorCode": code, "message": message}], status=status)
+
+    def make_record(self, record_id, data=None):
+        now = _now()
+        record = {
+            "attributes": {"type": "Account", "url": f"{self.base_path}/{record_id}"},
+            "Id": record_id,
+            "Name": f"Account {record_id}",
+            "Industry": "Technology",
+            "AnnualRevenue": 1000000.0,
+            "NumberOfEmployees": 50,
+            "IsDeleted": False,
+            "CreatedDate": now,
+            "LastModifiedDate": now,
+        }
+        record.update(data or {})
+        return record
+
+    def routes(self, router):
+        router.add_get(self.base_path, self.list)
+        router.add_post(self.base_path, self.create)
+        router.add_get(self.base_path + "/{id}", self.get)
+        router.add_patch(self.base_path + "/{id}", self.update)
+        router.add_delete(self.base_path + "/{id}", self.delete)
+
+    async def list(self, request):
+        # Recently viewed accounts; Salesforce does not paginate this listing
+        records, _ = self.page(0, self.config.page_size)
+        recent = [
+            {"attributes": record["attributes"], "Id": record["Id"], "Name": record["Name"]} for record in records
+        ]
+        return json_response({"objectDescribe": self.describe, "recentItems": recent})
+
+    async def get(self, request):
+        return json_response(self.lookup(request))
+
+    async def create(self, request):
+        record_id = self.new_id()
+        self.records[record_id] = self.make_record(record_id, await request.json(loads=codec.loads))
+        return json_response({"id": record_id, "success": True, "errors": []}, status=201)
+
+    async def update(self, request):
+        self.lookup(request).update(await request.json(loads=codec.loads))
+        return web.Response(status=204)
+
+    async def delete(self, request):
+        self.lookup(request)
+        del self.records[request.match_info["id"]]
+        return web.Response(status=204)
+
+
+class LinearEmulator(Emulator):
+    """Linear GraphQL API: issue queries and mutations, paginated with first/after and pageInfo."""
+
+    name = "linear"
+
+    def make_record(self, record_id, data=None):
+        record = {
+            "id": record_id,
+            "title": f"Issue {record_id}",
+            "description": "Emulated issue",
+            "state": {"id": "state-1", "name": "Todo"},
+            "assignee": {"id": "user-1", "name": "Sample User"},
+        }
+        record.update(data or {})
+        return record
+
+    def error(self, status, message):
+        return json_response({"errors": [{"message": message}]}, status=status)
+
+    def routes(self, router):
+        router.add_post("/graphql", self.graphql)
+
+    async def graphql(self, request):
+        body = await request.json(loads=codec.loads)
+        query, variables = body["query"].lstrip(), body.get("variables") or {}
+        if query.startswith("query ListIssues"):
+            ids = list(self.records)
+            after = variables.get("after")
+            offset = ids.index(after) + 1 if after in self.records else 0
+            records, more = self.page(offset, variables.get("first") or 50)
+            end = records[-1]["id"] if records else None
+            data = {"issues": {"nodes": records, "pageInfo": {"hasNextPage": more, "endCursor": end}}}
+        elif query.startswith("query GetIssue"):
+            data = {"issue": self.records.get(variables["id"])}
+        elif query.startswith("mutation CreateIssue"):
+            record_id = self.new_id()
+            self.records[record_id] = self.make_record(record_id, variables.get("input"))
+            data = {"createIssue": self.records[record_id]}
+        elif query.startswith("mutation IssueUpdate"):
+            record = self.records[variables["id"]]
+            record.update(variables.get("input") or {})
+            data = {"issueUpdate": {"issue": {"id": record["id"]}}}
+        elif query.startswith("mutation DeleteIssue"):
+            data = {"deleteIssue": {"success": self.records.pop(variables["id"], None) is not None}}
+        else:
+            return self.error(400, "Unsupported operation")
+        return json_response({"data": data})
+
+
+class LLMEmulator(Emulator):
+    """OpenAI chat completions and Anthropic text completions, answering with a canned reply."""
+
+    name = "llm"
+    reply = "This is an emulated completion."
+
+    def __init__(self, config: EmulatorConfig = EmulatorConfig()):
+        super().__init__(config._replace(records=0))
+
+    def rate_limit_headers(self, remaining, reset):
+        return {
+            "x-ratelimit-limit-requests": str(self.config.rate_limit),
+            "x-ratelimit-remaining-requests": str(max(remaining, 0)),
+            "x-ratelimit-reset-requests": f"{reset:.3f}s",
+        }
+
+    def error(self, status, message):
+        return json_response({"error": {"type": "rate_limit_error", "message": message}}, status=status)
+
+    def routes(self, router):
+        router.add_post("/v1/chat/completions", self.chat_completion)
+        router.add_post("/v1/complete", self.completion)
+
+    async def chat_completion(self, request):
+        body = await request.json(loads=codec.loads)
+        completion_id = self.new_id()
+        return json_response(
+            {
+                "id": f"chatcmpl-{completion_id}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "gpt-4"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.reply},
+                        "finish_reason": "stop",
+                        "logprobs": None,
+                    }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 7, "total_tokens": 17},
+            }
+        )
+
+    async def completion(self, request):
+        body = await request.json(loads=codec.loads)
+        return json_response(
+            {
+                "id": f"compl_{self.new_id()}",
+                "type": "completion",
+                "completion": self.reply,
+                "stop_reason": "stop_sequence",
+                "model": body.get("model", "claude-2.1"),
+            }
+        )
+
+
+EMULATORS = {
+    emulator.name: emulator
+    for emulator in (
+        CertnEmulator,
+        StripeEmulator,
+        HubSpotEmulator,
+        SalesforceEmulator,
+        LinearEmulator,
+        LLMEmulator,
+    )
+}
+
+
+class EmulatorServer:
+    """Serves emulators (and other aiohttp apps, e.g. webhooks) on localhost from a background event loop."""
+
+    def __init__(self, *emulators: Emulator):
+        self.emulators = {emulator.name: emulator for emulator in emulators}
+        self.urls: Dict[str, str] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="usepolvo-emulators", daemon=True)
+        self._runners: List[web.AppRunner] = []
+
+    def __getitem__(self, name: str) -> str:
+        return self.urls[name]
+
+    def __enter__(self) -> "EmulatorServer":
+        self._thread.start()
+        for name, emulator in self.emulators.items():
+            emulator.url = self.mount(name, emulator.app)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._run(self._cleanup())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def mount(self, name: str, app: web.Application) -> str:
+        """Serve an application on a free port; returns its base URL."""
+        self.urls[name] = self._run(self._serve(app))
+        return self.urls[name]
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _serve(self, app: web.Application) -> str:
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        self._runners.append(runner)
+        host, port = runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def _cleanup(self):
+        for runner in self._runners:
+            await runner.cleanup()
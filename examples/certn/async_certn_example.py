@@ -0,0 +1,22 @@
+import asyncio
+
+from usepolvo.tentacles.certn import AsyncCertnClient
+
+
+async def fetch_applications(client, application_ids):
+    # Requests run concurrently over the client's pooled aiohttp session
+    return await asyncio.gather(*(client.applications.get(application_id) for application_id in application_ids))
+
+
+async def main():
+    async with AsyncCertnClient() as client:
+        applications = await client.applications.list(page=1, size=10)
+        for application in applications.results:
+            print(f"Application ID: {application.id}, Status: {application.status}")
+
+        details = await fetch_applications(client, [application.id for application in applications.results])
+        print(f"Fetched {len(details)} applications concurrently")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,386 @@
+# usepolvo/arms/base_async_client.py
+
+import asyncio
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import aiohttp
+
+from usepolvo.arms.base_client import BaseClient
+from usepolvo.arms.cache import CacheEntry
+from usepolvo.arms.circuit_breaker import CircuitBreaker
+from usepolvo.arms.compression import ASYNC_ACCEPT_ENCODING, wire_size
+from usepolvo.arms.deadline import (
+    awithin_deadline,
+    check_deadline,
+    deadline_scope,
+    remaining,
+    timeout_for,
+)
+from usepolvo.arms.retry import is_idempotent
+from usepolvo.arms.single_flight import AsyncSingleFlight
+from usepolvo.beak.exceptions import APIError
+from usepolvo.ink import codec
+from usepolvo.ink.json_stream import aiter_json_array
+
+
+class AsyncSessionPool:
+    """
+    Pooled keep-alive aiohttp session for asyncio clients.
+
+    The underlying aiohttp.ClientSession is created lazily so it is always bound
+    to the running event loop, and is recreated if it was closed.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: Optional[float] = 30.0,
+    ):
+        """
+        Initialize the async session pool.
+
+        Args:
+            pool_connections: Number of hosts expected to be used concurrently
+            pool_maxsize: Maximum number of connections kept alive per host
+            keep_alive: Whether to reuse connections between requests
+            timeout: Default total timeout in seconds for requests that do not set one
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def from_settings(cls, settings) -> "AsyncSessionPool":
+        """Build an async session pool from PolvoSettings."""
+        return cls(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            keep_alive=settings.HTTP_KEEP_ALIVE,
+            timeout=settings.HTTP_TIMEOUT,
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use inside the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_connections * self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Send a request through the pooled connections.
+
+        Accepts requests-style keyword arguments; a numeric ``timeout`` is converted to aiohttp.ClientTimeout.
+        Timeouts are shortened so the request never outlives the current deadline.
+        Returns an aiohttp request context manager.
+        """
+        timeout = timeout_for(kwargs.pop("timeout", self.timeout))
+        if isinstance(timeout, (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        elif isinstance(timeout, tuple):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=remaining(), sock_connect=timeout[0], sock_read=timeout[1])
+        return self.session.request(method, url, **kwargs)
+
+    async def close(self):
+        """Close the pooled session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class AsyncBaseClient(BaseClient):
+    """
+    Base client for asyncio API integrations.
+
+    Shares authentication, URL building, caching and error mapping with BaseClient,
+    but sends requests through a pooled aiohttp session and waits on rate limits with
+    asyncio.sleep. Token refreshes and the SQLite and Redis cache backends are still
+    synchronous calls made on the event loop; prefer the in-memory cache for asyncio clients.
+    """
+
+    def __init__(self):
+        """Initialize the async client with settings, cache and connection pools."""
+        super().__init__()
+        self.async_http = AsyncSessionPool.from_settings(self.settings)
+        # aiohttp decodes fewer encodings than urllib3
+        self.accept_encoding = ASYNC_ACCEPT_ENCODING
+        self.async_single_flight = AsyncSingleFlight()
+        self.retrier.policy.transient_errors += (aiohttp.ClientConnectionError,)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        use_cache: bool = True,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+        stream_path: Sequence[str] = (),
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> Union[Dict[str, Any], AsyncIterator[Any]]:
+        """
+        Make an authenticated, rate-limited HTTP request without blocking the event loop.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            client_id: OAuth2 client ID (if using OAuth)
+            client_secret: OAuth2 client secret (if using OAuth)
+            use_cache: Whether to use request caching
+            idempotent: Whether the request is safe to retry after 5xx/transport failures
+                (defaults to the method's semantics, or True if an Idempotency-Key header is sent)
+            stream: Yield the items of a JSON array in the response as they arrive instead of
+                decoding the whole body; streamed responses are never cached
+            stream_path: Object keys leading to the array when streaming (e.g. ("records",))
+            deadline: Seconds the whole call (auth, rate-limit waits, retries, reading a streamed body)
+                may take; see deadline_scope
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data, or an async iterator over the array items when streaming
+
+        Raises:
+            APIError: If the request fails
+            AuthenticationError: If authentication fails
+            DeadlineExceededError: If the deadline passes before the call completes
+        """
+        if not self.base_url:
+            raise ValueError("base_url must be set by the child class")
+
+        with deadline_scope(deadline):
+            check_deadline()
+
+            url = self._build_url(endpoint)
+            kwargs["headers"] = self._build_headers(client_id, client_secret, kwargs.pop("headers", None))
+            self._compress_body(method, kwargs)
+
+            if stream:
+                return await self._stream(method, url, stream_path, idempotent=idempotent, **kwargs)
+
+            # Check cache for GET requests
+            cache_key = self._get_cache_key(method, url, use_cache, kwargs)
+            if not cache_key:
+                try:
+                    return await self._send(method, url, idempotent=idempotent, **kwargs)
+                finally:
+                    # Evict cached reads a write may have changed, even if it failed after reaching the server
+                    self._invalidate_written(method, url)
+
+            entry = self._cache_get(cache_key)
+            if entry is not None:
+                self._emit("on_cache_hit", method=method, url=url)
+                return entry.value
+            self._emit("on_cache_miss", method=method, url=url)
+
+            # Concurrent identical GETs share a single upstream request and rate-limit slot
+            if self.request_coalescing:
+                return await self.async_single_flight.do(
+                    cache_key, self._send, method, url, cache_key=cache_key, idempotent=idempotent, **kwargs
+                )
+            return await self._send(method, url, cache_key=cache_key, idempotent=idempotent, **kwargs)
+
+    async def _send(
+        self, method: str, url: str, cache_key: Optional[str] = None, idempotent: Optional[bool] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a request through the rate limiter and pooled aiohttp session.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            cache_key: Cache key to store a successful response under, if cacheable
+            idempotent: Whether the request is safe to retry (defaults to is_idempotent)
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+        """
+        stale = None
+        if cache_key:
+            # Another caller may have filled the cache while this one was waiting to lead
+            entry = self._cache_get(cache_key, allow_stale=True)
+            if entry is not None and entry.is_fresh():
+                return entry.value
+            if entry is not None and entry.revalidatable:
+                # Expired but has validators: ask the server whether it changed
+                stale = entry
+                kwargs["headers"] = {**kwargs.get("headers", {}), **entry.conditional_headers()}
+
+        # Retry 429s, and 5xx/transport failures of idempotent requests, with backoff
+        return await self.retrier.async_call(
+            partial(self._attempt, method, url, cache_key, stale, **kwargs),
+            method,
+            idempotent=is_idempotent(method, kwargs.get("headers")) if idempotent is None else idempotent,
+            on_retry=self._retry_hook(method, url),
+        )
+
+    async def _attempt(
+        self, method: str, url: str, cache_key: Optional[str], stale: Optional[CacheEntry], **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make one attempt at a request, waiting on the rate limiter first.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            cache_key: Cache key to store a successful response under, if cacheable
+            stale: Expired cache entry being revalidated, if any
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+        """
+        breaker = self._circuit_breaker(url)
+        await self._wait_for_rate_limit()
+        self._emit("on_request", method=method, url=url)
+        start = time.monotonic()
+
+        with self._circuit_guard(breaker):
+            try:
+                status, headers, body = await self._fetch(method, url, breaker, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._emit_response(method, url, start, None, None, kwargs, e)
+                # A timeout shortened to fit the deadline means the deadline ran out, not the API
+                check_deadline()
+                raise APIError(f"Request failed: {str(e)}") from e
+            self._emit_response(method, url, start, status, len(body), kwargs)
+            if status >= 400 and not (stale is not None and status == 304):
+                raise self._error_for_status(status, body.decode("utf-8", errors="replace"), headers)
+
+        if stale is not None and status == 304:
+            return self._cache_revalidated(cache_key, url, stale, headers)
+        # Like aiohttp's response.json(), an empty body decodes to None
+        data = codec.loads(body) if body.strip() else None
+        self.compression_stats.record_response(headers, len(body), wire_size(headers))
+
+        # Cache successful GET responses
+        if cache_key:
+            self._cache_response(cache_key, url, data, len(body), headers)
+
+        return data
+
+    async def _fetch(
+        self, method: str, url: str, breaker: Optional[CircuitBreaker] = None, **kwargs
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send one copy of a request and read its body, hedging GETs when enabled."""
+        send = partial(self._read, method, url, **kwargs)
+        if self.hedger is not None and method == "GET":
+            return await self.hedger.async_call(
+                send, hedge_func=partial(self._send_hedge, send, breaker), admit=partial(self._admit_hedge, breaker)
+            )
+        return await send()
+
+    async def _send_hedge(self, send, breaker: Optional[CircuitBreaker]) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a hedge copy, recording its outcome on the host's breaker like the first copy's."""
+        result = None
+        try:
+            with self._circuit_guard(breaker):
+                result = await send()
+                status, headers, body = result
+                if status >= 500:
+                    raise self._error_for_status(status, body.decode("utf-8", errors="replace"), headers)
+        except APIError:
+            if result is None:
+                raise
+        return result
+
+    async def _read(self, method: str, url: str, **kwargs) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a request and read the whole response."""
+        async with self.async_http.request(method, url, **kwargs) as response:
+            return response.status, response.headers, await response.read()
+
+    async def _stream(
+        self, method: str, url: str, path: Sequence[str], idempotent: Optional[bool] = None, **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        Send a request and stream the items of a JSON array from its body.
+
+        The response status is checked (and retried) before returning, so errors are raised
+        here rather than on first iteration.
+        """
+        response = await self.retrier.async_call(
+            partial(self._open_stream, method, url, **kwargs),
+            method,
+            idempotent=is_idempotent(method, kwargs.get("headers")) if idempotent is None else idempotent,
+            on_retry=self._retry_hook(method, url),
+        )
+        # The body is read after this returns, outside the caller's deadline scope: keep it bounded
+        chunks = awithin_deadline(response.content.iter_chunked(self.stream_chunk_size))
+        return self._iter_stream(response, chunks, path)
+
+    async def _open_stream(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """Make one attempt at opening a streamed response, waiting on the rate limiter first."""
+        breaker = self._circuit_breaker(url)
+        await self._wait_for_rate_limit()
+        self._emit("on_request", method=method, url=url)
+        start = time.monotonic()
+        with self._circuit_guard(breaker):
+            try:
+                response = await self.async_http.request(method, url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._emit_response(method, url, start, None, None, kwargs, e)
+                check_deadline()
+                raise APIError(f"Request failed: {str(e)}") from e
+            # Time to headers; the body size is not known until it has been streamed
+            self._emit_response(method, url, start, response.status, None, kwargs)
+            if response.status >= 400:
+                try:
+                    raise self._error_for_status(response.status, await response.text(), response.headers)
+                finally:
+                    response.release()
+            return response
+
+    async def _iter_stream(
+        self, response: aiohttp.ClientResponse, chunks: AsyncIterator[bytes], path: Sequence[str]
+    ) -> AsyncIterator[Any]:
+        """Yield array items from the body chunks of a streamed response, releasing it when done."""
+        try:
+            async for item in aiter_json_array(chunks, path):
+                yield item
+        except aiohttp.ClientError as e:
+            raise APIError(f"Request failed: {str(e)}") from e
+        finally:
+            response.release()
+
+    async def _wait_for_rate_limit(self):
+        """Wait on the client's rate limiter, if it has one, without blocking the event loop."""
+        rate_limiter = getattr(self, "rate_limiter", None)
+        if rate_limiter is not None:
+            start = time.monotonic()
+            acquire = getattr(rate_limiter, "async_acquire", None) or rate_limiter.async_wait_if_needed
+            await acquire()
+            self._emit("on_rate_limit_wait", seconds=time.monotonic() - start)
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get request coalescing statistics.
+
+        Returns:
+            Counts of GETs sent upstream ("executed"), GETs that shared an in-flight
+            request ("coalesced"), and requests currently in flight ("in_flight")
+        """
+        return self.async_single_flight.stats()
+
+    async def close(self):
+        """Close all pooled connections held by this client."""
+        await self.async_http.close()
+        super().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,30 @@
+from abc import ABC
+from typing import Any, Dict, Optional
+
+from usepolvo.arms.base_async_client import AsyncBaseClient
+from usepolvo.arms.graphql_builder import GraphQLQueryBuilder
+from usepolvo.beak.exceptions import APIError
+
+
+class AsyncBaseGraphQLClient(GraphQLQueryBuilder, AsyncBaseClient, ABC):
+    """Base client for GraphQL-based API integrations on asyncio."""
+
+    async def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query over the pooled aiohttp session.
+
+        :param query: The GraphQL query string
+        :param variables: Optional variables for the query
+        :return: The query result
+        :raises APIError: If the response contains GraphQL errors
+        """
+        response = await super()._request(
+            "POST",
+            self.base_url,
+            use_cache=False,
+            idempotent=not self._is_mutation(query),
+            json={"query": query, "variables": variables or {}},
+        )
+        if response.get("errors"):
+            raise APIError(f"GraphQL request failed: {response['errors']}")
+        return response.get("data")
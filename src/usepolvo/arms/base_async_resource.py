@@ -0,0 +1,244 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from usepolvo.arms.bulk import BulkResult, arun_bulk
+from usepolvo.arms.pagination import (
+    PageRequest,
+    PageResult,
+    Paginator,
+    afan_out,
+    aiter_pages,
+)
+from usepolvo.ink.transformations import snake_to_camel
+
+Model = TypeVar("Model")
+
+
+class AsyncBaseResource(ABC):
+    """Base class for resources served by an AsyncBaseClient. All operations are awaitable."""
+
+    # Describe the list endpoint to enable pages() and iter_all()
+    list_path: Optional[str] = None  # List endpoint, defaults to base_path
+    records_key: Optional[str] = None  # Response key holding the records, None if the response is the list
+    next_key: str = "next"  # Response key holding the next cursor or link (PaginationMethod.CURSOR)
+    count_key: Optional[str] = None  # Response key holding the total record count, enables parallel scan()
+    record_schema: Optional[Type] = None  # Schema each record is validated against
+
+    def __init__(self, client):
+        self.client = client
+
+    @abstractmethod
+    async def list(self, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Retrieve a list of resources.
+
+        :param kwargs: Additional parameters for the list operation
+        :return: A list of resource objects
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, resource_id: str) -> Dict[str, Any]:
+        """
+        Retrieve a single resource by ID.
+
+        :param resource_id: The ID of the resource to retrieve
+        :return: The resource object
+        :raises ResourceNotFoundError: If the resource is not found
+        """
+        pass
+
+    @abstractmethod
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new resource.
+
+        :param data: The data for the new resource
+        :return: The created resource object
+        :raises ValidationError: If the data is invalid
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing resource.
+
+        :param resource_id: The ID of the resource to update
+        :param data: The updated data for the resource
+        :return: The updated resource object
+        :raises ResourceNotFoundError: If the resource is not found
+        :raises ValidationError: If the data is invalid
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, resource_id: str) -> None:
+        """
+        Delete a resource.
+
+        :param resource_id: The ID of the resource to delete
+        :raises ResourceNotFoundError: If the resource is not found
+        """
+        pass
+
+    async def bulk_get(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """
+        Retrieve many resources concurrently.
+
+        :param resource_ids: The IDs of the resources to retrieve
+        :param workers: Requests awaited concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The resource or error of every ID, in input order
+        """
+        return await arun_bulk(self.get, resource_ids, workers or self.client.bulk_workers)
+
+    async def bulk_create(self, items: Iterable[Dict[str, Any]], workers: Optional[int] = None) -> BulkResult:
+        """
+        Create many resources concurrently; a failed item does not stop the others.
+
+        :param items: The data for each new resource
+        :param workers: Requests awaited concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The created resource or error of every item, in input order
+        """
+        return await arun_bulk(self.create, items, workers or self.client.bulk_workers)
+
+    async def bulk_update(
+        self, updates: Iterable[Tuple[str, Dict[str, Any]]], workers: Optional[int] = None
+    ) -> BulkResult:
+        """
+        Update many resources concurrently; a failed item does not stop the others.
+
+        :param updates: (resource ID, updated data) pairs
+        :param workers: Requests awaited concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The updated resource or error of every pair, in input order
+        """
+        return await arun_bulk(lambda update: self.update(*update), updates, workers or self.client.bulk_workers)
+
+    async def bulk_delete(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """
+        Delete many resources concurrently; a failed item does not stop the others.
+
+        :param resource_ids: The IDs of the resources to delete
+        :param workers: Requests awaited concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The outcome of every ID, in input order
+        """
+        return await arun_bulk(self.delete, resource_ids, workers or self.client.bulk_workers)
+
+    def _prepare_request_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Prepare data for a request by converting snake_case keys to camelCase.
+
+        :param data: The input data with snake_case keys
+        :return: The prepared data with camelCase keys
+        """
+        return {snake_to_camel(k): v for k, v in data.items()}
+
+    async def _stream_records(
+        self, endpoint: str, stream_path: Sequence[str], schema: Type[Model], **kwargs
+    ) -> AsyncIterator[Model]:
+        """
+        Stream the records of a list endpoint, validating each one as it arrives.
+
+        :param endpoint: The API endpoint
+        :param stream_path: Object keys leading to the records array in the response
+        :param schema: Schema each record is validated against
+        :param kwargs: Additional arguments for the request
+        :return: An async iterator over validated records
+        """
+        records = await self.client._request("GET", endpoint, stream=True, stream_path=stream_path, **kwargs)
+        async for record in records:
+            yield schema(**record)
+
+    def pages(self, size: Optional[int] = None, prefetch: Optional[bool] = None, **params) -> AsyncIterator[List[Any]]:
+        """
+        Iterate over every page of the list endpoint, following the client's pagination method.
+
+        The next page is fetched in a task while the current one is consumed, and at most
+        two pages are held at once.
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param prefetch: Fetch the next page in the background, defaults to POLVO_PAGINATION_PREFETCH
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An async iterator over the records of each page
+        """
+        paginator = self._paginator(size, params)
+        fetch = partial(self._fetch_page, paginator)
+        return aiter_pages(fetch, self.client.pagination_prefetch if prefetch is None else prefetch)
+
+    async def iter_all(
+        self, size: Optional[int] = None, prefetch: Optional[bool] = None, **params
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every record of the list endpoint, page by page.
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param prefetch: Fetch the next page in the background, defaults to POLVO_PAGINATION_PREFETCH
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An async iterator over the records
+        """
+        async for page in self.pages(size, prefetch, **params):
+            for record in page:
+                yield record
+
+    async def scan(
+        self, size: Optional[int] = None, workers: Optional[int] = None, ordered: bool = True, **params
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every record of the list endpoint, fetching pages concurrently.
+
+        See BaseResource.scan; pages are fetched in concurrent tasks that share the client's rate limiter.
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param workers: Pages fetched concurrently, defaults to POLVO_PAGINATION_FAN_OUT
+        :param ordered: Yield records in page order; otherwise yield each page as soon as it arrives
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An async iterator over the records
+        """
+        paginator = self._paginator(size, params)
+        fetch = partial(self._fetch_page, paginator)
+        first = PageRequest()
+        endpoint, query = paginator.request(first)
+        response = await self.client._request("GET", endpoint, params=query)
+        records, next_page = paginator.parse(first, response)
+        for record in records:
+            yield record
+        if next_page is None:
+            return
+
+        total = paginator.total_pages(response)
+        if total is None:
+            pages = aiter_pages(fetch, self.client.pagination_prefetch, start=next_page)
+        else:
+            remaining = (PageRequest(page) for page in range(next_page.page, total + 1))
+            pages = afan_out(fetch, remaining, workers or self.client.pagination_fan_out, ordered)
+        async for page in pages:
+            for record in page:
+                yield record
+
+    def _paginator(self, size: Optional[int], params: Dict[str, Any]) -> Paginator:
+        return Paginator(
+            self.client,
+            self.list_path or getattr(self, "base_path", ""),
+            size or self.client.default_page_size,
+            params,
+            records_key=self.records_key,
+            next_key=self.next_key,
+            count_key=self.count_key,
+            schema=self.record_schema,
+        )
+
+    async def _fetch_page(self, paginator: Paginator, page: PageRequest) -> PageResult:
+        endpoint, query = paginator.request(page)
+        return paginator.parse(page, await self.client._request("GET", endpoint, params=query))
@@ -20,6 +20,18 @@ class BaseAuth:
         self.refresh_token: Optional[str] = None
         self.token_expiry: float = 0
 
+        # Connection pool shared with the owning client (bound by BaseClient)
+        self.session = None
+
+    @property
+    def http(self):
+        """
+        Get the HTTP interface used for token requests.
+
+        Returns the owning client's SessionPool when bound, otherwise the requests module.
+        """
+        return self.session if self.session is not None else requests
+
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Get authentication headers for API requests.
@@ -47,7 +59,7 @@ class BaseAuth:
         Raises:
             AuthenticationError: If the token request fails.
         """
-        response = requests.post(token_url, data=token_data)
+        response = self.http.post(token_url, data=token_data)
         if response.status_code != 200:
             raise AuthenticationError(f"Token request failed: {response.text}")
         token_response = response.json()
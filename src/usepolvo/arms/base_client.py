@@ -1,11 +1,66 @@
-from typing import Any, Dict, Optional
+import logging
+import time
+from contextlib import nullcontext
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+from urllib.parse import urlsplit
 
 import requests
-from cachetools import TTLCache
 
 from usepolvo.arms.base_auth import BaseAuth
+from usepolvo.arms.cache import (
+    SAFE_METHODS,
+    CacheEntry,
+    CachePolicy,
+    CachePolicyTable,
+    build_cache_key,
+    cache_tag,
+    invalidation_tags,
+)
+from usepolvo.arms.cache_backends import create_cache_backend
+from usepolvo.arms.circuit_breaker import (
+    CLOSED,
+    CircuitBreaker,
+    circuit_breakers,
+    is_failure,
+)
+from usepolvo.arms.compression import (
+    SYNC_ACCEPT_ENCODING,
+    CompressionStats,
+    compress,
+    wire_size,
+)
+from usepolvo.arms.deadline import check_deadline, deadline_scope, within_deadline
+from usepolvo.arms.hedging import Hedger
+from usepolvo.arms.hooks import Hooks, body_size
+from usepolvo.arms.metrics import MetricsCollector, metrics, tentacle_name
+from usepolvo.arms.retry import Retrier, is_idempotent, parse_retry_after
+from usepolvo.arms.session_pool import SessionPool
+from usepolvo.arms.single_flight import SingleFlight
 from usepolvo.beak.config import get_settings
-from usepolvo.beak.exceptions import APIError, AuthenticationError
+from usepolvo.beak.enums import PaginationMethod
+from usepolvo.beak.exceptions import (
+    APIError,
+    AuthenticationError,
+    DeadlineExceededError,
+    PolvoError,
+    RateLimitError,
+)
+from usepolvo.ink import codec
+from usepolvo.ink.json_stream import iter_json_array
+from usepolvo.mantle.logger import RequestLogger, configure_logging, get_logger
+
+logger = get_logger(__name__)
 
 
 class BaseClient:
@@ -15,16 +70,91 @@ class BaseClient:
     """
 
     def __init__(self):
-        """Initialize the base client with settings and cache."""
+        """Initialize the base client with settings, cache and connection pool."""
         self.settings = get_settings()
-        self.cache = TTLCache(maxsize=self.settings.CACHE_SIZE, ttl=self.settings.CACHE_TTL)
+        # Backend selected by POLVO_CACHE_BACKEND; sqlite/redis share one warm cache between worker processes
+        self.cache = create_cache_backend(self.settings)
+        self.cache_stale_ttl = self.settings.CACHE_STALE_TTL
         self.pagination_method = self.settings.PAGINATION_METHOD
+        self.default_page_size = self.settings.DEFAULT_PAGE_SIZE
+        self.pagination_prefetch = self.settings.PAGINATION_PREFETCH
+        self.pagination_fan_out = self.settings.PAGINATION_FAN_OUT
+        self.bulk_workers = self.settings.BULK_WORKERS
+
+        # Keep-alive connections shared by every request made by this client and its auth
+        self.http = SessionPool.from_settings(self.settings)
+        self.prewarm_connections = self.settings.HTTP_PREWARM
+        self.stream_chunk_size = self.settings.STREAM_CHUNK_SIZE
+
+        # Ask for compressed responses; tentacles whose API accepts compressed bodies set request_compression
+        self.accept_encoding = SYNC_ACCEPT_ENCODING
+        self.request_compression: Optional[str] = None
+        self.compression_min_size = self.settings.HTTP_COMPRESSION_MIN_SIZE
+        self.compression_stats = CompressionStats()
+
+        # Per-endpoint cache rules; tentacles register patterns for slow-changing or volatile endpoints
+        self.cache_policies = CachePolicyTable(
+            CachePolicy(ttl=self.settings.CACHE_TTL, max_entry_size=self.settings.CACHE_MAX_ENTRY_SIZE)
+        )
+
+        # Retries with full-jitter backoff, Retry-After support and a budget shared by all requests
+        self.retrier = Retrier.from_settings(self.settings)
+
+        # Fail fast while a host is unhealthy; breakers are shared by every client of the same host
+        self.circuit_breakers = circuit_breakers if self.settings.CIRCUIT_BREAKER else None
+        self.circuit_breaker_config = {
+            "failure_rate": self.settings.CIRCUIT_FAILURE_RATE,
+            "slow_call_duration": self.settings.CIRCUIT_SLOW_CALL_DURATION,
+            "slow_call_rate": self.settings.CIRCUIT_SLOW_CALL_RATE,
+            "min_calls": self.settings.CIRCUIT_MIN_CALLS,
+            "window": self.settings.CIRCUIT_WINDOW,
+            "open_duration": self.settings.CIRCUIT_OPEN_DURATION,
+            "half_open_calls": self.settings.CIRCUIT_HALF_OPEN_CALLS,
+        }
+
+        # Send a second copy of GETs slower than the observed p95 to cut tail latency
+        self.hedger = None
+        if self.settings.HEDGE_REQUESTS:
+            self.hedger = Hedger(
+                quantile=self.settings.HEDGE_QUANTILE,
+                min_samples=self.settings.HEDGE_MIN_SAMPLES,
+                max_workers=self.settings.HTTP_POOL_MAXSIZE,
+            )
+
+        # Deduplicate concurrent identical GETs so a burst of cache misses costs one request
+        self.request_coalescing = self.settings.REQUEST_COALESCING
+        self.single_flight = SingleFlight()
+
+        # Request lifecycle hooks; POLVO_METRICS feeds the shared metrics collector
+        self.hooks = Hooks()
+        self.metrics: Optional[MetricsCollector] = None
+        if self.settings.METRICS:
+            self.enable_metrics(metrics)
+
+        # Log sinks are set up on first use, never at import; per-request logging only costs anything at DEBUG
+        configure_logging(self.settings)
+        if get_logger("requests").isEnabledFor(logging.DEBUG):
+            self.hooks.subscribe(RequestLogger(self.settings.LOG_REQUEST_SAMPLE_RATE))
 
         # Only set these if they haven’t already been defined by a child class
         if not hasattr(self, "base_url"):
             self.base_url: Optional[str] = None
         if not hasattr(self, "auth"):
             self.auth: Optional[BaseAuth] = None  # type: ignore
+        elif self.auth is not None:
+            # Auth was created before the pool existed; bind it now
+            self.auth.session = self.http
+
+    @property
+    def auth(self) -> Optional[BaseAuth]:
+        return self._auth
+
+    @auth.setter
+    def auth(self, auth: Optional[BaseAuth]):
+        """Set the auth handler and let it share this client's connection pool."""
+        self._auth = auth
+        if auth is not None and getattr(self, "http", None) is not None:
+            auth.session = self.http
 
     def _request(
         self,
@@ -33,8 +163,12 @@ class BaseClient:
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         use_cache: bool = True,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+        stream_path: Sequence[str] = (),
+        deadline: Optional[float] = None,
         **kwargs,
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Iterator[Any]]:
         """
         Make an authenticated HTTP request.
 
@@ -44,65 +178,518 @@ class BaseClient:
             client_id: OAuth2 client ID (if using OAuth)
             client_secret: OAuth2 client secret (if using OAuth)
             use_cache: Whether to use request caching
+            idempotent: Whether the request is safe to retry after 5xx/transport failures
+                (defaults to the method's semantics, or True if an Idempotency-Key header is sent)
+            stream: Yield the items of a JSON array in the response as they arrive instead of
+                decoding the whole body; streamed responses are never cached
+            stream_path: Object keys leading to the array when streaming (e.g. ("records",))
+            deadline: Seconds the whole call (auth, rate-limit waits, retries, reading a streamed body)
+                may take; see deadline_scope
             **kwargs: Additional request parameters
 
         Returns:
-            API response data
+            API response data, or an iterator over the array items when streaming
 
         Raises:
             APIError: If the request fails
             AuthenticationError: If authentication fails
+            DeadlineExceededError: If the deadline passes before the call completes
         """
         if not self.base_url:
             raise ValueError("base_url must be set by the child class")
 
-        # Check cache for GET requests
-        cache_key = None
-        if method == "GET" and use_cache:
-            cache_key = f"{method}:{endpoint}:{str(kwargs)}"
-            if cache_key in self.cache:
-                return self.cache[cache_key]
+        with deadline_scope(deadline):
+            check_deadline()
+
+            url = self._build_url(endpoint)
+            kwargs["headers"] = self._build_headers(client_id, client_secret, kwargs.pop("headers", None))
+            self._compress_body(method, kwargs)
+
+            if stream:
+                return self._stream(method, url, stream_path, idempotent=idempotent, **kwargs)
+
+            # Check cache for GET requests
+            cache_key = self._get_cache_key(method, url, use_cache, kwargs)
+            if not cache_key:
+                try:
+                    return self._send(method, url, idempotent=idempotent, **kwargs)
+                finally:
+                    # Evict cached reads a write may have changed, even if it failed after reaching the server
+                    self._invalidate_written(method, url)
+
+            entry = self._cache_get(cache_key)
+            if entry is not None:
+                self._emit("on_cache_hit", method=method, url=url)
+                return entry.value
+            self._emit("on_cache_miss", method=method, url=url)
+
+            # Concurrent identical GETs share a single upstream request and rate-limit slot
+            if self.request_coalescing:
+                return self.single_flight.do(
+                    cache_key, self._send, method, url, cache_key=cache_key, idempotent=idempotent, **kwargs
+                )
+            return self._send(method, url, cache_key=cache_key, idempotent=idempotent, **kwargs)
+
+    def _send(
+        self, method: str, url: str, cache_key: Optional[str] = None, idempotent: Optional[bool] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a request through the rate limiter and connection pool.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            cache_key: Cache key to store a successful response under, if cacheable
+            idempotent: Whether the request is safe to retry (defaults to is_idempotent)
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+        """
+        stale = None
+        if cache_key:
+            # Another caller may have filled the cache while this one was waiting to lead
+            entry = self._cache_get(cache_key, allow_stale=True)
+            if entry is not None and entry.is_fresh():
+                return entry.value
+            if entry is not None and entry.revalidatable:
+                # Expired but has validators: ask the server whether it changed
+                stale = entry
+                kwargs["headers"] = {**kwargs.get("headers", {}), **entry.conditional_headers()}
+
+        # Retry 429s, and 5xx/transport failures of idempotent requests, with backoff
+        return self.retrier.call(
+            partial(self._attempt, method, url, cache_key, stale, **kwargs),
+            method,
+            idempotent=is_idempotent(method, kwargs.get("headers")) if idempotent is None else idempotent,
+            on_retry=self._retry_hook(method, url),
+        )
+
+    def _attempt(
+        self, method: str, url: str, cache_key: Optional[str], stale: Optional[CacheEntry], **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make one attempt at a request, waiting on the rate limiter first.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            cache_key: Cache key to store a successful response under, if cacheable
+            stale: Expired cache entry being revalidated, if any
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+        """
+        breaker = self._circuit_breaker(url)
+        self._wait_for_rate_limit()
+        self._emit("on_request", method=method, url=url)
+        start = time.monotonic()
+
+        with self._circuit_guard(breaker):
+            try:
+                response = self._fetch(method, url, breaker, **kwargs)
+                self._emit_response(method, url, start, response.status_code, len(response.content), kwargs)
+                if stale is not None and response.status_code == 304:
+                    return self._cache_revalidated(cache_key, url, stale, response.headers)
+                response.raise_for_status()
+                data = codec.loads(response.content) if response.content.strip() else None
+                self.compression_stats.record_response(
+                    response.headers, len(response.content), wire_size(response.headers, response.raw)
+                )
+
+                # Cache successful GET responses
+                if cache_key:
+                    self._cache_response(cache_key, url, data, len(response.content), response.headers)
+
+                return data
+
+            except requests.exceptions.HTTPError as e:
+                raise self._error_for_status(e.response.status_code, e.response.text, e.response.headers)
+
+            except requests.exceptions.RequestException as e:
+                self._emit_response(method, url, start, None, None, kwargs, e)
+                # A timeout shortened to fit the deadline means the deadline ran out, not the API
+                check_deadline()
+                raise APIError(f"Request failed: {str(e)}") from e
+
+            except ValueError as e:
+                raise APIError(f"Invalid JSON response: {str(e)}") from e
+
+            except DeadlineExceededError:
+                raise
+
+            except Exception as e:
+                self.handle_error(e)
+                raise
+
+    def _compress_body(self, method: str, kwargs: Dict[str, Any]):
+        """Replace a large JSON body of a write with its compressed encoding, if the tentacle enables it."""
+        if not self.request_compression or method in SAFE_METHODS or kwargs.get("json") is None:
+            return
+        body = codec.dumps(kwargs["json"])
+        if len(body) < self.compression_min_size:
+            return
+        compressed = compress(body, self.request_compression)
+        del kwargs["json"]
+        kwargs["data"] = compressed
+        kwargs["headers"]["Content-Encoding"] = self.request_compression
+        self.compression_stats.record_request(len(body), len(compressed))
+
+    def _fetch(self, method: str, url: str, breaker: Optional[CircuitBreaker] = None, **kwargs) -> requests.Response:
+        """Send one copy of a request, hedging GETs when enabled."""
+        send = partial(self.http.request, method, url, **kwargs)
+        if self.hedger is not None and method == "GET":
+            return self.hedger.call(
+                send, hedge_func=partial(self._send_hedge, send, breaker), admit=partial(self._admit_hedge, breaker)
+            )
+        return send()
+
+    def _admit_hedge(self, breaker: Optional[CircuitBreaker]) -> bool:
+        """
+        Decide whether a hedge copy may be sent, taking a rate-limit slot for it.
+
+        A hedge is a request like any other to the API's quota, so it is only sent while the
+        host's circuit is closed and the rate limiter has a slot free right now. Limiters
+        without try_acquire cannot give a slot without waiting, so they never admit hedges.
+        """
+        if breaker is not None and breaker.state != CLOSED:
+            return False
+        rate_limiter = getattr(self, "rate_limiter", None)
+        if rate_limiter is None:
+            return True
+        try_acquire = getattr(rate_limiter, "try_acquire", None)
+        return try_acquire is not None and try_acquire()
+
+    def _send_hedge(
+        self, send: Callable[[], requests.Response], breaker: Optional[CircuitBreaker]
+    ) -> requests.Response:
+        """Send a hedge copy, recording its outcome on the host's breaker like the first copy's."""
+        response = None
+        try:
+            with self._circuit_guard(breaker):
+                response = send()
+                if response.status_code >= 500:
+                    raise self._error_for_status(response.status_code, response.text, response.headers)
+        except APIError:
+            if response is None:
+                raise
+        return response
+
+    def _stream(
+        self, method: str, url: str, path: Sequence[str], idempotent: Optional[bool] = None, **kwargs
+    ) -> Iterator[Any]:
+        """
+        Send a request and stream the items of a JSON array from its body.
+
+        The response status is checked (and retried) before returning, so errors are raised
+        here rather than on first iteration.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            path: Object keys leading to the array
+            idempotent: Whether the request is safe to retry (defaults to is_idempotent)
+            **kwargs: Additional request parameters
+
+        Returns:
+            An iterator over the decoded array items
+        """
+        response = self.retrier.call(
+            partial(self._open_stream, method, url, **kwargs),
+            method,
+            idempotent=is_idempotent(method, kwargs.get("headers")) if idempotent is None else idempotent,
+            on_retry=self._retry_hook(method, url),
+        )
+        # The body is read after this returns, outside the caller's deadline scope: keep it bounded
+        chunks = within_deadline(response.iter_content(chunk_size=self.stream_chunk_size))
+        return self._iter_stream(response, chunks, path)
+
+    def _open_stream(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Make one attempt at opening a streamed response, waiting on the rate limiter first."""
+        breaker = self._circuit_breaker(url)
+        self._wait_for_rate_limit()
+        self._emit("on_request", method=method, url=url)
+        start = time.monotonic()
+        with self._circuit_guard(breaker):
+            try:
+                response = self.http.request(method, url, stream=True, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self._emit_response(method, url, start, None, None, kwargs, e)
+                check_deadline()
+                raise APIError(f"Request failed: {str(e)}") from e
+            # Time to headers; the body size is not known until it has been streamed
+            self._emit_response(method, url, start, response.status_code, None, kwargs)
+            if response.status_code >= 400:
+                with response:
+                    raise self._error_for_status(response.status_code, response.text, response.headers)
+            return response
+
+    def _iter_stream(self, response: requests.Response, chunks: Iterator[bytes], path: Sequence[str]) -> Iterator[Any]:
+        """Yield array items from the body chunks of a streamed response, closing it when done."""
+        with response:
+            try:
+                yield from iter_json_array(chunks, path)
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Request failed: {str(e)}") from e
+
+    def _circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """
+        Get the circuit breaker of a URL's host, failing fast if its circuit is open.
+
+        Called before the rate-limiter wait so calls that are doomed anyway do not spend rate-limit budget.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            The host's breaker, or None if circuit breaking is disabled
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open
+        """
+        if self.circuit_breakers is None:
+            return None
+        breaker = self.circuit_breakers.get(urlsplit(url).netloc.lower(), **self.circuit_breaker_config)
+        breaker.check()
+        return breaker
+
+    def _circuit_guard(self, breaker: Optional[CircuitBreaker]) -> ContextManager:
+        """Record the outcome and latency of the call made inside the block on the host's breaker."""
+        if breaker is None:
+            return nullcontext()
+        return breaker.guard(partial(is_failure, transient_errors=self.retrier.policy.transient_errors))
+
+    def _wait_for_rate_limit(self):
+        """
+        Wait on the client's rate limiter, if it has one, before a request goes out.
+
+        Duck-typed limiters with only `wait_if_needed` are still supported.
+        """
+        rate_limiter = getattr(self, "rate_limiter", None)
+        if rate_limiter is not None:
+            start = time.monotonic()
+            getattr(rate_limiter, "acquire", rate_limiter.wait_if_needed)()
+            self._emit("on_rate_limit_wait", seconds=time.monotonic() - start)
+
+    def add_hook(self, event: str, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Call `callback` on a request lifecycle event.
+
+        Args:
+            event: on_request, on_response, on_retry, on_rate_limit_wait, on_cache_hit or on_cache_miss
+                (see usepolvo.arms.hooks for the keyword arguments of each)
+            callback: Called with `client` and the event's keyword arguments
+
+        Returns:
+            The callback
+        """
+        return self.hooks.register(event, callback)
+
+    def enable_metrics(self, collector: Optional[MetricsCollector] = None) -> MetricsCollector:
+        """
+        Record this client's requests in a metrics collector.
+
+        Args:
+            collector: Collector to feed, e.g. one shared by several clients (defaults to a new one)
+
+        Returns:
+            The collector; read it with snapshot() or to_prometheus()
+        """
+        if self.metrics is not None:
+            self.hooks.unsubscribe(self.metrics)
+        self.metrics = collector if collector is not None else MetricsCollector()
+        self.hooks.subscribe(self.metrics)
+        return self.metrics
+
+    def _emit(self, event: str, **info):
+        if self.hooks:
+            self.hooks.emit(event, client=self, **info)
+
+    def _emit_response(
+        self,
+        method: str,
+        url: str,
+        start: float,
+        status: Optional[int],
+        size: Optional[int],
+        kwargs: Dict[str, Any],
+        error: Optional[BaseException] = None,
+    ):
+        """Report a finished attempt: its status (None if no response arrived), duration and sizes."""
+        if self.hooks:
+            self.hooks.emit(
+                "on_response",
+                client=self,
+                method=method,
+                url=url,
+                status=status,
+                duration=time.monotonic() - start,
+                bytes_in=size,
+                bytes_out=body_size(kwargs),
+                error=error,
+            )
+
+    def _retry_hook(self, method: str, url: str) -> Optional[Callable[[Exception, int, float], None]]:
+        """Get the retrier callback reporting retries of a request to the on_retry hooks, if any."""
+        if not self.hooks:
+            return None
+        return lambda error, attempt, delay: self._emit(
+            "on_retry", method=method, url=url, attempt=attempt, delay=delay, error=error
+        )
+
+    def _get_cache_key(self, method: str, url: str, use_cache: bool, kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the cache key for a request, or None if the request should not be cached.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            use_cache: Whether the caller allows caching
+            kwargs: Request parameters, including the final headers
+
+        Returns:
+            The cache key, or None for uncacheable requests
+        """
+        if method != "GET" or not use_cache or not self.cache_policies.get(url).cacheable:
+            return None
+        return build_cache_key(
+            method,
+            url,
+            params=kwargs.get("params"),
+            body=kwargs.get("json", kwargs.get("data")),
+            headers=kwargs.get("headers"),
+        )
+
+    def _cache_response(
+        self,
+        cache_key: str,
+        url: str,
+        data: Any,
+        size: int,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Store a response in the cache if its endpoint policy allows it.
+
+        Args:
+            cache_key: Key returned by _get_cache_key
+            url: Full request URL, used to look up the policy
+            data: Decoded response body
+            size: Size of the raw response body in bytes
+            headers: Response headers, checked for ETag / Last-Modified validators
+        """
+        policy = self.cache_policies.get(url)
+        if policy.allows(size):
+            headers = headers or {}
+            entry = CacheEntry(data, policy.ttl, etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+            self.cache.set(cache_key, entry, self._cache_retention(entry), tags=[cache_tag(url)])
+
+    def _cache_revalidated(self, cache_key: str, url: str, entry: CacheEntry, headers: Mapping[str, str]) -> Any:
+        """
+        Refresh a stale entry after the server answered 304 Not Modified.
+
+        Args:
+            cache_key: Key the entry is stored under
+            url: Full request URL, used to look up the policy
+            entry: The stale entry that was revalidated
+            headers: Headers of the 304 response
+
+        Returns:
+            The cached response data
+        """
+        refreshed = entry.refreshed(self.cache_policies.get(url).ttl, headers)
+        self.cache.set(cache_key, refreshed, self._cache_retention(refreshed), tags=[cache_tag(url)])
+        return entry.value
+
+    def _cache_get(self, cache_key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        """
+        Get a cache entry, or None on a miss.
+
+        Args:
+            cache_key: Key returned by _get_cache_key
+            allow_stale: Also return expired entries kept for revalidation
+        """
+        entry = self.cache.get(cache_key)
+        if entry is None or allow_stale or entry.is_fresh():
+            return entry
+        return None
+
+    def _invalidate_written(self, method: str, url: str) -> int:
+        """Evict the cached responses a request to url may have changed."""
+        tags, prefixes = invalidation_tags(method, url)
+        if not tags:
+            return 0
+        return self.cache.invalidate(tags, prefixes)
+
+    def _cache_retention(self, entry: CacheEntry) -> float:
+        """Compute how long to keep an entry, keeping entries with validators around for revalidation."""
+        if entry.revalidatable:
+            return entry.ttl + self.cache_stale_ttl
+        return entry.ttl
+
+    def _build_url(self, endpoint: str) -> str:
+        """
+        Build the full request URL for an endpoint.
+
+        Absolute URLs (e.g. pagination links returned by the API) are used as-is.
+        """
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+    def _build_headers(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """
+        Build request headers with authentication and content type.
 
-        # Build request URL
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        Args:
+            client_id: OAuth2 client ID (if using OAuth)
+            client_secret: OAuth2 client secret (if using OAuth)
+            extra_headers: Custom headers that override the defaults
 
+        Returns:
+            Dictionary of request headers
+        """
         # Get authentication headers
         headers = {}
         if self.auth:
             if client_id and client_secret:
                 self.auth.ensure_valid_token(client_id, client_secret)
-            headers = self.auth.get_auth_headers()
+            headers = dict(self.auth.get_auth_headers())
 
         # Add content type for JSON requests
         headers["Content-Type"] = "application/json"
+        headers["Accept-Encoding"] = self.accept_encoding
 
         # Merge with any custom headers
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
-        kwargs["headers"] = headers
-
-        try:
-            response = requests.request(method, url, **kwargs)
-            response.raise_for_status()
-            data = response.json()
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
 
-            # Cache successful GET responses
-            if cache_key:
-                self.cache[cache_key] = data
-
-            return data
-
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code in (401, 403):
-                raise AuthenticationError(f"Authentication failed: {e.response.text}")
-            raise APIError(f"Request failed: {e.response.text}")
+    def _error_for_status(
+        self, status_code: int, response_text: str, headers: Optional[Mapping[str, str]] = None
+    ) -> PolvoError:
+        """
+        Map a failed HTTP status to a usepolvo exception.
 
-        except requests.exceptions.RequestException as e:
-            raise APIError(f"Request failed: {str(e)}")
+        Args:
+            status_code: HTTP status code of the failed response
+            response_text: Body of the failed response
+            headers: Headers of the failed response, checked for Retry-After on 429s
 
-        except Exception as e:
-            self.handle_error(e)
-            raise
+        Returns:
+            The exception to raise
+        """
+        if status_code in (401, 403):
+            return AuthenticationError(f"Authentication failed: {response_text}")
+        if status_code == 429:
+            return RateLimitError(f"Rate limit exceeded: {response_text}", retry_after=parse_retry_after(headers))
+        return APIError("Request failed", status_code=status_code, response_text=response_text)
 
     def handle_error(self, error: Exception):
         """
@@ -112,15 +699,99 @@ class BaseClient:
         Args:
             error: The exception that occurred
         """
-        error_message = f"Error occurred: {str(error)}"
-        # Log the error (implement logging in the future)
-        print(error_message)
+        logger.error("Error occurred: %s", error, extra={"tentacle": tentacle_name(self)})
 
     def clear_cache(self):
         """Clear the request cache."""
         self.cache.clear()
 
-    def get_pagination_params(self, page: Optional[int] = None, size: Optional[int] = None) -> Dict[str, Any]:
+    def invalidate_cache(self, endpoint: str) -> int:
+        """
+        Evict cached responses for a record, its sub-resources and its parent collection's list pages.
+
+        Writes made through _request invalidate automatically; use this after changes made
+        outside the client (e.g. on a webhook).
+
+        Args:
+            endpoint: API endpoint path or URL of the record
+
+        Returns:
+            Number of cache entries removed
+        """
+        return self._invalidate_written("DELETE", self._build_url(endpoint))
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """
+        Get request coalescing statistics.
+
+        Returns:
+            Counts of GETs sent upstream ("executed"), GETs that shared an in-flight
+            request ("coalesced"), and requests currently in flight ("in_flight")
+        """
+        return self.single_flight.stats()
+
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """
+        Get retry statistics.
+
+        Returns:
+            Counts of calls, retries and calls that gave up, and retries by reason (HTTP status or "transport")
+        """
+        return self.retrier.stats()
+
+    def get_hedging_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get request hedging statistics.
+
+        Returns:
+            Counts of GETs, GETs that were hedged and hedges whose answer was returned, and the
+            current hedging delay, or None if hedging is disabled
+        """
+        return self.hedger.stats() if self.hedger is not None else None
+
+    def get_circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get circuit breaker statistics.
+
+        Returns:
+            State, call outcomes and rejections of every host's breaker, by host
+        """
+        return self.circuit_breakers.stats() if self.circuit_breakers is not None else {}
+
+    def get_compression_stats(self) -> Dict[str, Any]:
+        """
+        Get compression statistics.
+
+        Returns:
+            Counts and original/wire bytes of compressed requests and responses, and their compression ratios
+        """
+        return self.compression_stats.stats()
+
+    def prewarm(self, url: Optional[str] = None) -> bool:
+        """
+        Open a keep-alive connection to the API host ahead of the first request.
+
+        Args:
+            url: URL to warm up (defaults to base_url)
+
+        Returns:
+            True if the connection was established, False otherwise
+        """
+        url = url or self.base_url
+        if not url:
+            return False
+        return self.http.prewarm(url)
+
+    def close(self):
+        """Close all pooled connections and the cache backend held by this client."""
+        self.http.close()
+        self.cache.close()
+        if self.hedger is not None:
+            self.hedger.close()
+
+    def get_pagination_params(
+        self, page: Optional[int] = None, size: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get pagination parameters based on the configured pagination method.
         Can be overridden by child classes for custom pagination.
@@ -128,25 +799,23 @@ class BaseClient:
         Args:
             page: Page number (optional)
             size: Page size (optional)
+            cursor: Cursor returned by the previous page (cursor pagination only)
 
         Returns:
             Dictionary of pagination parameters
         """
-        if not page and not size:
+        if not page and not size and not cursor:
             return {}
 
-        if self.pagination_method == "offset":
-            return {
-                "offset": (page - 1) * size if page else 0,
-                "limit": size if size else self.settings.DEFAULT_PAGE_SIZE,
-            }
-        elif self.pagination_method == "page":
-            return {
-                "page": page if page else 1,
-                "per_page": size if size else self.settings.DEFAULT_PAGE_SIZE,
-            }
+        size = size or self.default_page_size
+        if self.pagination_method == PaginationMethod.OFFSET_LIMIT:
+            return {"offset": (page - 1) * size if page else 0, "limit": size}
+        elif self.pagination_method == PaginationMethod.PAGE:
+            return {"page": page or 1, "per_page": size}
+        elif self.pagination_method == PaginationMethod.PAGE_SIZE:
+            return {"page": page or 1, "size": size}
         else:
-            return {
-                "limit": size if size else self.settings.DEFAULT_PAGE_SIZE,
-                "after": None,  # Cursor-based pagination requires implementation by child classes
-            }
+            params: Dict[str, Any] = {"limit": size}
+            if cursor:
+                params["after"] = cursor
+            return params
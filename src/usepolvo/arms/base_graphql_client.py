@@ -1,18 +1,65 @@
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
-
-from gql import Client, gql
-from gql.transport.requests import RequestsHTTPTransport
+from functools import lru_cache, partial
+from typing import Any, Dict, Optional
 
 from usepolvo.arms.base_client import BaseClient
+from usepolvo.arms.graphql_builder import GraphQLQueryBuilder
+from usepolvo.arms.graphql_schema import SchemaCache
+from usepolvo.beak.enums import GraphQLSchemaMode
+from usepolvo.beak.exceptions import APIError
+from usepolvo.mantle.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _pooled_transport_class():
+    """Define the pooled gql transport on first use, as gql is imported lazily."""
+    from gql.transport.exceptions import TransportAlreadyConnected
+    from gql.transport.requests import RequestsHTTPTransport
+
+    class PooledRequestsHTTPTransport(RequestsHTTPTransport):
+        """
+        gql transport that sends queries through a client's session pool.
+
+        gql connects and closes its transport around every query; the stock transport opens a
+        new session (and TCP/TLS connection) each time, this one reuses the pooled connections
+        and whatever cassette the pool records to or replays from.
+        """
+
+        def __init__(self, pool, **kwargs):
+            super().__init__(**kwargs)
+            self.pool = pool
+
+        def connect(self):
+            if self.session is not None:
+                raise TransportAlreadyConnected("Transport is already connected")
+            self.session = self.pool.session
+
+        def close(self):
+            # Closing the pool's session would close every pooled connection
+            self.session = None
 
+    return PooledRequestsHTTPTransport
 
-class BaseGraphQLClient(BaseClient, ABC):
+
+class BaseGraphQLClient(GraphQLQueryBuilder, BaseClient, ABC):
     """Base client for GraphQL-based API integrations."""
 
+    # Bump when the API makes a breaking schema change, so snapshots of the old schema are ignored
+    schema_version: str = ""
+
     def __init__(self):
         super().__init__()
         self._client = None
+        # How queries are validated client-side; see GraphQLSchemaMode
+        self.schema_mode = self.settings.GRAPHQL_SCHEMA_MODE
+        self.schema_cache = SchemaCache(self.settings.GRAPHQL_SCHEMA_CACHE_DIR)
+        self.schema_max_age = self.settings.GRAPHQL_SCHEMA_MAX_AGE
+        self._schema_refresh: Optional[threading.Thread] = None
+        self._schema_lock = threading.Lock()
         self._setup_graphql_client()
 
     def _setup_graphql_client(self):
@@ -20,12 +67,87 @@ class BaseGraphQLClient(BaseClient, ABC):
         if not self.base_url:
             raise ValueError("base_url must be set before initializing the GraphQL client")
 
-        transport = RequestsHTTPTransport(
+        # gql is imported on first use, to keep importing GraphQL tentacles fast
+        from gql import Client
+
+        transport = _pooled_transport_class()(
+            self.http,
             url=self.base_url,
             headers=self.auth.get_auth_headers(),
             use_json=True,
         )
-        self._client = Client(transport=transport, fetch_schema_from_transport=True)
+        if self.schema_mode == GraphQLSchemaMode.FETCH:
+            self._client = Client(transport=transport, fetch_schema_from_transport=True)
+            return
+
+        # Without a schema gql sends queries unvalidated; the cached mode adds one from the snapshot
+        self._client = Client(transport=transport)
+        if self.schema_mode == GraphQLSchemaMode.CACHED:
+            self._load_schema()
+
+    def _load_schema(self):
+        """
+        Use the schema snapshot, if any, and refresh it in the background if it is missing or old.
+
+        Startup never waits on introspection: until a snapshot exists queries are sent unvalidated.
+        """
+        snapshot = self.schema_cache.load(self.base_url, self.schema_version)
+        if snapshot is not None:
+            introspection, saved_at = snapshot
+            self._use_schema(introspection)
+            if time.time() - saved_at < self.schema_max_age:
+                return
+        self.refresh_schema(background=True)
+
+    def _use_schema(self, introspection: Dict[str, Any]):
+        from graphql import build_client_schema
+
+        schema = build_client_schema(introspection)
+        self._client.introspection = introspection
+        self._client.schema = schema
+
+    def refresh_schema(self, background: bool = False):
+        """
+        Introspect the API and replace the schema snapshot.
+
+        Args:
+            background: Refresh in a daemon thread and return immediately; failures are logged
+                and the current schema is kept
+
+        Raises:
+            APIError: If the introspection query fails (only when not in the background)
+        """
+        if not background:
+            with self._schema_lock:
+                self._refresh_schema()
+            return
+
+        with self._schema_lock:
+            if self._schema_refresh is not None and self._schema_refresh.is_alive():
+                return
+            self._schema_refresh = threading.Thread(
+                target=self._refresh_schema_quietly, name="usepolvo-graphql-schema", daemon=True
+            )
+            self._schema_refresh.start()
+
+    def _refresh_schema(self):
+        from graphql import get_introspection_query
+
+        # Sent over the pooled session rather than gql's transport, which is not safe to share between threads
+        response = BaseClient._request(
+            self, "POST", self.base_url, use_cache=False, json={"query": get_introspection_query()}
+        )
+        if response.get("errors") or not response.get("data"):
+            raise APIError(f"GraphQL introspection failed: {response.get('errors')}")
+        introspection = response["data"]
+        self._use_schema(introspection)
+        self.schema_cache.save(self.base_url, self.schema_version, introspection)
+
+    def _refresh_schema_quietly(self):
+        try:
+            self._refresh_schema()
+        except Exception as e:
+            logger.warning("Failed to refresh the GraphQL schema of %s: %s", self.base_url, e)
 
     def execute_query(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -37,107 +159,14 @@ class BaseGraphQLClient(BaseClient, ABC):
         """
         if not self._client:
             raise RuntimeError("GraphQL client not initialized")
+        from gql import gql
 
         try:
-            result = self._client.execute(gql(query), variable_values=variables)
-            return result
+            # Queries are retried on 5xx/transport failures; mutations only when rate limited
+            return self.retrier.call(
+                partial(self._client.execute, gql(query), variable_values=variables),
+                "POST",
+                idempotent=not self._is_mutation(query),
+            )
         except Exception as e:
             self.handle_error(e)
-
-    def _convert_rest_to_graphql(self, method: str, endpoint: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
-        """
-        Convert REST-style requests to GraphQL queries.
-
-        :param method: HTTP method
-        :param endpoint: The endpoint path
-        :param kwargs: Additional arguments
-        :return: Tuple of (query_string, variables)
-        """
-        parts = endpoint.strip("/").split("/")
-        resource_type = parts[0]
-        resource_id = parts[1] if len(parts) > 1 else None
-        request_payload = kwargs.get("json", {})
-        request_params = kwargs.get("params", {})
-
-        if method == "GET":
-            if resource_id:
-                return self._build_get_query(resource_type), {"id": resource_id}
-            return self._build_list_query(resource_type, request_params), request_params
-        elif method == "POST":
-            return self._build_create_mutation(resource_type), request_payload
-        elif method == "PUT":
-            return self._build_update_mutation(resource_type), {"id": resource_id, **request_payload}
-        elif method == "DELETE":
-            return self._build_delete_mutation(resource_type, resource_id), {"id": resource_id}
-
-        raise ValueError(f"Unsupported method: {method}")
-
-    def _build_get_query(self, resource_type: str) -> str:
-        """Build a GraphQL query for fetching a single resource."""
-        return f"""
-            query Get{resource_type.title()}($id: String!) {{
-                {resource_type}(id: $id) {{
-                    id
-                    {self._get_resource_fields(resource_type)}
-                }}
-            }}
-        """
-
-    def _build_list_query(self, resource_type: str, params: Dict[str, Any]) -> str:
-        """Build a GraphQL query for listing resources."""
-        return f"""
-            query List{resource_type.title()}s($first: Int, $after: String) {{
-                {resource_type}s(first: $first, after: $after) {{
-                    nodes {{
-                        id
-                        {self._get_resource_fields(resource_type)}
-                    }}
-                    pageInfo {{
-                        hasNextPage
-                        endCursor
-                    }}
-                }}
-            }}
-        """
-
-    def _build_create_mutation(self, resource_type: str) -> str:
-        """Build a GraphQL mutation for creating a resource."""
-        return f"""
-            mutation Create{resource_type.title()}($input: Create{resource_type.title()}Input!) {{
-                create{resource_type.title()}(input: $input) {{
-                    id
-                    {self._get_resource_fields(resource_type)}
-                }}
-            }}
-        """
-
-    def _build_update_mutation(self, resource_type: str) -> str:
-        """Build a GraphQL mutation for updating a resource."""
-        resource_title = resource_type.title()
-        return f"""
-            mutation {resource_title}Update($id: String!, $input: {resource_title}UpdateInput!) {{
-                {resource_type}Update(id: $id, input: $input) {{
-                    issue {{ id }}
-                }}
-            }}
-        """
-
-    def _build_delete_mutation(self, resource_type: str, resource_id: str) -> str:
-        """Build a GraphQL mutation for deleting a resource."""
-        return f"""
-            mutation Delete{resource_type.title()}($id: ID!) {{
-                delete{resource_type.title()}(id: $id) {{
-                    success
-                }}
-            }}
-        """
-
-    def _get_resource_fields(self, resource_type: str) -> str:
-        """
-        Get the fields to be queried for a specific resource type.
-        Should be overridden by child classes to specify fields for each resource.
-        """
-        return """
-            title
-            description
-        """
@@ -1,59 +1,239 @@
 # usepolvo/arms/base_rate_limiter.py
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
-from collections import deque
+from contextvars import ContextVar
 from functools import wraps
 from threading import Lock
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from usepolvo.arms.deadline import check_deadline
+from usepolvo.arms.rate_limit_windows import RateLimitWindow, create_window
+from usepolvo.beak.config import get_settings
+from usepolvo.beak.enums import RateLimitAlgorithm, RateLimitMode
+from usepolvo.beak.exceptions import RateLimitRejectedError
+
+
+class _Acquisition:
+    """Slots reserved by one `acquire` call, claimed in every window before anyone sleeps."""
+
+    def __init__(self, now: float, max_wait: Optional[float]):
+        self.now = now
+        self.max_wait = max_wait
+        self.ready = now
+        self.slots: List[Tuple[RateLimitWindow, float, int, float]] = []
+
+    def cancel(self):
+        """Give back every slot reserved so far."""
+        for window, slot, limit, time_frame in self.slots:
+            window.release(slot, limit, time_frame)
+        self.slots.clear()
+
+
+_acquisition: ContextVar[Optional[_Acquisition]] = ContextVar("usepolvo_rate_limit_acquisition", default=None)
 
 
 class BaseRateLimiter(ABC):
-    def __init__(self):
-        self.windows: Dict[str, deque] = {}
+    def __init__(self, algorithm: Optional[RateLimitAlgorithm] = None, mode: Optional[RateLimitMode] = None):
+        """
+        :param algorithm: How windows count requests (defaults to POLVO_RATE_LIMIT_ALGORITHM)
+        :param mode: Whether `acquire` waits for a slot or fails fast (defaults to POLVO_RATE_LIMIT_MODE)
+        """
+        settings = get_settings()
+        self.algorithm = algorithm or settings.RATE_LIMIT_ALGORITHM
+        self.mode = mode or settings.RATE_LIMIT_MODE
+        self.max_queue: Optional[int] = settings.RATE_LIMIT_MAX_QUEUE
+        self.windows: Dict[str, RateLimitWindow] = {}
+        # Windows lock themselves; this guards any other state a subclass keeps (e.g. limits read from headers)
         self.lock = Lock()
+        # Callers currently sleeping in `acquire`, guarded by `self.lock`
+        self.waiting = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "wait_if_needed" in cls.__dict__:
+            cls.wait_if_needed = _reserving(cls.__dict__["wait_if_needed"])
 
     @abstractmethod
     def wait_if_needed(self, *args, **kwargs):
         """
         Check if a request can be made based on the rate limits.
         If not, wait until it's allowed.
+
+        Implementations only name the windows to check (with `_wait_if_window_full`): called
+        directly, it waits like `acquire` with no timeout, so every window counts the request
+        at the time it is sent.
         """
         pass
 
-    def _clean_old_requests(self, window_name: str, current_time: float, time_frame: float):
+    async def async_wait_if_needed(self, *args, **kwargs):
         """
-        Remove old requests from the specified window.
+        Awaitable variant of wait_if_needed for asyncio clients.
 
-        :param window_name: The name of the window to clean
-        :param current_time: The current timestamp
-        :param time_frame: The time frame for the window (in seconds)
+        The slots are reserved without blocking and then awaited with asyncio.sleep.
+        """
+        await self._async_acquire(None, *args, **kwargs)
+
+    def acquire(self, *args, timeout: Optional[float] = None, **kwargs) -> float:
+        """
+        Take a slot in every window `wait_if_needed` checks, waiting for it if necessary.
+
+        Slots are reserved in all windows first and only then slept for, so a caller that
+        gives up never holds capacity: its slots are handed back. Every window counts the
+        request at the time it is actually sent. Arguments other than `timeout` are passed
+        to `wait_if_needed`.
+
+        :param timeout: Longest wait (in seconds) to accept; 0 never waits. In reject mode,
+            defaults to 0
+        :return: The seconds waited
+        :raises RateLimitRejectedError: If the slot is more than `timeout` away (with `retry_after`
+            set to the wait it would have taken) or `max_queue` callers are already waiting
+        :raises DeadlineExceededError: If the wait would outlast the caller's deadline
+        """
+        if timeout is None and self.mode == RateLimitMode.REJECT:
+            timeout = 0.0
+        return self._acquire(timeout, *args, **kwargs)
+
+    async def async_acquire(self, *args, timeout: Optional[float] = None, **kwargs) -> float:
+        """Awaitable variant of acquire; the wait is an asyncio.sleep, and cancelling it gives the slots back."""
+        if timeout is None and self.mode == RateLimitMode.REJECT:
+            timeout = 0.0
+        return await self._async_acquire(timeout, *args, **kwargs)
+
+    def _acquire(self, timeout: Optional[float], *args, **kwargs) -> float:
+        acquisition = self._reserve(timeout, *args, **kwargs)
+        wait = acquisition.ready - acquisition.now
+        if wait <= 0:
+            return 0.0
+        self._join_queue(acquisition, wait)
+        try:
+            # The slots are already ours: sleep without holding any lock
+            delay = acquisition.ready - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            acquisition.cancel()
+            raise
+        finally:
+            self._leave_queue()
+        return wait
+
+    async def _async_acquire(self, timeout: Optional[float], *args, **kwargs) -> float:
+        acquisition = self._reserve(timeout, *args, **kwargs)
+        wait = acquisition.ready - acquisition.now
+        if wait <= 0:
+            return 0.0
+        self._join_queue(acquisition, wait)
+        try:
+            delay = acquisition.ready - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            # Cancelled (or failed) while waiting: the request will not be sent
+            acquisition.cancel()
+            raise
+        finally:
+            self._leave_queue()
+        return wait
+
+    def _reserve(self, timeout: Optional[float], *args, **kwargs) -> _Acquisition:
+        """
+        Reserve a slot in every window `wait_if_needed` checks, without waiting for it.
+
+        :param timeout: Longest wait (in seconds) to accept, or None for any
+        :return: The reservation; `ready` is when the request may be sent
+        :raises RateLimitRejectedError: If the slot is more than `timeout` away
+        :raises DeadlineExceededError: If the wait would outlast the caller's deadline
         """
-        cutoff = current_time - time_frame
-        while self.windows[window_name] and self.windows[window_name][0] <= cutoff:
-            self.windows[window_name].popleft()
+        acquisition = _Acquisition(time.time(), timeout)
+        token = _acquisition.set(acquisition)
+        try:
+            self.wait_if_needed(*args, **kwargs)
+            while any(slot != acquisition.ready for _, slot, _, _ in acquisition.slots):
+                # A later window pushed the send time back: windows checked before it counted the
+                # request too early, and would let a burst through once that slot expired. Reserve
+                # every window again from the send time until they all agree on it.
+                ready = acquisition.ready
+                acquisition.cancel()
+                acquisition.ready = ready
+                self.wait_if_needed(*args, **kwargs)
+            wait = acquisition.ready - acquisition.now
+            if wait > 0:
+                check_deadline(wait)
+        except BaseException:
+            acquisition.cancel()
+            raise
+        finally:
+            _acquisition.reset(token)
+        return acquisition
+
+    def _join_queue(self, acquisition: _Acquisition, wait: float):
+        """Count a caller about to wait, shedding it if `max_queue` callers are already waiting."""
+        with self.lock:
+            queued = self.max_queue is not None and self.waiting >= self.max_queue
+            if not queued:
+                self.waiting += 1
+        if queued:
+            acquisition.cancel()
+            raise RateLimitRejectedError("Rate limiter queue is full", retry_after=round(wait, 3))
+
+    def _leave_queue(self):
+        with self.lock:
+            self.waiting -= 1
+
+    def try_acquire(self, *args, **kwargs) -> bool:
+        """
+        Take a slot only if one is free right now, never waiting.
+
+        :return: True if the request may be sent, False if it would have to wait (nothing is taken)
+        """
+        try:
+            self.acquire(*args, timeout=0, **kwargs)
+            return True
+        except RateLimitRejectedError:
+            return False
 
     def _wait_if_window_full(self, window_name: str, limit: int, time_frame: float) -> float:
         """
         Wait if the specified window is full.
 
+        Safe to call from many threads without holding `self.lock`: the window reserves a slot
+        under its own lock and the caller sleeps outside it, in first in, first out order.
+        Inside `acquire` the slot is only reserved, no earlier than the slots of the windows
+        checked before it, and `acquire` does the waiting.
+
         :param window_name: The name of the window to check
         :param limit: The maximum number of requests allowed in the window
         :param time_frame: The time frame for the window (in seconds)
-        :return: The current time after waiting (if necessary)
+        :return: The time the request may be sent, after waiting (if necessary)
+        :raises RateLimitRejectedError: Inside `acquire`, if the slot is further away than its timeout
+        :raises DeadlineExceededError: If the wait would outlast the caller's deadline
         """
-        current_time = time.time()
-        self._clean_old_requests(window_name, current_time, time_frame)
+        acquisition = _acquisition.get()
+        if acquisition is not None:
+            max_wait = acquisition.max_wait
+            if max_wait is not None:
+                max_wait -= acquisition.ready - acquisition.now
+            window = self.windows[window_name]
+            try:
+                ready = window.reserve(acquisition.ready, limit, time_frame, max_wait=max_wait)
+            except RateLimitRejectedError as e:
+                if e.retry_after is None:
+                    # The window never admits a request: waiting would not help
+                    raise
+                # Report the wait from when acquire was called, across every window
+                raise RateLimitRejectedError(retry_after=round(acquisition.ready - acquisition.now + e.retry_after, 3))
+            acquisition.slots.append((window, ready, limit, time_frame))
+            acquisition.ready = ready
+            return ready
 
-        if len(self.windows[window_name]) >= limit:
-            sleep_time = time_frame - (current_time - self.windows[window_name][0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            current_time = time.time()
-            self._clean_old_requests(window_name, current_time, time_frame)
-
-        self.windows[window_name].append(current_time)
-        return current_time
+        current_time = time.time()
+        ready = self.windows[window_name].reserve(current_time, limit, time_frame)
+        if ready > current_time:
+            # The slot is already ours: sleep without holding any lock
+            time.sleep(ready - current_time)
+        return ready
 
     def _initialize_window(self, window_name: str):
         """
@@ -62,7 +242,7 @@ class BaseRateLimiter(ABC):
         :param window_name: The name of the window to initialize
         """
         if window_name not in self.windows:
-            self.windows[window_name] = deque()
+            self.windows[window_name] = create_window(self.algorithm)
 
     @abstractmethod
     def get_limits(self) -> Dict[str, Any]:
@@ -81,7 +261,20 @@ class BaseRateLimiter(ABC):
         def wrapper(self, *args, **kwargs):
             if not hasattr(self, "rate_limiter") or not isinstance(self.rate_limiter, BaseRateLimiter):
                 raise AttributeError("The class must have a 'rate_limiter' attribute of type BaseRateLimiter")
-            self.rate_limiter.wait_if_needed()
+            self.rate_limiter.acquire()
             return func(self, *args, **kwargs)
 
         return wrapper
+
+
+def _reserving(wait_if_needed: Callable) -> Callable:
+    """Make a direct call of a limiter's wait_if_needed reserve every window before waiting, like acquire."""
+
+    @wraps(wait_if_needed)
+    def wrapper(self, *args, **kwargs):
+        if _acquisition.get() is not None:
+            # Called by _reserve: just name the windows
+            return wait_if_needed(self, *args, **kwargs)
+        self._acquire(None, *args, **kwargs)
+
+    return wrapper
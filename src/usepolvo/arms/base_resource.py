@@ -1,13 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Union
+from functools import partial
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import requests
 
+from usepolvo.arms.bulk import BulkResult, run_bulk
+from usepolvo.arms.pagination import (
+    PageRequest,
+    PageResult,
+    Paginator,
+    fan_out,
+    iter_pages,
+)
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
+from usepolvo.ink import codec
 from usepolvo.ink.transformations import snake_to_camel
 
+Model = TypeVar("Model")
+
 
 class BaseResource(ABC):
+    # Describe the list endpoint to enable pages() and iter_all()
+    list_path: Optional[str] = None  # List endpoint, defaults to base_path
+    records_key: Optional[str] = None  # Response key holding the records, None if the response is the list
+    next_key: str = "next"  # Response key holding the next cursor or link (PaginationMethod.CURSOR)
+    count_key: Optional[str] = None  # Response key holding the total record count, enables parallel scan()
+    record_schema: Optional[Type] = None  # Schema each record is validated against
+
     def __init__(self, client):
         self.client = client
 
@@ -66,6 +97,48 @@ class BaseResource(ABC):
         """
         pass
 
+    def bulk_get(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """
+        Retrieve many resources concurrently.
+
+        Tentacles whose API has a native batch endpoint override the bulk methods.
+
+        :param resource_ids: The IDs of the resources to retrieve
+        :param workers: Requests made concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The resource or error of every ID, in input order
+        """
+        return run_bulk(self.get, resource_ids, workers or self.client.bulk_workers)
+
+    def bulk_create(self, items: Iterable[Dict[str, Any]], workers: Optional[int] = None) -> BulkResult:
+        """
+        Create many resources concurrently; a failed item does not stop the others.
+
+        :param items: The data for each new resource
+        :param workers: Requests made concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The created resource or error of every item, in input order
+        """
+        return run_bulk(self.create, items, workers or self.client.bulk_workers)
+
+    def bulk_update(self, updates: Iterable[Tuple[str, Dict[str, Any]]], workers: Optional[int] = None) -> BulkResult:
+        """
+        Update many resources concurrently; a failed item does not stop the others.
+
+        :param updates: (resource ID, updated data) pairs
+        :param workers: Requests made concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The updated resource or error of every pair, in input order
+        """
+        return run_bulk(lambda update: self.update(*update), updates, workers or self.client.bulk_workers)
+
+    def bulk_delete(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """
+        Delete many resources concurrently; a failed item does not stop the others.
+
+        :param resource_ids: The IDs of the resources to delete
+        :param workers: Requests made concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The outcome of every ID, in input order
+        """
+        return run_bulk(self.delete, resource_ids, workers or self.client.bulk_workers)
+
     def _prepare_request_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Prepare data for a request by converting snake_case keys to camelCase.
@@ -75,6 +148,102 @@ class BaseResource(ABC):
         """
         return {snake_to_camel(k): v for k, v in data.items()}
 
+    def _stream_records(
+        self, endpoint: str, stream_path: Sequence[str], schema: Type[Model], **kwargs
+    ) -> Iterator[Model]:
+        """
+        Stream the records of a list endpoint, validating each one as it arrives.
+
+        :param endpoint: The API endpoint
+        :param stream_path: Object keys leading to the records array in the response
+        :param schema: Schema each record is validated against
+        :param kwargs: Additional arguments for the request
+        :return: An iterator over validated records
+        """
+        records = self.client._request("GET", endpoint, stream=True, stream_path=stream_path, **kwargs)
+        return (schema(**record) for record in records)
+
+    def pages(self, size: Optional[int] = None, prefetch: Optional[bool] = None, **params) -> Iterator[List[Any]]:
+        """
+        Iterate over every page of the list endpoint, following the client's pagination method.
+
+        The next page is fetched on a worker thread while the current one is consumed, and
+        at most two pages are held at once, so full scans overlap network waits with
+        processing and use bounded memory.
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param prefetch: Fetch the next page in the background, defaults to POLVO_PAGINATION_PREFETCH
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An iterator over the records of each page
+        """
+        paginator = self._paginator(size, params)
+        fetch = partial(self._fetch_page, paginator)
+        return iter_pages(fetch, self.client.pagination_prefetch if prefetch is None else prefetch)
+
+    def iter_all(self, size: Optional[int] = None, prefetch: Optional[bool] = None, **params) -> Iterator[Any]:
+        """
+        Iterate over every record of the list endpoint, page by page.
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param prefetch: Fetch the next page in the background, defaults to POLVO_PAGINATION_PREFETCH
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An iterator over the records
+        """
+        for page in self.pages(size, prefetch, **params):
+            yield from page
+
+    def scan(
+        self, size: Optional[int] = None, workers: Optional[int] = None, ordered: bool = True, **params
+    ) -> Iterator[Any]:
+        """
+        Iterate over every record of the list endpoint, fetching pages in parallel.
+
+        The first page reports the total count (under count_key), so every remaining page
+        of an offset or page-number endpoint is known and fetched concurrently. All workers
+        share the client's rate limiter. Without a count, or with cursor pagination, pages
+        are fetched one after another as in iter_all().
+
+        :param size: Records per page, defaults to POLVO_DEFAULT_PAGE_SIZE
+        :param workers: Pages fetched concurrently, defaults to POLVO_PAGINATION_FAN_OUT
+        :param ordered: Yield records in page order; otherwise yield each page as soon as it arrives
+        :param params: Extra query parameters sent with every page (e.g. filters)
+        :return: An iterator over the records
+        """
+        paginator = self._paginator(size, params)
+        fetch = partial(self._fetch_page, paginator)
+        first = PageRequest()
+        endpoint, query = paginator.request(first)
+        response = self.client._request("GET", endpoint, params=query)
+        records, next_page = paginator.parse(first, response)
+        yield from records
+        if next_page is None:
+            return
+
+        total = paginator.total_pages(response)
+        if total is None:
+            pages = iter_pages(fetch, self.client.pagination_prefetch, start=next_page)
+        else:
+            remaining = (PageRequest(page) for page in range(next_page.page, total + 1))
+            pages = fan_out(fetch, remaining, workers or self.client.pagination_fan_out, ordered)
+        for page in pages:
+            yield from page
+
+    def _paginator(self, size: Optional[int], params: Dict[str, Any]) -> Paginator:
+        return Paginator(
+            self.client,
+            self.list_path or getattr(self, "base_path", ""),
+            size or self.client.default_page_size,
+            params,
+            records_key=self.records_key,
+            next_key=self.next_key,
+            count_key=self.count_key,
+            schema=self.record_schema,
+        )
+
+    def _fetch_page(self, paginator: Paginator, page: PageRequest) -> PageResult:
+        endpoint, query = paginator.request(page)
+        return paginator.parse(page, self.client._request("GET", endpoint, params=query))
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Make an HTTP request to the API.
@@ -89,7 +258,7 @@ class BaseResource(ABC):
         try:
             response = self.client.request(method, endpoint, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return codec.loads(response.content)
         except requests.exceptions.HTTPError as http_err:
             if response.status_code == 404:
                 raise ResourceNotFoundError(f"Resource not found at endpoint: {endpoint}") from http_err
@@ -1,12 +1,12 @@
 import asyncio
-import json
 from abc import ABC, abstractmethod
 from typing import Union
 
-from aiohttp import web
-from pyngrok import ngrok
-
+from usepolvo.ink import codec
 from usepolvo.ink.validators import verify_hmac_signature
+from usepolvo.mantle.logger import configure_logging, get_logger
+
+logger = get_logger(__name__)
 
 
 class BaseWebhook(ABC):
@@ -16,6 +16,7 @@ class BaseWebhook(ABC):
         self.signature_header = None
         self._server = None
         self._ngrok_tunnel = None
+        configure_logging()
 
     def set_secret_key(self, key):
         self.secret_key = key
@@ -59,18 +60,21 @@ class BaseWebhook(ABC):
 
     async def _handle_webhook(self, request):
         """Handle incoming webhook request."""
+        # aiohttp and pyngrok are only imported when a server is started, to keep imports fast
+        from aiohttp import web
+
         # Get raw request body
-        raw_body = await request.text()
+        raw_body = await request.read()
 
         # Get signature
-        signature = request.headers.get(self.signature_header)
+        signature = request.headers.get(self.signature_header) if self.signature_header else None
         try:
             if self.secret_key and signature:
                 # Verify signature using raw body
                 self.verify_signature(raw_body, signature)
 
             # Parse JSON after verification
-            payload = json.loads(raw_body)
+            payload = codec.loads(raw_body)
 
             # Process webhook
             await self.process(payload)
@@ -79,6 +83,9 @@ class BaseWebhook(ABC):
             return web.Response(status=400, text=str(e))
 
     async def start_server(self, path, port=8080):
+        from aiohttp import web
+        from pyngrok import ngrok
+
         app = web.Application()
         app.router.add_post(path, self._handle_webhook)
 
@@ -88,11 +95,12 @@ class BaseWebhook(ABC):
         await self._server.start()
 
         self._ngrok_tunnel = ngrok.connect(port)
-        print(f"Ngrok tunnel established: {self._ngrok_tunnel.public_url}")
-        print(f"Webhook URL: {self._ngrok_tunnel.public_url}{path}")
-        print(f"Use this URL in your webhook settings")
+        logger.info("Ngrok tunnel established: %s", self._ngrok_tunnel.public_url)
+        logger.info("Webhook URL: %s%s (use this URL in your webhook settings)", self._ngrok_tunnel.public_url, path)
 
     async def stop_server(self):
+        from pyngrok import ngrok
+
         if self._server:
             await self._server.stop()
 
@@ -100,13 +108,13 @@ class BaseWebhook(ABC):
             try:
                 ngrok.disconnect(self._ngrok_tunnel.public_url)
             except Exception as e:
-                print(f"Failed to disconnect ngrok tunnel: {e}")
+                logger.warning("Failed to disconnect ngrok tunnel: %s", e)
 
         # Ensure ngrok process is terminated
         try:
             ngrok.kill()
         except Exception as e:
-            print(f"Failed to kill ngrok process: {e}")
+            logger.warning("Failed to kill ngrok process: %s", e)
 
     async def run(self, path, port=8080):
         await self.start_server(path, port)
@@ -116,6 +124,6 @@ class BaseWebhook(ABC):
                 await asyncio.sleep(1)
         except asyncio.CancelledError:
             # Handle cancellation gracefully
-            print("Received cancellation, shutting down...")
+            logger.info("Received cancellation, shutting down...")
         finally:
             await self.stop_server()
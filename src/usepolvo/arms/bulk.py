@@ -0,0 +1,150 @@
+# usepolvo/arms/bulk.py
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from usepolvo.beak.exceptions import BulkOperationError
+
+
+class BulkItem(NamedTuple):
+    """Outcome of one item of a bulk operation."""
+
+    index: int  # Position of the item in the input
+    input: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResult:
+    """Per-item outcomes of a bulk operation, in input order."""
+
+    def __init__(self, items: List[BulkItem]):
+        self.items = items
+
+    def __iter__(self) -> Iterator[BulkItem]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def succeeded(self) -> List[BulkItem]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> List[BulkItem]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def results(self) -> List[Any]:
+        """Get the result of every item, None for failed items."""
+        return [item.result for item in self.items]
+
+    def raise_for_errors(self):
+        """
+        Raise if any item failed.
+
+        Raises:
+            BulkOperationError: Carrying this result, if any item failed
+        """
+        failed = self.failed
+        if failed:
+            raise BulkOperationError(f"{len(failed)} of {len(self.items)} items failed", result=self)
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split items into lists of at most `size`, e.g. to fit a native batch endpoint's limit."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_bulk(func: Callable[[Any], Any], inputs: Iterable[Any], workers: int) -> BulkResult:
+    """
+    Call func on every input from a bounded thread pool.
+
+    Failures are recorded per item and never abort the batch. Only `workers` calls are
+    in flight at once, and each passes through the client's rate limiter as usual.
+
+    Args:
+        func: Operation applied to one input (e.g. a resource's create)
+        inputs: Items to process
+        workers: Calls made concurrently
+
+    Returns:
+        The outcome of every item, in input order
+    """
+    pending = enumerate(inputs)
+    in_flight: Dict[Future, Tuple[int, Any]] = {}
+    items: List[BulkItem] = []
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="usepolvo-bulk") as executor:
+
+        def submit():
+            for index, value in pending:
+                # Copy the context so deadlines follow the call into the worker thread
+                in_flight[executor.submit(copy_context().run, func, value)] = (index, value)
+                return
+
+        for _ in range(workers):
+            submit()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, value = in_flight.pop(future)
+                error = future.exception()
+                if error is not None and not isinstance(error, Exception):
+                    raise error
+                items.append(BulkItem(index, value, None if error else future.result(), error))
+                submit()
+
+    items.sort(key=lambda item: item.index)
+    return BulkResult(items)
+
+
+async def arun_bulk(func: Callable[[Any], Awaitable[Any]], inputs: Iterable[Any], workers: int) -> BulkResult:
+    """
+    Async variant of run_bulk; `workers` tasks take inputs one at a time.
+
+    Inputs are pulled from the iterable as workers free up, so only `workers` calls
+    (and coroutines) exist at once however many inputs there are.
+    """
+    pending = enumerate(inputs)
+    items: List[BulkItem] = []
+
+    async def worker():
+        for index, value in pending:
+            try:
+                items.append(BulkItem(index, value, await func(value)))
+            except Exception as e:
+                items.append(BulkItem(index, value, error=e))
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    items.sort(key=lambda item: item.index)
+    return BulkResult(items)
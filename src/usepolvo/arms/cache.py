@@ -0,0 +1,253 @@
+# usepolvo/arms/cache.py
+
+import hashlib
+import json
+import re
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from usepolvo.ink import codec
+
+# Methods that never change server state and so never invalidate cached responses
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CachePolicy:
+    """Caching rules for the endpoints matched by a policy table entry."""
+
+    def __init__(self, ttl: float, max_entry_size: Optional[int] = None, cacheable: bool = True):
+        """
+        Args:
+            ttl: Time to live for cached responses (in seconds)
+            max_entry_size: Largest response body (in bytes) that may be cached, or None for no limit
+            cacheable: Whether matching responses are cached at all
+        """
+        self.ttl = ttl
+        self.max_entry_size = max_entry_size
+        self.cacheable = cacheable
+
+    def allows(self, size: int) -> bool:
+        """Check whether a response body of the given size may be cached."""
+        return self.cacheable and (self.max_entry_size is None or size <= self.max_entry_size)
+
+    def __repr__(self):
+        return f"CachePolicy(ttl={self.ttl}, max_entry_size={self.max_entry_size}, cacheable={self.cacheable})"
+
+
+class CachePolicyTable:
+    """
+    Ordered table of endpoint patterns to cache policies.
+
+    Patterns are regular expressions searched against the request URL. The first
+    matching pattern wins; unmatched endpoints use the default policy.
+    """
+
+    def __init__(self, default: CachePolicy):
+        self.default = default
+        self._policies: List[Tuple[re.Pattern, CachePolicy]] = []
+
+    def add(
+        self,
+        pattern: str,
+        ttl: Optional[float] = None,
+        max_entry_size: Optional[int] = None,
+        cacheable: bool = True,
+    ) -> CachePolicy:
+        """
+        Register a policy for endpoints matching a pattern.
+
+        Args:
+            pattern: Regular expression searched against the request URL
+            ttl: Time to live in seconds (defaults to the default policy's TTL)
+            max_entry_size: Largest cacheable body in bytes (defaults to the default policy's limit)
+            cacheable: Whether matching responses are cached at all
+
+        Returns:
+            The registered policy
+        """
+        policy = CachePolicy(
+            ttl=self.default.ttl if ttl is None else ttl,
+            max_entry_size=self.default.max_entry_size if max_entry_size is None else max_entry_size,
+            cacheable=cacheable,
+        )
+        self._policies.append((re.compile(pattern), policy))
+        return policy
+
+    def get(self, url: str) -> CachePolicy:
+        """Get the policy for a request URL."""
+        for pattern, policy in self._policies:
+            if pattern.search(url):
+                return policy
+        return self.default
+
+
+class CacheEntry:
+    """
+    A cached response body together with the TTL it was stored with.
+
+    Entries that carry HTTP validators (ETag / Last-Modified) stay in the cache
+    after they go stale so they can be revalidated with a conditional request.
+    """
+
+    __slots__ = ("value", "ttl", "etag", "last_modified", "expires_at")
+
+    def __init__(
+        self,
+        value: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        expires_at: Optional[float] = None,
+    ):
+        self.value = value
+        self.ttl = ttl
+        self.etag = etag
+        self.last_modified = last_modified
+        # Wall-clock time so entries stay meaningful when shared between processes
+        self.expires_at = time.time() + ttl if expires_at is None else expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry is still within its TTL."""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build the If-None-Match / If-Modified-Since headers to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_bytes(self) -> bytes:
+        """Serialize the entry; the format shared by every cache backend that stores bytes."""
+        payload = [self.value, self.ttl, self.etag, self.last_modified, self.expires_at]
+        return codec.dumps(payload, default=str)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CacheEntry":
+        """Deserialize an entry written by to_bytes."""
+        value, ttl, etag, last_modified, expires_at = codec.loads(data)
+        return cls(value, ttl, etag=etag, last_modified=last_modified, expires_at=expires_at)
+
+    def refreshed(self, ttl: float, headers: Optional[Mapping[str, str]] = None) -> "CacheEntry":
+        """
+        Get a fresh copy of this entry after a 304 Not Modified response.
+
+        Args:
+            ttl: Time to live for the refreshed entry (in seconds)
+            headers: Headers of the 304 response, which may carry updated validators
+
+        Returns:
+            A new entry sharing the already-decoded value
+        """
+        headers = headers or {}
+        return CacheEntry(
+            self.value,
+            ttl,
+            etag=headers.get("ETag") or self.etag,
+            last_modified=headers.get("Last-Modified") or self.last_modified,
+        )
+
+
+def _normalize_params(params: Any) -> List[Tuple[str, str]]:
+    """Flatten query parameters into a sorted list of string pairs, dropping None values like requests does."""
+    if not params:
+        return []
+    if isinstance(params, (str, bytes)):
+        if isinstance(params, bytes):
+            params = params.decode("utf-8")
+        items = parse_qsl(params, keep_blank_values=True)
+    else:
+        items = params.items() if isinstance(params, Mapping) else params
+    pairs = []
+    for key, value in items:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        pairs.extend((str(key), str(v)) for v in values if v is not None)
+    return sorted(pairs)
+
+
+def _normalize_url(url: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Lowercase the scheme and host and split off any query string."""
+    parts = urlsplit(url)
+    base = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, "", ""))
+    return base, _normalize_params(parts.query)
+
+
+def build_cache_key(
+    method: str,
+    url: str,
+    params: Any = None,
+    body: Any = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> str:
+    """
+    Build a canonical, fixed-size cache key for a request.
+
+    Logically identical requests produce the same key regardless of parameter
+    ordering or whether parameters were passed in the URL or separately. Headers,
+    including authentication headers, are part of the key so responses are never
+    shared across credentials.
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+        params: Query parameters (mapping, sequence of pairs, or query string)
+        body: Request body (JSON-serializable)
+        headers: Request headers
+
+    Returns:
+        A SHA-256 hex digest identifying the request
+    """
+    base_url, url_params = _normalize_url(url)
+    canonical: Dict[str, Any] = {
+        "method": method.upper(),
+        "url": base_url,
+        "params": sorted(url_params + _normalize_params(params)),
+        "body": body,
+        "headers": sorted((k.lower(), str(v)) for k, v in (headers or {}).items()),
+    }
+    # Always stdlib json: keys in a shared cache must match whichever codec each process has installed
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def cache_tag(url: str) -> str:
+    """
+    Get the invalidation tag for a URL: its scheme, host and path without query or trailing slash.
+
+    Cached GETs are indexed under the tag of their URL, so every page and filter
+    of a list endpoint shares one tag.
+    """
+    base_url, _ = _normalize_url(url)
+    return base_url.rstrip("/")
+
+
+def invalidation_tags(method: str, url: str) -> Tuple[List[str], List[str]]:
+    """
+    Get the cache tags a request invalidates.
+
+    A POST to a collection invalidates the collection's list pages. A PUT, PATCH
+    or DELETE of a record invalidates the record, its sub-resources and the list
+    pages of its parent collection. Safe methods invalidate nothing.
+
+    Args:
+        method: HTTP method
+        url: Full request URL
+
+    Returns:
+        Exact tags to invalidate, and tag prefixes whose entries should also be invalidated
+    """
+    method = method.upper()
+    if method in SAFE_METHODS:
+        return [], []
+    tag = cache_tag(url)
+    if method == "POST":
+        return [tag], []
+    return [tag, tag.rsplit("/", 1)[0]], [tag + "/"]
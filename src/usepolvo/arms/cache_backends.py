@@ -0,0 +1,371 @@
+# usepolvo/arms/cache_backends.py
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, Optional, Set, Tuple
+
+from cachetools import TLRUCache
+
+from usepolvo.arms.cache import CacheEntry
+from usepolvo.beak.enums import CacheBackend
+
+
+class BaseCacheBackend(ABC):
+    """
+    Storage for cached responses.
+
+    Backends store CacheEntry objects under cache keys and evict them once their
+    retention period has passed. Each entry may carry tags (see cache.cache_tag)
+    so writes can evict exactly the entries they affect. All backends are safe
+    to use from multiple threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get the entry stored under a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if it is missing or has been evicted
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, retention: float, tags: Iterable[str] = ()):
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+            retention: Seconds to keep the entry before evicting it
+            tags: Tags to index the entry under for invalidation
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> int:
+        """
+        Remove every entry indexed under the given tags.
+
+        Args:
+            tags: Tags to invalidate
+            prefixes: Tag prefixes; entries with any tag starting with one are also invalidated
+
+        Returns:
+            Number of entries removed
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Remove the entry stored under a key, if any.
+
+        Args:
+            key: Cache key
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry."""
+        pass
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-process LRU cache with per-entry retention. Entries are kept as objects and never serialized."""
+
+    def __init__(self, maxsize: int = 100):
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self._lock = threading.RLock()
+        # Items are (entry, evict_at, tags)
+        self._cache = TLRUCache(maxsize=maxsize, ttu=lambda key, item, now: item[1], timer=time.time)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._cache.get(key)
+        return item[0] if item is not None else None
+
+    def set(self, key: str, entry: CacheEntry, retention: float, tags: Iterable[str] = ()):
+        with self._lock:
+            self._cache[key] = (entry, time.time() + retention, frozenset(tags))
+
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> int:
+        tags, prefixes = set(tags), tuple(prefixes)
+        with self._lock:
+            # The cache is bounded by maxsize, so a scan is cheaper than keeping a separate index in sync
+            keys = [
+                key
+                for key, (_, _, entry_tags) in self._cache.items()
+                if entry_tags & tags or any(tag.startswith(prefixes) for tag in entry_tags)
+            ]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def default_cache_dir() -> str:
+    """
+    Get the per-user usepolvo cache directory ($XDG_CACHE_HOME/usepolvo or ~/.cache/usepolvo).
+
+    The directory is created readable by its owner only, as cached responses hold API data.
+
+    Raises:
+        PermissionError: If the directory exists but belongs to another user
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.path.join(base, "usepolvo")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid") and os.stat(directory).st_uid != os.getuid():
+        raise PermissionError(f"Cache directory {directory} is owned by another user")
+    os.chmod(directory, 0o700)
+    return directory
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    Disk-backed cache in a SQLite file.
+
+    Every process and thread opens its own connection to the same file, so all
+    workers on a node share one warm cache. The database runs in WAL mode so
+    readers never block each other or the writer. A new database file is created
+    readable by its owner only; SQLite gives its WAL files the same permissions.
+    """
+
+    def __init__(self, path: Optional[str] = None, maxsize: int = 100, timeout: float = 5.0):
+        """
+        Args:
+            path: Database file (defaults to cache.sqlite3 in default_cache_dir())
+            maxsize: Maximum number of entries kept; the oldest writes are evicted first
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path or os.path.join(default_cache_dir(), "cache.sqlite3")
+        try:
+            os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+        except FileExistsError:
+            pass
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, entry BLOB NOT NULL, evict_at REAL NOT NULL, stored_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (stored_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_tags (tag TEXT NOT NULL, key TEXT NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_tags_tag ON cache_tags (tag)")
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_tags_key ON cache_tags (key)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = (
+            self._connection()
+            .execute("SELECT entry FROM cache WHERE key = ? AND evict_at > ?", (key, time.time()))
+            .fetchone()
+        )
+        return CacheEntry.from_bytes(row[0]) if row else None
+
+    def set(self, key: str, entry: CacheEntry, retention: float, tags: Iterable[str] = ()):
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, entry, evict_at, stored_at) VALUES (?, ?, ?, ?)",
+                (key, entry.to_bytes(), now + retention, now),
+            )
+            conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            conn.executemany("INSERT INTO cache_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in set(tags)])
+            conn.execute("DELETE FROM cache WHERE evict_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            conn.execute("DELETE FROM cache_tags WHERE key NOT IN (SELECT key FROM cache)")
+
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> int:
+        tags, prefixes = list(tags), list(prefixes)
+        conditions = ["tag = ?"] * len(tags) + ["substr(tag, 1, ?) = ?"] * len(prefixes)
+        if not conditions:
+            return 0
+        params = tags + [value for prefix in prefixes for value in (len(prefix), prefix)]
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            keys = [
+                row[0]
+                for row in conn.execute(f"SELECT DISTINCT key FROM cache_tags WHERE {' OR '.join(conditions)}", params)
+            ]
+            conn.executemany("DELETE FROM cache WHERE key = ?", [(key,) for key in keys])
+            conn.executemany("DELETE FROM cache_tags WHERE key = ?", [(key,) for key in keys])
+        return len(keys)
+
+    def delete(self, key: str):
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            conn.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM cache")
+            conn.execute("DELETE FROM cache_tags")
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Cache in a networked key-value store shared by every process that points at it.
+
+    Works with any client exposing the redis-py get/set/delete/scan_iter and
+    sadd/smembers/pexpire interface. Each tag is a set of the cache keys under it,
+    and each tag's path parent keeps a set of its child tags, so invalidating a
+    prefix walks those sets instead of scanning the keyspace.
+    """
+
+    def __init__(self, client: Any, prefix: str = "usepolvo:cache:"):
+        """
+        Args:
+            client: A redis.Redis (or compatible) client
+            prefix: Prefix for every key this backend writes
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCacheBackend":
+        """Connect to the store at a redis:// URL. Requires the optional redis package."""
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("The redis cache backend requires the redis package: pip install redis") from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        data = self.client.get(self.prefix + key)
+        return CacheEntry.from_bytes(data) if data is not None else None
+
+    def set(self, key: str, entry: CacheEntry, retention: float, tags: Iterable[str] = ()):
+        retention_ms = max(int(retention * 1000), 1)
+        self.client.set(self.prefix + key, entry.to_bytes(), px=retention_ms)
+        for tag in set(tags):
+            self._add(self._tag_key(tag), key, retention_ms)
+            for parent, child in _tag_lineage(tag):
+                self._add(self._children_key(parent), child, retention_ms)
+
+    def _add(self, set_key: str, member: str, retention_ms: int):
+        self.client.sadd(set_key, member)
+        # Keep the set alive as long as its longest-lived entry (NX/GT need Redis 7)
+        if not self.client.pexpire(set_key, retention_ms, nx=True):
+            self.client.pexpire(set_key, retention_ms, gt=True)
+
+    def invalidate(self, tags: Iterable[str] = (), prefixes: Iterable[str] = ()) -> int:
+        tags = list(tags)
+        children_keys = []
+        # The tags under a prefix are the descendants of the tag it ends at: walk down the child sets
+        pending = [prefix.rstrip("/") for prefix in prefixes]
+        while pending:
+            children_key = self._children_key(pending.pop())
+            children = self._members(children_key)
+            children_keys.append(children_key)
+            tags.extend(children)
+            pending.extend(children)
+        if not tags:
+            return 0
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        keys = set()
+        for tag_key in tag_keys:
+            keys.update(self._members(tag_key))
+        self.client.delete(*tag_keys, *children_keys, *(self.prefix + key for key in keys))
+        return len(keys)
+
+    def _members(self, set_key: str) -> Set[str]:
+        return {k.decode("utf-8") if isinstance(k, bytes) else k for k in self.client.smembers(set_key)}
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _children_key(self, tag: str) -> str:
+        return f"{self.prefix}children:{tag}"
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def close(self):
+        self.client.close()
+
+
+def _tag_lineage(tag: str) -> Iterator[Tuple[str, str]]:
+    """Yield (parent, child) pairs up a tag's path, e.g. (.../accounts/1, .../accounts/1/contacts) first."""
+    root = tag.find("/", tag.find("//") + 2) if "//" in tag else 0
+    while True:
+        cut = tag.rfind("/")
+        if cut <= root:
+            return
+        parent = tag[:cut]
+        yield parent, tag
+        tag = parent
+
+
+def create_cache_backend(settings) -> BaseCacheBackend:
+    """
+    Build the cache backend selected by PolvoSettings.CACHE_BACKEND.
+
+    Args:
+        settings: PolvoSettings
+
+    Returns:
+        The configured cache backend
+    """
+    if settings.CACHE_BACKEND == CacheBackend.SQLITE:
+        return SQLiteCacheBackend(path=settings.CACHE_PATH, maxsize=settings.CACHE_SIZE)
+    if settings.CACHE_BACKEND == CacheBackend.REDIS:
+        if not settings.CACHE_URL:
+            raise ValueError("POLVO_CACHE_URL must be set to use the redis cache backend")
+        return RedisCacheBackend.from_url(settings.CACHE_URL)
+    return MemoryCacheBackend(maxsize=settings.CACHE_SIZE)
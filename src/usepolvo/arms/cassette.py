@@ -0,0 +1,412 @@
+# usepolvo/arms/cassette.py
+
+import atexit
+import base64
+import gzip
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from usepolvo.beak.enums import CassetteMode
+from usepolvo.beak.exceptions import CassetteError
+from usepolvo.ink import codec
+
+CASSETTE_VERSION = 1
+
+# Not replayed: bodies are stored decoded, and connection or cookie state belongs to the recording session
+SKIPPED_HEADERS = frozenset(
+    ["connection", "content-encoding", "content-length", "keep-alive", "set-cookie", "transfer-encoding"]
+)
+
+# Methods whose urllib3 `fields` are sent in the query string rather than the body
+URL_ENCODED_METHODS = frozenset(["DELETE", "GET", "HEAD", "OPTIONS"])
+
+REDACTED = "REDACTED"
+
+# Credentials never written to a cassette: response headers, and JSON fields or query parameters (lowercase)
+SENSITIVE_HEADERS = frozenset(["authorization", "cookie", "proxy-authorization", "x-api-key", "x-auth-token"])
+SENSITIVE_FIELDS = frozenset(
+    [
+        "access_token",
+        "api_key",
+        "apikey",
+        "client_secret",
+        "id_token",
+        "password",
+        "refresh_token",
+        "secret",
+        "token",
+    ]
+)
+
+
+def redact_query(url: str) -> str:
+    """Replace the values of sensitive query parameters (e.g. api_key) in a URL."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (name, REDACTED if name.lower() in SENSITIVE_FIELDS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+def _redact_fields(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key.lower() in SENSITIVE_FIELDS and item is not None else _redact_fields(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_fields(item) for item in value]
+    return value
+
+
+def redact_interaction(interaction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Default redaction of a recorded interaction: credentials are replaced by REDACTED.
+
+    Covers sensitive response headers, query parameters of the URL, and fields of JSON
+    bodies (e.g. the access and refresh tokens of an OAuth token response). Bodies
+    without sensitive fields are stored unchanged.
+    """
+    interaction["url"] = redact_query(interaction["url"])
+    interaction["headers"] = {
+        name: REDACTED if name.lower() in SENSITIVE_HEADERS else value for name, value in interaction["headers"].items()
+    }
+    if interaction["encoding"] == "utf-8":
+        try:
+            body = codec.loads(interaction["body"])
+        except ValueError:
+            return interaction
+        redacted = _redact_fields(body)
+        if redacted != body:
+            interaction["body"] = codec.dumps(redacted).decode("utf-8")
+    return interaction
+
+
+def request_key(method: str, url: str, body: Any = None, content_encoding: Optional[str] = None) -> str:
+    """
+    Identify a request for replay by its method, URL (with sorted query parameters) and a hash of its body.
+
+    Headers are ignored, so tokens, idempotency keys and user agents never stop a recording from matching;
+    neither do sensitive query parameters, which are redacted. Compressed bodies are hashed decompressed,
+    as gzip output differs between runs.
+    """
+    parts = urlsplit(redact_query(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {parts.scheme}://{parts.netloc}{parts.path}?{query}"
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)) and body:
+        if content_encoding == "gzip":
+            body = gzip.decompress(body)
+        elif content_encoding == "deflate":
+            body = zlib.decompress(body)
+        key += f" {hashlib.sha256(body).hexdigest()[:16]}"
+    return key
+
+
+def replayable(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Drop the response headers that do not apply to a replayed response."""
+    return {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}
+
+
+class Cassette:
+    """
+    Recorded HTTP interactions, replayed offline for deterministic tests and benchmarks.
+
+    In record mode requests reach the API and each response (status, headers, decoded body
+    and time taken) is stored under its request_key; in replay mode no request leaves the
+    process and responses come from the recording, optionally paced like the original.
+    Identical requests are replayed in the order they were recorded, the last one repeating
+    once they run out, so loops longer than the recording still replay.
+
+    The adapters returned by `adapter`, `pool_manager` and `httpx_client` put a cassette
+    beneath requests (BaseClient, auth, GraphQL, Stripe), urllib3 (HubSpot) and httpx
+    (OpenAI, Claude) respectively. Files ending in .gz are gzip-compressed.
+
+    Cassettes are plain files meant to be shared, and hold whatever the API answered:
+    tokens and credentials are redacted before an interaction is stored (see
+    redact_interaction), but record only accounts whose data may be shared, and pass a
+    `redact` hook to scrub anything else (e.g. personal data) from the responses.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: CassetteMode = CassetteMode.REPLAY,
+        time_scale: float = 1.0,
+        redact: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = redact_interaction,
+    ):
+        """
+        Args:
+            path: Cassette file to record to or replay from
+            mode: Whether to record or replay interactions
+            time_scale: Replayed responses take the recorded time multiplied by this (0 for no delay)
+            redact: Called with each recorded interaction (url, status, headers, body...) before it is
+                stored, returning the interaction to store; None stores responses verbatim
+
+        Raises:
+            CassetteError: If replaying and the file cannot be read
+        """
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.redact = redact
+        self.interactions: List[Dict[str, Any]] = []
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        if mode == CassetteMode.REPLAY:
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CassetteMode.REPLAY
+
+    def load(self):
+        """Read the interactions to replay from the cassette file."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            cassette = codec.loads(gzip.decompress(data) if self.path.endswith(".gz") else data)
+        except (OSError, ValueError) as e:
+            raise CassetteError(f"Cannot read cassette {self.path}: {e}")
+        if cassette.get("version") != CASSETTE_VERSION:
+            raise CassetteError(f"Unsupported cassette version {cassette.get('version')} in {self.path}")
+        with self._lock:
+            self.interactions = cassette["interactions"]
+            self._queues.clear()
+            for interaction in self.interactions:
+                self._queues[interaction["key"]].append(interaction)
+
+    def save(self):
+        """Write the recorded interactions to the cassette file, replacing it atomically."""
+        with self._lock:
+            data = codec.dumps({"version": CASSETTE_VERSION, "interactions": self.interactions})
+        if self.path.endswith(".gz"):
+            data = gzip.compress(data)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def record(
+        self, key: str, method: str, url: str, status: int, headers: Mapping[str, str], body: bytes, elapsed: float
+    ):
+        """Store a response received for the request identified by key (with replayable headers only), redacted."""
+        try:
+            text, encoding = body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+        interaction = {
+            "key": key,
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": dict(headers),
+            "body": text,
+            "encoding": encoding,
+            "elapsed": round(elapsed, 6),
+        }
+        if self.redact is not None:
+            interaction = self.redact(interaction)
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def play(self, key: str) -> Dict[str, Any]:
+        """
+        Get the next recorded response to a request, after waiting as long as the original took (scaled).
+
+        Raises:
+            CassetteError: If the request was never recorded
+        """
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded response to {key} in {self.path}")
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+        delay = interaction["elapsed"] * self.time_scale
+        if delay > 0:
+            time.sleep(delay)
+        return interaction
+
+    @staticmethod
+    def body(interaction: Dict[str, Any]) -> bytes:
+        """Get the decoded body of a recorded response."""
+        if interaction["encoding"] == "base64":
+            return base64.b64decode(interaction["body"])
+        return interaction["body"].encode("utf-8")
+
+    def adapter(self, **kwargs) -> "CassetteAdapter":
+        """Get a requests transport adapter that records to or replays from this cassette."""
+        return CassetteAdapter(self, **kwargs)
+
+    def pool_manager(self, pool_manager: Any) -> "CassettePoolManager":
+        """Wrap a urllib3 PoolManager so its requests are recorded or replayed."""
+        return CassettePoolManager(self, pool_manager)
+
+    def httpx_client(self):
+        """Get an httpx.Client whose requests are recorded or replayed, for SDKs built on httpx."""
+        import httpx
+
+        return httpx.Client(transport=CassetteTransport(self))
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.replaying:
+            self.save()
+
+
+class CassetteAdapter(HTTPAdapter):
+    """requests transport adapter backed by a cassette; recorded responses are read in full."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = request_key(request.method, request.url, request.body, request.headers.get("Content-Encoding"))
+        if self.cassette.replaying:
+            interaction = self.cassette.play(key)
+            status, headers, content = interaction["status"], interaction["headers"], Cassette.body(interaction)
+        else:
+            start = time.perf_counter()
+            response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            status, headers, content = response.status_code, replayable(response.headers), response.content
+            self.cassette.record(
+                key, request.method, request.url, status, headers, content, time.perf_counter() - start
+            )
+        return self.build_response(request, _urllib3_response(status, headers, content))
+
+
+class CassettePoolManager:
+    """urllib3 PoolManager stand-in backed by a cassette; other attributes come from the wrapped manager."""
+
+    def __init__(self, cassette: Cassette, pool_manager: Any):
+        self.cassette = cassette
+        self.wrapped = pool_manager
+
+    def request(self, method: str, url: str, body: Any = None, fields: Any = None, headers=None, **kwargs):
+        preload_content = kwargs.pop("preload_content", True)
+        if fields and method.upper() in URL_ENCODED_METHODS:
+            key = request_key(method, f"{url}{'&' if '?' in url else '?'}{urlencode(fields)}")
+        else:
+            key = request_key(method, url, urlencode(fields) if fields else body)
+        if self.cassette.replaying:
+            interaction = self.cassette.play(key)
+            return _urllib3_response(
+                interaction["status"], interaction["headers"], Cassette.body(interaction), preload_content
+            )
+
+        start = time.perf_counter()
+        response = self.wrapped.request(method, url, body=body, fields=fields, headers=headers, **kwargs)
+        headers, content = replayable(response.headers), response.data
+        self.cassette.record(key, method, url, response.status, headers, content, time.perf_counter() - start)
+        return _urllib3_response(response.status, headers, content, preload_content)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+class CassetteTransport:
+    """httpx transport backed by a cassette, recording through a regular httpx.HTTPTransport."""
+
+    def __init__(self, cassette: Cassette, transport: Any = None):
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request):
+        import httpx
+
+        key = request_key(request.method, str(request.url), request.read(), request.headers.get("Content-Encoding"))
+        if self.cassette.replaying:
+            interaction = self.cassette.play(key)
+            return httpx.Response(
+                interaction["status"],
+                headers=interaction["headers"],
+                content=Cassette.body(interaction),
+                request=request,
+            )
+
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        start = time.perf_counter()
+        response = self.transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        headers = replayable(response.headers)
+        elapsed = time.perf_counter() - start
+        self.cassette.record(key, request.method, str(request.url), response.status_code, headers, content, elapsed)
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _urllib3_response(status: int, headers: Mapping[str, str], body: bytes, preload_content: bool = False):
+    from urllib3 import HTTPResponse
+
+    return HTTPResponse(
+        body=io.BytesIO(body),
+        headers=dict(headers),
+        status=status,
+        preload_content=preload_content,
+        decode_content=False,
+    )
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(settings) -> Optional[Cassette]:
+    """
+    Get the cassette selected by PolvoSettings.CASSETTE, shared by every client of the process.
+
+    Recordings are saved when the process exits.
+
+    Args:
+        settings: PolvoSettings
+
+    Returns:
+        The cassette, or None when recording and replay are off
+    """
+    path: Optional[str] = getattr(settings, "CASSETTE", None)
+    if not path:
+        return None
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = Cassette(path, settings.CASSETTE_MODE, settings.CASSETTE_TIME_SCALE)
+            if not cassette.replaying:
+                atexit.register(cassette.save)
+            _cassettes[path] = cassette
+        return cassette
@@ -0,0 +1,253 @@
+# usepolvo/arms/circuit_breaker.py
+
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from usepolvo.arms.retry import error_status
+from usepolvo.beak.exceptions import CircuitOpenError, DeadlineExceededError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_failure(error: BaseException, transient_errors: Tuple[type, ...]) -> Optional[bool]:
+    """
+    Decide whether a failed call counts against the health of the API.
+
+    Args:
+        error: The exception raised by the call
+        transient_errors: Transport exceptions that indicate an unhealthy API
+
+    Returns:
+        True for 5xx responses and transport failures, False for other responses (the API
+        answered), or None for outcomes that say nothing about the API (e.g. a deadline set
+        by the caller running out)
+    """
+    if isinstance(error, (CircuitOpenError, DeadlineExceededError)):
+        return None
+    status = error_status(error)
+    if status is not None:
+        return status >= 500
+    return isinstance(error, transient_errors) or isinstance(error.__cause__, transient_errors)
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while an API is unhealthy.
+
+    Closed: calls go through, and the outcome of the last `window` calls is tracked.
+    Once at least `min_calls` have been seen and the failure rate (or the rate of calls
+    slower than `slow_call_duration`) reaches its threshold, the circuit opens.
+
+    Open: calls raise CircuitOpenError without touching the network or the rate
+    limiter, until `open_duration` seconds have passed.
+
+    Half-open: up to `half_open_calls` trial calls go through. If they all succeed the
+    circuit closes; any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        min_calls: int = 20,
+        window: int = 100,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+    ):
+        """
+        Args:
+            name: Name of the protected API (e.g. its host), used in errors and stats
+            failure_rate: Fraction of failed calls that opens the circuit
+            slow_call_duration: Calls slower than this (in seconds) count as slow, None to ignore latency
+            slow_call_rate: Fraction of slow calls that opens the circuit
+            min_calls: Calls to observe before the rates are evaluated
+            window: Number of most recent calls the rates are computed over
+            open_duration: Seconds to fail fast before letting trial calls through
+            half_open_calls: Trial calls that must succeed to close the circuit again
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self._lock = threading.Lock()
+        self._outcomes: deque = deque(maxlen=window)  # (failed, slow) per call
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0  # Trial calls started while half-open
+        self._trial_successes = 0
+        self._stats: Counter = Counter()
+
+    @property
+    def state(self) -> str:
+        """Get the current state: closed, open or half_open."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def check(self):
+        """
+        Fail fast if the circuit is open.
+
+        Call before spending anything on a request (e.g. rate-limit budget).
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == OPEN:
+                self._reject()
+
+    @contextmanager
+    def guard(self, classify: Callable[[BaseException], Optional[bool]]) -> Iterator[None]:
+        """
+        Run a call through the circuit and record its outcome and latency.
+
+        Args:
+            classify: Decides whether an exception raised by the call is a failure (see is_failure)
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial calls taken
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == OPEN or (self._state == HALF_OPEN and self._trials >= self.half_open_calls):
+                self._reject()
+            trial = self._state == HALF_OPEN
+            if trial:
+                self._trials += 1
+
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._record(classify(e), time.monotonic() - start, trial)
+            raise
+        self._record(False, time.monotonic() - start, trial)
+
+    def _record(self, failed: Optional[bool], duration: float, trial: bool):
+        slow = self.slow_call_duration is not None and duration > self.slow_call_duration
+        with self._lock:
+            if failed is None:
+                # Says nothing about the API; just give back the trial slot
+                if trial and self._state == HALF_OPEN:
+                    self._trials -= 1
+                return
+            self._stats["failures" if failed else "successes"] += 1
+            if slow:
+                self._stats["slow_calls"] += 1
+
+            if trial:
+                if self._state != HALF_OPEN:
+                    return
+                if failed or slow:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_calls:
+                        self._state = CLOSED
+                        self._outcomes.clear()
+                return
+
+            if self._state != CLOSED:
+                return
+            self._outcomes.append((failed, slow))
+            calls = len(self._outcomes)
+            if calls < self.min_calls:
+                return
+            failures = sum(1 for f, _ in self._outcomes if f)
+            slow_calls = sum(1 for _, s in self._outcomes if s)
+            if failures / calls >= self.failure_rate or (
+                self.slow_call_duration is not None and slow_calls / calls >= self.slow_call_rate
+            ):
+                self._open()
+
+    def _update_state(self):
+        """Move from open to half-open once open_duration has passed. Must hold the lock."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+
+    def _open(self):
+        """Must hold the lock."""
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self._stats["opened"] += 1
+
+    def _reject(self):
+        """Must hold the lock."""
+        self._stats["rejected"] += 1
+        retry_after = max(self.open_duration - (time.monotonic() - self._opened_at), 0.0)
+        raise CircuitOpenError(f"Circuit open for {self.name}", retry_after=retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get circuit metrics.
+
+        Returns:
+            The state, counts of successful, failed and slow calls, times the circuit opened
+            and calls rejected while open, and the failure rate over the current window
+        """
+        with self._lock:
+            self._update_state()
+            stats: Dict[str, Any] = {"state": self._state}
+            stats.update(
+                {key: self._stats[key] for key in ("successes", "failures", "slow_calls", "opened", "rejected")}
+            )
+            calls = len(self._outcomes)
+            stats["failure_rate"] = sum(1 for f, _ in self._outcomes if f) / calls if calls else 0.0
+            return stats
+
+
+class CircuitBreakerRegistry:
+    """Process-wide circuit breakers, one per API host, shared by every client talking to it."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, **config) -> CircuitBreaker:
+        """
+        Get the breaker for an API, creating it on first use.
+
+        Args:
+            name: Breaker key (e.g. the API host)
+            **config: CircuitBreaker settings, used only when the breaker is created
+
+        Returns:
+            The shared circuit breaker
+        """
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = self._breakers[name] = CircuitBreaker(name, **config)
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of every breaker, by name."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
+
+    def clear(self):
+        """Forget every breaker and its state."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Shared by all clients so every worker thread sees the same health for a host
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,129 @@
+# usepolvo/arms/compression.py
+
+import gzip
+import threading
+import zlib
+from collections import Counter
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+from usepolvo.beak.exceptions import ConfigurationError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+# Response encodings requests/urllib3 can decode: gzip and deflate, plus br and zstd when their packages are installed
+SYNC_ACCEPT_ENCODING = ACCEPT_ENCODING
+
+# Response encodings aiohttp can decode (it has no zstd support)
+ASYNC_ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=6),
+    "deflate": zlib.compress,
+}
+if brotli is not None:
+    _COMPRESSORS["br"] = lambda data: brotli.compress(data, quality=5)
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = lambda data: zstandard.ZstdCompressor().compress(data)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress a request body.
+
+    Args:
+        data: The encoded body
+        encoding: Content-Encoding to use (gzip, deflate, or br/zstd when installed)
+
+    Returns:
+        The compressed body
+
+    Raises:
+        ConfigurationError: If the encoding is unknown or its package is not installed
+    """
+    compressor = _COMPRESSORS.get(encoding)
+    if compressor is None:
+        raise ConfigurationError(
+            f"Unsupported request compression {encoding!r}; available: {', '.join(sorted(_COMPRESSORS))}"
+        )
+    return compressor(data)
+
+
+def wire_size(headers: Mapping[str, str], raw: Any = None) -> Optional[int]:
+    """
+    Get how many bytes of a compressed response crossed the network.
+
+    Args:
+        headers: Response headers
+        raw: The urllib3 response, whose read position counts the bytes received
+
+    Returns:
+        The compressed size, or None if it is not known
+    """
+    tell = getattr(raw, "tell", None)
+    if tell is not None:
+        size = tell()
+        if isinstance(size, int) and size > 0:
+            return size
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class CompressionStats:
+    """Counts the bytes saved by compressing requests and responses."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    def record_request(self, size: int, wire: int):
+        """Record a compressed request body: its original and compressed sizes."""
+        with self._lock:
+            self._stats["requests_compressed"] += 1
+            self._stats["request_bytes"] += size
+            self._stats["request_wire_bytes"] += wire
+
+    def record_response(self, headers: Mapping[str, str], size: int, wire: Optional[int]):
+        """Record a response body: its decoded size and, if it was compressed, its size on the wire."""
+        if wire is None or not headers.get("Content-Encoding"):
+            return
+        with self._lock:
+            self._stats["responses_compressed"] += 1
+            self._stats["response_bytes"] += size
+            self._stats["response_wire_bytes"] += wire
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get compression metrics.
+
+        Returns:
+            Counts and total original/wire bytes of compressed requests and responses,
+            and the compression ratio (original / wire) of each
+        """
+        with self._lock:
+            stats = {
+                key: self._stats[key]
+                for key in (
+                    "requests_compressed",
+                    "request_bytes",
+                    "request_wire_bytes",
+                    "responses_compressed",
+                    "response_bytes",
+                    "response_wire_bytes",
+                )
+            }
+        for kind in ("request", "response"):
+            wire = stats[f"{kind}_wire_bytes"]
+            stats[f"{kind}_ratio"] = stats[f"{kind}_bytes"] / wire if wire else None
+        return stats
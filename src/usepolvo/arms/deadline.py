@@ -0,0 +1,142 @@
+# usepolvo/arms/deadline.py
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from usepolvo.beak.exceptions import DeadlineExceededError
+
+T = TypeVar("T")
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+# Monotonic time by which the current call must finish; follows the call across threads started
+# with contextvars.copy_context() and across awaits in the same asyncio task
+_deadline: ContextVar[Optional[float]] = ContextVar("usepolvo_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Bound everything done inside the block to finish within `seconds`.
+
+    Auth refreshes, rate-limiter waits, retry backoff and every HTTP attempt made
+    by usepolvo clients in the block share the deadline. Nested scopes can only
+    shorten it.
+
+    Example:
+        with deadline_scope(5):
+            client.applications.list()
+
+    Args:
+        seconds: Time allowed from now, or None for no deadline
+    """
+    if seconds is None:
+        yield
+        return
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Get the seconds left before the current deadline, or None if there is no deadline."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def check_deadline(wait: float = 0.0):
+    """
+    Fail fast if the current deadline would pass before `wait` more seconds.
+
+    Args:
+        wait: Seconds the caller is about to spend (e.g. sleeping on a rate limit)
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed or would pass during the wait
+    """
+    left = remaining()
+    if left is not None and left <= wait:
+        raise DeadlineExceededError()
+
+
+def timeout_for(timeout: Timeout) -> Timeout:
+    """
+    Clamp a requests-style timeout to the current deadline.
+
+    Args:
+        timeout: Seconds, a (connect, read) tuple, or None
+
+    Returns:
+        The timeout, shortened so no socket operation outlives the deadline
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    check_deadline()
+    left = remaining()
+    if left is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        return tuple(left if part is None else min(part, left) for part in timeout)
+    return left if timeout is None else min(timeout, left)
+
+
+def within_deadline(items: Iterable[T]) -> Iterator[T]:
+    """
+    Bound the consumption of a lazy iterable (e.g. a streamed body) by the current deadline.
+
+    The deadline is captured when this is called, so it still applies after the scope
+    that set it has exited. It is checked before each item; a single slow read is bounded
+    by the socket timeout, which timeout_for already clamped.
+
+    Args:
+        items: The iterable to consume
+
+    Returns:
+        An iterator over `items` that raises DeadlineExceededError once the deadline passes
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return iter(items)
+    return _until(items, expires_at)
+
+
+def _until(items: Iterable[T], expires_at: float) -> Iterator[T]:
+    for item in items:
+        if time.monotonic() >= expires_at:
+            raise DeadlineExceededError()
+        yield item
+
+
+def awithin_deadline(items: AsyncIterable[T]) -> AsyncIterator[T]:
+    """Async variant of within_deadline (e.g. for aiohttp's response.content.iter_chunked())."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return items.__aiter__()
+    return _auntil(items, expires_at)
+
+
+async def _auntil(items: AsyncIterable[T], expires_at: float) -> AsyncIterator[T]:
+    async for item in items:
+        if time.monotonic() >= expires_at:
+            raise DeadlineExceededError()
+        yield item
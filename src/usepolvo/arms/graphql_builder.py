@@ -0,0 +1,111 @@
+from typing import Any, Dict, Tuple
+
+
+class GraphQLQueryBuilder:
+    """
+    Translates REST-style requests into GraphQL queries and mutations.
+    Shared by the sync and async GraphQL clients.
+    """
+
+    @staticmethod
+    def _is_mutation(query: str) -> bool:
+        """Check whether a GraphQL document is a mutation; queries are safe to retry."""
+        return query.lstrip().startswith("mutation")
+
+    def _convert_rest_to_graphql(self, method: str, endpoint: str, **kwargs) -> Tuple[str, Dict[str, Any]]:
+        """
+        Convert REST-style requests to GraphQL queries.
+
+        :param method: HTTP method
+        :param endpoint: The endpoint path
+        :param kwargs: Additional arguments
+        :return: Tuple of (query_string, variables)
+        """
+        parts = endpoint.strip("/").split("/")
+        resource_type = parts[0]
+        resource_id = parts[1] if len(parts) > 1 else None
+        request_payload = kwargs.get("json", {})
+        request_params = kwargs.get("params", {})
+
+        if method == "GET":
+            if resource_id:
+                return self._build_get_query(resource_type), {"id": resource_id}
+            return self._build_list_query(resource_type, request_params), request_params
+        elif method == "POST":
+            return self._build_create_mutation(resource_type), request_payload
+        elif method == "PUT":
+            return self._build_update_mutation(resource_type), {"id": resource_id, **request_payload}
+        elif method == "DELETE":
+            return self._build_delete_mutation(resource_type, resource_id), {"id": resource_id}
+
+        raise ValueError(f"Unsupported method: {method}")
+
+    def _build_get_query(self, resource_type: str) -> str:
+        """Build a GraphQL query for fetching a single resource."""
+        return f"""
+            query Get{resource_type.title()}($id: String!) {{
+                {resource_type}(id: $id) {{
+                    id
+                    {self._get_resource_fields(resource_type)}
+                }}
+            }}
+        """
+
+    def _build_list_query(self, resource_type: str, params: Dict[str, Any]) -> str:
+        """Build a GraphQL query for listing resources."""
+        return f"""
+            query List{resource_type.title()}s($first: Int, $after: String) {{
+                {resource_type}s(first: $first, after: $after) {{
+                    nodes {{
+                        id
+                        {self._get_resource_fields(resource_type)}
+                    }}
+                    pageInfo {{
+                        hasNextPage
+                        endCursor
+                    }}
+                }}
+            }}
+        """
+
+    def _build_create_mutation(self, resource_type: str) -> str:
+        """Build a GraphQL mutation for creating a resource."""
+        return f"""
+            mutation Create{resource_type.title()}($input: Create{resource_type.title()}Input!) {{
+                create{resource_type.title()}(input: $input) {{
+                    id
+                    {self._get_resource_fields(resource_type)}
+                }}
+            }}
+        """
+
+    def _build_update_mutation(self, resource_type: str) -> str:
+        """Build a GraphQL mutation for updating a resource."""
+        resource_title = resource_type.title()
+        return f"""
+            mutation {resource_title}Update($id: String!, $input: {resource_title}UpdateInput!) {{
+                {resource_type}Update(id: $id, input: $input) {{
+                    issue {{ id }}
+                }}
+            }}
+        """
+
+    def _build_delete_mutation(self, resource_type: str, resource_id: str) -> str:
+        """Build a GraphQL mutation for deleting a resource."""
+        return f"""
+            mutation Delete{resource_type.title()}($id: ID!) {{
+                delete{resource_type.title()}(id: $id) {{
+                    success
+                }}
+            }}
+        """
+
+    def _get_resource_fields(self, resource_type: str) -> str:
+        """
+        Get the fields to be queried for a specific resource type.
+        Should be overridden by child classes to specify fields for each resource.
+        """
+        return """
+            title
+            description
+        """
@@ -0,0 +1,70 @@
+# usepolvo/arms/graphql_schema.py
+
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from usepolvo.ink import codec
+
+
+class SchemaCache:
+    """
+    Introspected GraphQL schemas snapshotted on disk.
+
+    Snapshots are keyed by a hash of the endpoint, the tentacle's schema version and the
+    graphql-core version, so a schema change announced by bumping the version, or an
+    upgrade that changes the introspection format, never reuses a stale snapshot.
+    Files are replaced atomically and can be shared between processes.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Where snapshots are stored (defaults to usepolvo-graphql-schemas in the temp directory)
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "usepolvo-graphql-schemas")
+
+    def path(self, endpoint: str, version: str = "") -> str:
+        """Get the snapshot file of an endpoint's schema."""
+        from graphql import __version__ as graphql_version
+
+        key = hashlib.sha256(f"{endpoint}\n{version}\n{graphql_version}".encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, endpoint: str, version: str = "") -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Load a snapshot.
+
+        Returns:
+            The introspection result and the time it was saved, or None if there is no usable snapshot
+        """
+        try:
+            with open(self.path(endpoint, version), "rb") as f:
+                snapshot = codec.loads(f.read())
+            return snapshot["introspection"], snapshot["saved_at"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, endpoint: str, version: str, introspection: Dict[str, Any]):
+        """Save a snapshot of an introspection result."""
+        path = self.path(endpoint, version)
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {"endpoint": endpoint, "version": version, "saved_at": time.time(), "introspection": introspection}
+        # Write to a temporary file first so readers never see a partial snapshot
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(codec.dumps(snapshot))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def clear(self, endpoint: str, version: str = ""):
+        """Delete the snapshot of an endpoint's schema, if any."""
+        try:
+            os.remove(self.path(endpoint, version))
+        except FileNotFoundError:
+            pass
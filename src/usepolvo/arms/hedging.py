@@ -0,0 +1,334 @@
+# usepolvo/arms/hedging.py
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import Context, copy_context
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class LatencyTracker:
+    """Keeps a sliding window of recent request latencies and reports quantiles over it."""
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: Number of most recent latencies kept
+        """
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Get a latency quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+
+        Returns:
+            The latency in seconds, or None if nothing has been recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+
+class _Timer:
+    """Runs callbacks at given monotonic times on a single daemon thread."""
+
+    def __init__(self):
+        self._queue: List[list] = []  # Heap of [when, sequence, callback]; a cancelled entry has no callback
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> list:
+        """Schedule callback to run at monotonic time `when`, returning a handle for cancel()."""
+        entry = [when, next(self._sequence), callback]
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="usepolvo-hedge-timer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return entry
+
+    def cancel(self, entry: list):
+        with self._condition:
+            entry[2] = None
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue and self._queue[0][2] is None:
+                        heapq.heappop(self._queue)
+                        continue
+                    wait = self._queue[0][0] - time.monotonic() if self._queue else None
+                    if wait is not None and wait <= 0:
+                        break
+                    self._condition.wait(wait)
+                if self._closed:
+                    return
+                callback = heapq.heappop(self._queue)[2]
+            callback()
+
+
+class _Race:
+    """State shared by a synchronous request and the timer that may hedge it."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.finished = False
+        self.hedge: Optional[Future] = None
+
+    def finish(self) -> Optional[Future]:
+        """Mark the first copy as returned, so no hedge starts after it, and get the hedge if one started."""
+        with self.lock:
+            self.finished = True
+            return self.hedge
+
+
+class Hedger:
+    """
+    Cuts tail latency by racing a second copy of slow requests.
+
+    A request that has not answered within the observed latency quantile (p95 by
+    default) is sent again. Only about 1 - quantile of requests are ever hedged,
+    so the extra load stays small. Callers must only hedge requests that are safe
+    to repeat, and can veto each hedge (e.g. when the rate limiter has no free slot
+    for it) with `admit`.
+
+    Asyncio callers get whichever copy succeeds first. Synchronous callers send the
+    first copy on their own thread, so they cannot return before it does: there the
+    hedge, sent from a small worker pool, answers for a first copy that fails or
+    stalls until its timeout.
+    """
+
+    def __init__(self, quantile: float = 0.95, min_samples: int = 20, max_workers: int = 10):
+        """
+        Args:
+            quantile: Latency quantile after which a request is hedged
+            min_samples: Latencies to observe before hedging starts
+            max_workers: Threads sending hedges of synchronous requests; no hedge waits for one
+        """
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.latencies = LatencyTracker()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._timer: Optional[_Timer] = None
+        self._hedges_in_flight = 0
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    def delay(self) -> Optional[float]:
+        """Get how long to wait before hedging, or None until enough latencies have been observed."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        return self.latencies.quantile(self.quantile)
+
+    def call(
+        self,
+        func: Callable[[], Any],
+        hedge_func: Optional[Callable[[], Any]] = None,
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        Call func on this thread, sending a second copy from a worker if it is slow.
+
+        Args:
+            func: Function sending one copy of the request
+            hedge_func: Function sending the second copy, defaults to func
+            admit: Called when the request turns slow; returning False skips the hedge
+
+        Returns:
+            The result of func, or of the hedge if func failed and the hedge succeeded
+        """
+        start = time.monotonic()
+        self._count("requests")
+        delay = self.delay()
+        if delay is None:
+            result = func()
+            self.latencies.record(time.monotonic() - start)
+            return result
+
+        race = _Race()
+        # Copy the context so deadlines follow the request into the worker thread
+        launch = partial(self._launch_hedge, race, copy_context(), hedge_func or func, admit)
+        timer = self._get_timer()
+        handle = timer.call_at(start + delay, launch)
+        try:
+            result = func()
+        except Exception as e:
+            hedge = race.finish()
+            if hedge is None:
+                raise
+            try:
+                result = hedge.result()
+            except Exception:
+                raise e
+            self._count("hedge_wins")
+        else:
+            hedge = race.finish()
+            if hedge is not None:
+                hedge.add_done_callback(_close_result)
+        finally:
+            timer.cancel(handle)
+        self.latencies.record(time.monotonic() - start)
+        return result
+
+    def _launch_hedge(
+        self, race: _Race, context: Context, func: Callable[[], Any], admit: Optional[Callable[[], bool]]
+    ):
+        """Send the hedge of a request that is still running, unless no worker is free or admit refuses."""
+        with race.lock:
+            if race.finished:
+                return
+            with self._lock:
+                free = self._hedges_in_flight < self.max_workers
+                if free:
+                    self._hedges_in_flight += 1
+            if not free:
+                self._count("skipped")
+                return
+            if not self._admit(admit):
+                self._hedge_done()
+                return
+            self._count("hedged")
+            race.hedge = self._get_executor().submit(context.run, self._run_hedge, func)
+
+    def _run_hedge(self, func: Callable[[], Any]) -> Any:
+        try:
+            return func()
+        finally:
+            self._hedge_done()
+
+    def _hedge_done(self):
+        with self._lock:
+            self._hedges_in_flight -= 1
+
+    async def async_call(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        hedge_func: Optional[Callable[[], Awaitable[Any]]] = None,
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """Awaitable variant of call that returns the first copy to succeed; the slower one is cancelled."""
+        start = time.monotonic()
+        self._count("requests")
+        delay = self.delay()
+        if delay is None:
+            result = await func()
+            self.latencies.record(time.monotonic() - start)
+            return result
+
+        primary = asyncio.ensure_future(func())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                pending = set()
+                result = primary.result()
+            elif not self._admit(admit):
+                pending = set()
+                result = await primary
+            else:
+                self._count("hedged")
+                hedge = asyncio.ensure_future((hedge_func or func)())
+                pending.add(hedge)
+                result = await self._first_success(pending, hedge)
+            self.latencies.record(time.monotonic() - start)
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _first_success(self, pending: set, hedge: asyncio.Future) -> Any:
+        """Wait for the first task in `pending` to succeed, removing finished tasks from it."""
+        error: Optional[BaseException] = None
+        while pending:
+            done, remaining = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge:
+                        self._count("hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    def _admit(self, admit: Optional[Callable[[], bool]]) -> bool:
+        if admit is None or admit():
+            return True
+        self._count("skipped")
+        return False
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="usepolvo-hedge")
+            return self._executor
+
+    def _get_timer(self) -> _Timer:
+        with self._lock:
+            if self._timer is None:
+                self._timer = _Timer()
+            return self._timer
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hedging metrics.
+
+        Returns:
+            Counts of requests, requests that were hedged, hedges whose answer was returned and
+            hedges skipped because `admit` refused them or no worker was free, plus the current
+            hedging delay in seconds (None while warming up)
+        """
+        with self._lock:
+            stats = {key: self._stats[key] for key in ("requests", "hedged", "hedge_wins", "skipped")}
+        stats["delay"] = self.delay()
+        return stats
+
+    def close(self):
+        """Stop the threads used for synchronous hedging."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _close_result(future: Future):
+    """Release the response of a request that lost the race."""
+    if future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,92 @@
+# usepolvo/arms/hooks.py
+
+import threading
+import warnings
+from typing import Any, Callable, Dict, List
+
+from usepolvo.beak.exceptions import ConfigurationError
+from usepolvo.ink import codec
+
+# Request lifecycle events and the keyword arguments their callbacks receive (all also get `client`):
+#   on_request(method, url)                     an attempt is about to be sent
+#   on_response(method, url, status, duration, bytes_in, bytes_out, error)
+#                                               an attempt finished; status is None if no response arrived
+#   on_retry(method, url, attempt, delay, error)  a failed attempt will be retried after `delay` seconds
+#   on_rate_limit_wait(seconds)                 time spent waiting on the rate limiter before an attempt
+#   on_cache_hit(method, url) / on_cache_miss(method, url)  a cacheable GET was (not) served from the cache
+EVENTS = ("on_request", "on_response", "on_retry", "on_rate_limit_wait", "on_cache_hit", "on_cache_miss")
+
+
+class Hooks:
+    """Callbacks registered for request lifecycle events."""
+
+    def __init__(self):
+        self._callbacks: Dict[str, List[Callable[..., Any]]] = {event: [] for event in EVENTS}
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return any(self._callbacks.values())
+
+    def register(self, event: str, callback: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Call `callback` with keyword arguments whenever `event` happens.
+
+        Args:
+            event: One of EVENTS
+            callback: Called with `client` and the event's keyword arguments
+
+        Returns:
+            The callback
+
+        Raises:
+            ConfigurationError: If the event is unknown
+        """
+        if event not in self._callbacks:
+            raise ConfigurationError(f"Unknown hook {event!r}; available: {', '.join(EVENTS)}")
+        with self._lock:
+            # Copy on write so emit can iterate without the lock
+            self._callbacks[event] = self._callbacks[event] + [callback]
+        return callback
+
+    def unregister(self, event: str, callback: Callable[..., Any]):
+        """Stop calling `callback` for `event`."""
+        with self._lock:
+            self._callbacks[event] = [registered for registered in self._callbacks[event] if registered != callback]
+
+    def subscribe(self, handler: Any):
+        """Register every method of `handler` named after an event (e.g. a MetricsCollector)."""
+        for event in EVENTS:
+            callback = getattr(handler, event, None)
+            if callback is not None:
+                self.register(event, callback)
+
+    def unsubscribe(self, handler: Any):
+        """Unregister the methods registered by subscribe."""
+        for event in EVENTS:
+            callback = getattr(handler, event, None)
+            if callback is not None:
+                self.unregister(event, callback)
+
+    def emit(self, event: str, **info):
+        """
+        Call the callbacks of an event.
+
+        A failing callback is reported as a warning and never fails the request.
+        """
+        for callback in self._callbacks[event]:
+            try:
+                callback(**info)
+            except Exception as e:
+                warnings.warn(f"{event} hook {callback!r} failed: {e!r}", RuntimeWarning, stacklevel=2)
+
+
+def body_size(kwargs: Dict[str, Any]) -> int:
+    """Get the size in bytes of the body of a request, from its requests-style keyword arguments."""
+    data = kwargs.get("data")
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode())
+    if kwargs.get("json") is not None:
+        return len(codec.dumps(kwargs["json"]))
+    return 0
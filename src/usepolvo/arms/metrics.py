@@ -0,0 +1,262 @@
+# usepolvo/arms/metrics.py
+
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that are record IDs rather than part of the route: anything with a digit, except API versions
+_VERSION = re.compile(r"^v\d+(\.\d+)*$", re.IGNORECASE)
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Get the route of a URL with record IDs replaced by {id}, to keep metric labels few.
+
+    Example:
+        https://api.certn.co/hr/v1/applicants/4f1c.../ -> /hr/v1/applicants/{id}/
+    """
+    segments = urlsplit(url).path.split("/")
+    return "/".join(
+        "{id}" if any(c.isdigit() for c in segment) and not _VERSION.match(segment) else segment for segment in segments
+    )
+
+
+def tentacle_name(client: Any) -> str:
+    """Get the tentacle a client belongs to from its class name (e.g. AsyncCertnClient -> certn)."""
+    name = type(client).__name__
+    if name.startswith("Async"):
+        name = name[len("Async") :]
+    if name.endswith("Client"):
+        name = name[: -len("Client")]
+    return name.lower() or "client"
+
+
+class Histogram:
+    """Counts observations into cumulative buckets, Prometheus style."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last slot counts observations above every bucket
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Get (upper bound, observations at or below it) pairs, ending with +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip([*map(_format_number, self.buckets), "+Inf"], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket it falls in (None if empty or above every bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return None
+
+
+class MetricsCollector:
+    """
+    Collects request metrics from client hooks.
+
+    Tracks latency histograms per tentacle, method, endpoint route and status, bytes sent
+    and received, retries, cache hits and misses, and time spent waiting on rate limiters.
+    Subscribe it to one or more clients with `client.enable_metrics(collector)`, then read
+    it with `snapshot()` or export it with `to_prometheus()`.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            buckets: Upper bounds of the latency histogram buckets, in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self._totals: Dict[str, Counter] = defaultdict(Counter)
+        self._rate_limit_wait: Dict[str, float] = defaultdict(float)
+
+    # Hook handlers
+
+    def on_response(
+        self,
+        client: Any,
+        method: str,
+        url: str,
+        status: Optional[int],
+        duration: float,
+        bytes_in: Optional[int],
+        bytes_out: int,
+        error: Optional[BaseException] = None,
+    ):
+        tentacle = tentacle_name(client)
+        key = (tentacle, method, endpoint_template(url), str(status) if status is not None else "error")
+        with self._lock:
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.buckets)
+            histogram.observe(duration)
+            totals = self._totals[tentacle]
+            totals["requests"] += 1
+            if status is None or status >= 400:
+                totals["errors"] += 1
+            totals["bytes_in"] += bytes_in or 0
+            totals["bytes_out"] += bytes_out
+
+    def on_retry(self, client: Any, **info):
+        with self._lock:
+            self._totals[tentacle_name(client)]["retries"] += 1
+
+    def on_rate_limit_wait(self, client: Any, seconds: float):
+        tentacle = tentacle_name(client)
+        with self._lock:
+            self._rate_limit_wait[tentacle] += seconds
+            if seconds > 0.001:
+                self._totals[tentacle]["rate_limit_waits"] += 1
+
+    def on_cache_hit(self, client: Any, **info):
+        with self._lock:
+            self._totals[tentacle_name(client)]["cache_hits"] += 1
+
+    def on_cache_miss(self, client: Any, **info):
+        with self._lock:
+            self._totals[tentacle_name(client)]["cache_misses"] += 1
+
+    # Export
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get every metric as plain data.
+
+        Returns:
+            "tentacles": per-tentacle totals (requests, errors, retries, bytes in/out, cache
+            hits/misses and hit ratio, rate-limit waits and seconds spent waiting);
+            "requests": one entry per tentacle/method/endpoint/status with its count, total
+            seconds, p50/p95/p99 latency estimates (bucket upper bounds) and cumulative buckets
+        """
+        with self._lock:
+            tentacles = {}
+            for tentacle in sorted(set(self._totals) | set(self._rate_limit_wait)):
+                totals = self._totals[tentacle]
+                stats = {
+                    key: totals[key]
+                    for key in (
+                        "requests",
+                        "errors",
+                        "retries",
+                        "bytes_in",
+                        "bytes_out",
+                        "cache_hits",
+                        "cache_misses",
+                        "rate_limit_waits",
+                    )
+                }
+                lookups = stats["cache_hits"] + stats["cache_misses"]
+                stats["cache_hit_ratio"] = stats["cache_hits"] / lookups if lookups else None
+                stats["rate_limit_wait_seconds"] = self._rate_limit_wait[tentacle]
+                tentacles[tentacle] = stats
+
+            requests = [
+                {
+                    "tentacle": tentacle,
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": status,
+                    "count": histogram.count,
+                    "total_seconds": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": dict(histogram.cumulative()),
+                }
+                for (tentacle, method, endpoint, status), histogram in sorted(self._latency.items())
+            ]
+        return {"tentacles": tentacles, "requests": requests}
+
+    def to_prometheus(self, prefix: str = "usepolvo") -> str:
+        """
+        Export every metric in the Prometheus text exposition format.
+
+        Args:
+            prefix: Prefix of the metric names
+
+        Returns:
+            The metrics, ready to be served on a /metrics endpoint
+        """
+        lines: List[str] = []
+        with self._lock:
+            name = f"{prefix}_request_duration_seconds"
+            lines += [f"# HELP {name} Duration of HTTP attempts.", f"# TYPE {name} histogram"]
+            for (tentacle, method, endpoint, status), histogram in sorted(self._latency.items()):
+                labels = _labels(tentacle=tentacle, method=method, endpoint=endpoint, status=status)
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            counters = (
+                ("requests", "requests_total", "HTTP attempts."),
+                ("errors", "request_errors_total", "HTTP attempts that failed or returned an error status."),
+                ("retries", "retries_total", "Attempts retried after a failure."),
+                ("bytes_out", "request_bytes_total", "Request body bytes sent."),
+                ("bytes_in", "response_bytes_total", "Response body bytes received."),
+                ("cache_hits", "cache_hits_total", "Cacheable GETs served from the cache."),
+                ("cache_misses", "cache_misses_total", "Cacheable GETs sent to the API."),
+                ("rate_limit_waits", "rate_limit_waits_total", "Attempts delayed by a rate limiter."),
+            )
+            for key, suffix, description in counters:
+                name = f"{prefix}_{suffix}"
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+                for tentacle in sorted(self._totals):
+                    lines.append(f"{name}{{{_labels(tentacle=tentacle)}}} {self._totals[tentacle][key]}")
+
+            name = f"{prefix}_rate_limit_wait_seconds_total"
+            lines += [f"# HELP {name} Time spent waiting on rate limiters.", f"# TYPE {name} counter"]
+            for tentacle in sorted(self._rate_limit_wait):
+                value = _format_number(self._rate_limit_wait[tentacle])
+                lines.append(f"{name}{{{_labels(tentacle=tentacle)}}} {value}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Forget every metric collected so far."""
+        with self._lock:
+            self._latency.clear()
+            self._totals.clear()
+            self._rate_limit_wait.clear()
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in labels.items()
+    )
+    return ",".join(f'{key}="{value}"' for key, value in escaped)
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value))
+
+
+# Shared by every client when POLVO_METRICS is enabled
+metrics = MetricsCollector()
@@ -0,0 +1,294 @@
+# usepolvo/arms/pagination.py
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from usepolvo.beak.enums import PaginationMethod
+
+
+class PageRequest(NamedTuple):
+    """Position of a page: its number and, for cursor pagination, the cursor returned by the previous page."""
+
+    page: int = 1
+    cursor: Optional[str] = None
+
+
+# A fetched page: its records and the request for the next page, or None after the last page
+PageResult = Tuple[List[Any], Optional[PageRequest]]
+
+
+class Paginator:
+    """
+    Builds page requests and parses page responses for one list endpoint.
+
+    Offset and page-number strategies (PaginationMethod.OFFSET_LIMIT, PAGE, PAGE_SIZE)
+    ask the client for each page number's parameters. They stop on an empty page, once
+    the total under `count_key` has been read, when the `next_key` link runs out, or, for
+    responses reporting neither, after a short page. APIs capping the page size below
+    `size` are detected from a short first page that is not the last: later pages are
+    then requested at the capped size, so offsets and page numbers line up.
+    PaginationMethod.CURSOR follows the cursor found under `next_key` in each response;
+    a cursor that is an absolute URL (a "next" link) is requested as-is.
+
+    When responses carry the total record count under `count_key`, every page of an
+    offset or page-number endpoint is known after the first one and can be fetched in parallel.
+    """
+
+    def __init__(
+        self,
+        client,
+        endpoint: str,
+        size: int,
+        params: Optional[Dict[str, Any]] = None,
+        records_key: Optional[str] = None,
+        next_key: str = "next",
+        count_key: Optional[str] = None,
+        schema: Optional[Type] = None,
+    ):
+        """
+        Args:
+            client: The client whose pagination method and parameters are used
+            endpoint: List endpoint
+            size: Records per page
+            params: Extra query parameters sent with every page (e.g. filters)
+            records_key: Response key holding the records, None if the response is the list itself
+            next_key: Response key holding the next cursor (cursor pagination)
+            count_key: Response key holding the total number of records, None if the API does not report it
+            schema: Model each record is validated against, None to yield raw records
+        """
+        self.client = client
+        self.endpoint = endpoint
+        self.size = size
+        self.params = params or {}
+        self.records_key = records_key
+        self.next_key = next_key
+        self.count_key = count_key
+        self.schema = schema
+
+    @property
+    def cursor_based(self) -> bool:
+        return self.client.pagination_method == PaginationMethod.CURSOR
+
+    def request(self, page: PageRequest) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Get the endpoint and query parameters of a page.
+
+        Args:
+            page: Position of the page
+
+        Returns:
+            The endpoint and its query parameters
+        """
+        if page.cursor and page.cursor.startswith(("http://", "https://")):
+            # A "next" link already carries every parameter
+            return page.cursor, None
+        if self.cursor_based:
+            return self.endpoint, {
+                **self.params,
+                **self.client.get_pagination_params(size=self.size, cursor=page.cursor),
+            }
+        return self.endpoint, {**self.params, **self.client.get_pagination_params(page.page, self.size)}
+
+    def parse(self, page: PageRequest, response: Any) -> PageResult:
+        """
+        Get the records of a page and the request for the next one.
+
+        Args:
+            page: Position of the page
+            response: Decoded response of the page
+
+        Returns:
+            The (validated) records and the next page's request, or None after the last page
+        """
+        records = response if self.records_key is None else (response.get(self.records_key) or [])
+        if self.schema is not None:
+            records = [self.schema(**record) for record in records]
+
+        if self.cursor_based:
+            cursor = response.get(self.next_key) if isinstance(response, dict) else None
+            return records, PageRequest(page.page + 1, str(cursor)) if cursor else None
+        if not records:
+            return records, None
+        count = response.get(self.count_key) if self.count_key and isinstance(response, dict) else None
+        if count is not None:
+            more = (page.page - 1) * self.size + len(records) < int(count)
+        elif isinstance(response, dict) and self.next_key in response:
+            more = bool(response[self.next_key])
+        else:
+            # A short first page may only mean the API caps the page size: ask for one more page
+            more = len(records) >= self.size or page.page == 1
+        if more and page.page == 1 and len(records) < self.size:
+            self.size = len(records)
+        return records, PageRequest(page.page + 1) if more else None
+
+    def total_pages(self, response: Any) -> Optional[int]:
+        """
+        Get the number of pages from the total count reported in a response.
+
+        Args:
+            response: Decoded response of any page
+
+        Returns:
+            The number of pages, or None if they cannot be known up front (no count, or cursor pagination)
+        """
+        if self.cursor_based or self.count_key is None or not isinstance(response, dict):
+            return None
+        count = response.get(self.count_key)
+        if count is None:
+            return None
+        return max(-(-int(count) // self.size), 1)
+
+
+def iter_pages(
+    fetch: Callable[[PageRequest], PageResult], prefetch: bool = True, start: PageRequest = PageRequest()
+) -> Iterator[List[Any]]:
+    """
+    Yield pages until the last one, optionally fetching the next page while the current one is consumed.
+
+    At most two pages are held at once, so scans of any size use bounded memory.
+
+    Args:
+        fetch: Fetches one page and returns its records and the next page's request
+        prefetch: Fetch page N+1 on a worker thread while page N is being consumed
+        start: First page to fetch
+
+    Yields:
+        The records of each page
+    """
+    request: Optional[PageRequest] = start
+    if not prefetch:
+        while request is not None:
+            records, request = fetch(request)
+            yield records
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usepolvo-prefetch")
+    # Copy the context so deadlines follow the fetch into the worker thread
+    future: Optional[Future] = executor.submit(copy_context().run, fetch, request)
+    try:
+        while future is not None:
+            records, request = future.result()
+            future = executor.submit(copy_context().run, fetch, request) if request is not None else None
+            yield records
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[PageRequest], Awaitable[PageResult]], prefetch: bool = True, start: PageRequest = PageRequest()
+) -> AsyncIterator[List[Any]]:
+    """Async variant of iter_pages; the next page is fetched in a task while the current one is consumed."""
+    request: Optional[PageRequest] = start
+    if not prefetch:
+        while request is not None:
+            records, request = await fetch(request)
+            yield records
+        return
+
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch(request))
+    try:
+        while task is not None:
+            records, request = await task
+            task = asyncio.ensure_future(fetch(request)) if request is not None else None
+            yield records
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def fan_out(
+    fetch: Callable[[PageRequest], PageResult], pages: Iterable[PageRequest], workers: int, ordered: bool = True
+) -> Iterator[List[Any]]:
+    """
+    Fetch known pages concurrently and yield their records.
+
+    At most `workers` pages are in flight or waiting to be consumed at once, so memory
+    stays bounded however many pages there are. Requests still pass through the
+    client's rate limiter, which every worker shares.
+
+    Args:
+        fetch: Fetches one page and returns its records and the next page's request
+        pages: Pages to fetch, in order
+        workers: Pages fetched concurrently
+        ordered: Yield pages in order; otherwise yield each page as soon as it arrives
+
+    Yields:
+        The records of each page
+    """
+    pending = iter(pages)
+    in_flight: List[Future] = []
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="usepolvo-scan")
+
+    def submit():
+        request = next(pending, None)
+        if request is not None:
+            # Copy the context so deadlines follow the fetch into the worker thread
+            in_flight.append(executor.submit(copy_context().run, fetch, request))
+
+    try:
+        for _ in range(workers):
+            submit()
+        while in_flight:
+            if ordered:
+                future = in_flight.pop(0)
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = next(f for f in in_flight if f in done)
+                in_flight.remove(future)
+            records, _ = future.result()
+            submit()
+            yield records
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def afan_out(
+    fetch: Callable[[PageRequest], Awaitable[PageResult]],
+    pages: Iterable[PageRequest],
+    workers: int,
+    ordered: bool = True,
+) -> AsyncIterator[List[Any]]:
+    """Async variant of fan_out; pages are fetched in concurrent tasks."""
+    pending = iter(pages)
+    in_flight: List[asyncio.Future] = []
+
+    def submit():
+        request = next(pending, None)
+        if request is not None:
+            in_flight.append(asyncio.ensure_future(fetch(request)))
+
+    try:
+        for _ in range(workers):
+            submit()
+        while in_flight:
+            if ordered:
+                task = in_flight.pop(0)
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                task = next(t for t in in_flight if t in done)
+                in_flight.remove(task)
+            records, _ = await task
+            submit()
+            yield records
+    finally:
+        for task in in_flight:
+            task.cancel()
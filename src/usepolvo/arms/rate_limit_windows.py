@@ -0,0 +1,234 @@
+# usepolvo/arms/rate_limit_windows.py
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+
+from usepolvo.arms.deadline import check_deadline
+from usepolvo.beak.enums import RateLimitAlgorithm
+from usepolvo.beak.exceptions import RateLimitRejectedError
+
+
+class RateLimitWindow(ABC):
+    """
+    Admission state of one rate limit: at most `limit` requests every `time_frame` seconds.
+
+    Limits are passed on every call rather than stored, as rate limiters may change them at
+    runtime (e.g. from response headers). Each window has its own lock; `reserve` is the
+    thread-safe entry point, `delay` and `admit` are only called under the lock.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Latest slot handed out; no later caller is admitted before it
+        self.reserved = 0.0
+
+    def reserve(self, now: float, limit: int, time_frame: float, max_wait: Optional[float] = None) -> float:
+        """
+        Claim the next slot for a request made at `now` and get the time it may be sent.
+
+        Slots are handed out in the order callers reach the window, each no earlier than the
+        one before, so waiters are admitted first in, first out. The lock is only held to
+        compute the slot: callers sleep until it without blocking anyone else.
+
+        :param max_wait: Longest wait (in seconds) the caller accepts, None for no limit
+        :return: When the request may be sent (`now` if immediately)
+        :raises RateLimitRejectedError: If the slot is more than max_wait away, or the limit is not
+            positive (no request is ever allowed); nothing is claimed
+        :raises DeadlineExceededError: If the slot comes after the caller's deadline; nothing is claimed
+        """
+        if limit <= 0:
+            raise RateLimitRejectedError(f"Rate limit allows no requests ({limit} per {time_frame:g}s)")
+        with self.lock:
+            at = max(now, self.reserved)
+            ready = at + self.delay(at, limit, time_frame)
+            if max_wait is not None and ready - now > max_wait:
+                raise RateLimitRejectedError(retry_after=round(ready - now, 3))
+            if ready > now:
+                # Fail now rather than sleep past the caller's deadline
+                check_deadline(ready - now)
+            self.admit(ready, limit, time_frame)
+            self.reserved = ready
+            return ready
+
+    @abstractmethod
+    def delay(self, now: float, limit: int, time_frame: float) -> float:
+        """
+        Get how long a request made at `now` has to wait to be admitted.
+
+        :return: The wait in seconds, 0 if the request can be made immediately
+        """
+        pass
+
+    @abstractmethod
+    def admit(self, now: float, limit: int, time_frame: float):
+        """Count a request made at `now`."""
+        pass
+
+    def release(self, slot: float, limit: int, time_frame: float):
+        """Give back a reserved slot whose request will not be sent."""
+        with self.lock:
+            self._forget(slot, limit, time_frame)
+
+    @abstractmethod
+    def _forget(self, slot: float, limit: int, time_frame: float):
+        """Undo `admit` of a request at `slot`, as far as the window's state allows."""
+        pass
+
+
+class LogWindow(RateLimitWindow):
+    """
+    Exact sliding log: one timestamp per request made in the last time frame.
+
+    The default, as it never admits more than the limit in any rolling window. Memory and
+    cleanup grow with the limit (100,000 floats for a daily Salesforce window); the other
+    windows trade some accuracy for constant memory.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.requests: deque = deque()
+
+    def _clean(self, now: float, time_frame: float):
+        cutoff = now - time_frame
+        while self.requests and self.requests[0] <= cutoff:
+            self.requests.popleft()
+
+    def delay(self, now: float, limit: int, time_frame: float) -> float:
+        self._clean(now, time_frame)
+        if len(self.requests) < limit:
+            return 0.0
+        return max(time_frame - (now - self.requests[-limit]), 0.0)
+
+    def admit(self, now: float, limit: int, time_frame: float):
+        self._clean(now, time_frame)
+        self.requests.append(now)
+
+    def _forget(self, slot: float, limit: int, time_frame: float):
+        try:
+            self.requests.remove(slot)
+        except ValueError:
+            pass
+
+
+class SlidingWindowCounter(RateLimitWindow):
+    """
+    Sliding window approximated from two fixed-window counters.
+
+    The count of the previous fixed window is weighted by how much of it still overlaps the
+    sliding window, assuming its requests were spread evenly. Constant memory and time, and
+    bursts never exceed the limit; requests bunched within a fixed window can let a rolling
+    window hold up to about a third more than the limit, where LogWindow is exact.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.start: Optional[float] = None
+        self.previous = 0
+        self.current = 0
+
+    def _roll(self, now: float, time_frame: float):
+        start = now - now % time_frame
+        if start != self.start:
+            adjacent = self.start is not None and math.isclose(start - self.start, time_frame)
+            self.previous = self.current if adjacent else 0
+            self.current = 0
+            self.start = start
+
+    def delay(self, now: float, limit: int, time_frame: float) -> float:
+        self._roll(now, time_frame)
+        if self.current >= limit:
+            # Full on its own: wait into the next window until this one's weight has decayed enough
+            ready = self.start + time_frame * (2 - (limit - 1) / self.current)
+        else:
+            overlap = 1 - (now - self.start) / time_frame
+            if self.previous * overlap + self.current + 1 <= limit:
+                return 0.0
+            ready = self.start + time_frame * (1 - (limit - 1 - self.current) / self.previous)
+        return max(ready - now, 0.0)
+
+    def admit(self, now: float, limit: int, time_frame: float):
+        self._roll(now, time_frame)
+        self.current += 1
+
+    def _forget(self, slot: float, limit: int, time_frame: float):
+        if self.start is None:
+            return
+        if slot >= self.start:
+            self.current = max(self.current - 1, 0)
+        elif slot >= self.start - time_frame:
+            self.previous = max(self.previous - 1, 0)
+
+
+class GCRAWindow(RateLimitWindow):
+    """
+    Generic cell rate algorithm: one theoretical arrival time per limit.
+
+    Requests are spaced `time_frame / limit` apart, with a burst of up to `limit` allowed
+    when the limit has been idle. A burst followed by steady traffic can exceed the limit
+    over a rolling window (by up to limit - 1 requests), so prefer it for limits the API
+    enforces as a rate rather than a quota.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tat = 0.0
+
+    def delay(self, now: float, limit: int, time_frame: float) -> float:
+        interval = time_frame / limit
+        return max(self.tat - (time_frame - interval) - now, 0.0)
+
+    def admit(self, now: float, limit: int, time_frame: float):
+        self.tat = max(self.tat, now) + time_frame / limit
+
+    def _forget(self, slot: float, limit: int, time_frame: float):
+        self.tat -= time_frame / limit
+
+
+class TokenBucketWindow(RateLimitWindow):
+    """
+    Token bucket holding up to `limit` tokens, refilled at `limit / time_frame` tokens a second.
+
+    Admits the same traffic as GCRAWindow; kept for callers who think in tokens.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tokens: Optional[float] = None
+        self.updated = 0.0
+
+    def _refill(self, now: float, limit: int, time_frame: float):
+        if self.tokens is None:
+            self.tokens = float(limit)
+        else:
+            self.tokens = min(float(limit), self.tokens + (now - self.updated) * limit / time_frame)
+        self.updated = max(self.updated, now)
+
+    def delay(self, now: float, limit: int, time_frame: float) -> float:
+        self._refill(now, limit, time_frame)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) * time_frame / limit
+
+    def admit(self, now: float, limit: int, time_frame: float):
+        self._refill(now, limit, time_frame)
+        self.tokens -= 1
+
+    def _forget(self, slot: float, limit: int, time_frame: float):
+        if self.tokens is not None:
+            self.tokens = min(float(limit), self.tokens + 1)
+
+
+WINDOWS = {
+    RateLimitAlgorithm.SLIDING_WINDOW: SlidingWindowCounter,
+    RateLimitAlgorithm.GCRA: GCRAWindow,
+    RateLimitAlgorithm.TOKEN_BUCKET: TokenBucketWindow,
+    RateLimitAlgorithm.LOG: LogWindow,
+}
+
+
+def create_window(algorithm: RateLimitAlgorithm) -> RateLimitWindow:
+    """Create an empty window for a rate limiting algorithm."""
+    return WINDOWS[algorithm]()
@@ -0,0 +1,363 @@
+# usepolvo/arms/retry.py
+
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import requests
+import urllib3
+
+from usepolvo.arms.deadline import remaining
+from usepolvo.beak.exceptions import (
+    DeadlineExceededError,
+    RateLimitError,
+    RateLimitRejectedError,
+)
+
+# Methods that can be repeated without changing the result (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Headers providers use to say when a rate-limited request may be retried, in order of preference
+RETRY_AFTER_HEADERS = ("Retry-After", "RateLimit-Reset", "X-RateLimit-Reset", "X-Rate-Limit-Reset")
+
+# Transport failures worth retrying; tentacles can extend RetryPolicy.transient_errors with SDK-specific ones
+TRANSIENT_ERRORS: Tuple[type, ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    urllib3.exceptions.NewConnectionError,
+    urllib3.exceptions.ProtocolError,
+    urllib3.exceptions.TimeoutError,
+    ConnectionError,
+    TimeoutError,
+    asyncio.TimeoutError,
+)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Get how long to wait before retrying from response headers.
+
+    Understands Retry-After (seconds or an HTTP date) and the common RateLimit-Reset
+    style headers (seconds to wait, or a Unix timestamp in seconds or milliseconds).
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if no header says
+    """
+    if not headers:
+        return None
+    for name in RETRY_AFTER_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        value = str(value).strip()
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                continue
+        else:
+            # Reset headers are sometimes an absolute Unix timestamp rather than a delay, some in milliseconds
+            if seconds > 100_000_000_000:
+                seconds = seconds / 1000 - time.time()
+            elif seconds > 1_000_000_000:
+                seconds -= time.time()
+        return max(seconds, 0.0)
+    return None
+
+
+def error_status(error: BaseException) -> Optional[int]:
+    """Get the HTTP status carried by a usepolvo, requests or SDK exception (or the exception it wraps), if any."""
+    for exc in (error, error.__cause__):
+        response = getattr(exc, "response", None)
+        for status in (
+            getattr(exc, "status_code", None),
+            getattr(exc, "status", None),
+            getattr(exc, "http_status", None),
+            getattr(response, "status_code", None),
+        ):
+            if isinstance(status, int) and status > 0:
+                return status
+    return None
+
+
+def error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    """Get the response headers carried by an exception (or the exception it wraps), if any."""
+    for exc in (error, error.__cause__):
+        headers = getattr(exc, "headers", None) or getattr(getattr(exc, "response", None), "headers", None)
+        if headers:
+            return headers
+    return None
+
+
+def is_idempotent(method: str, headers: Optional[Mapping[str, str]] = None) -> bool:
+    """Check whether a request is safe to repeat: an idempotent method, or one carrying an Idempotency-Key."""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    return any(name.lower() == "idempotency-key" for name in (headers or {}))
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait between attempts.
+
+    Rate-limited requests (429) are always retried since the server did not process
+    them. Other retryable statuses and transport failures are only retried for
+    idempotent requests.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_retry_after: float = 60.0,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        transient_errors: Tuple[type, ...] = TRANSIENT_ERRORS,
+    ):
+        """
+        Args:
+            max_attempts: Total attempts per call, including the first
+            base_delay: Backoff base in seconds; attempt n waits up to base_delay * 2**n
+            max_delay: Upper bound of the backoff in seconds
+            max_retry_after: Give up instead of waiting when the server asks for a longer wait
+            retry_statuses: HTTP statuses that are retried
+            transient_errors: Transport exceptions that are retried
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = retry_statuses
+        self.transient_errors = transient_errors
+
+    @classmethod
+    def from_settings(cls, settings) -> "RetryPolicy":
+        """Build a retry policy from PolvoSettings."""
+        return cls(
+            max_attempts=settings.RETRY_MAX_ATTEMPTS,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY,
+            max_retry_after=settings.RETRY_MAX_RETRY_AFTER,
+        )
+
+    def classify(self, error: BaseException, idempotent: bool) -> Optional[str]:
+        """
+        Get the reason a failure is retryable.
+
+        Args:
+            error: The exception raised by the attempt
+            idempotent: Whether the request is safe to repeat
+
+        Returns:
+            The HTTP status or "transport" for retryable failures, None otherwise
+        """
+        if isinstance(error, (DeadlineExceededError, RateLimitRejectedError)):
+            return None
+        status = error_status(error)
+        if (status == 429 or isinstance(error, RateLimitError)) and 429 in self.retry_statuses:
+            return "429"
+        if not idempotent:
+            return None
+        if status in self.retry_statuses:
+            return str(status)
+        if isinstance(error, self.transient_errors) or isinstance(error.__cause__, self.transient_errors):
+            return "transport"
+        return None
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Get how long to wait before retrying.
+
+        Args:
+            error: The exception raised by the attempt
+            attempt: Number of retries made so far
+
+        Returns:
+            Seconds to wait, or None if the server asked for a wait longer than max_retry_after
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            retry_after = parse_retry_after(error_headers(error))
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of traffic so a struggling API is not hit with a retry storm.
+
+    Every call deposits `ratio` tokens and every retry spends one, up to `reserve`
+    tokens banked for bursts.
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0):
+        """
+        Args:
+            ratio: Retries allowed per call, on average
+            reserve: Most tokens that can be banked
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Record a call."""
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend a token for a retry, returning False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class Retrier:
+    """Runs calls under a retry policy and budget, and records retry metrics."""
+
+    def __init__(self, policy: RetryPolicy, budget: Optional[RetryBudget] = None):
+        self.policy = policy
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+        self._reasons: Counter = Counter()
+
+    @classmethod
+    def from_settings(cls, settings) -> "Retrier":
+        """Build a retrier from PolvoSettings."""
+        return cls(
+            RetryPolicy.from_settings(settings),
+            RetryBudget(ratio=settings.RETRY_BUDGET_RATIO, reserve=settings.RETRY_BUDGET_RESERVE),
+        )
+
+    def call(
+        self,
+        func: Callable[[], Any],
+        method: str = "GET",
+        idempotent: Optional[bool] = None,
+        on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    ) -> Any:
+        """
+        Call func, retrying retryable failures.
+
+        Args:
+            func: Function making one attempt
+            method: HTTP method of the request, used for idempotency rules
+            idempotent: Override whether the request is safe to repeat
+            on_retry: Called with the error, the number of the next attempt and the backoff before each retry
+
+        Returns:
+            The result of the first successful attempt
+        """
+        idempotent = is_idempotent(method) if idempotent is None else idempotent
+        self._start()
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(e, attempt + 1, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    async def async_call(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        method: str = "GET",
+        idempotent: Optional[bool] = None,
+        on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    ) -> Any:
+        """Awaitable variant of call; func returns an awaitable for one attempt."""
+        idempotent = is_idempotent(method) if idempotent is None else idempotent
+        self._start()
+        attempt = 0
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, idempotent)
+                if delay is None:
+                    raise
+                if on_retry is not None:
+                    on_retry(e, attempt + 1, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _start(self):
+        if self.budget is not None:
+            self.budget.deposit()
+        with self._lock:
+            self._stats["calls"] += 1
+
+    def _next_delay(self, error: Exception, attempt: int, idempotent: bool) -> Optional[float]:
+        """Decide whether to retry after a failed attempt, returning the wait or None to give up."""
+        reason = self.policy.classify(error, idempotent)
+        if reason is None:
+            return None
+        with self._lock:
+            if attempt + 1 >= self.policy.max_attempts:
+                self._stats["exhausted"] += 1
+                return None
+            delay = self.policy.delay(error, attempt)
+            if delay is None:
+                self._stats["retry_after_too_long"] += 1
+                return None
+            left = remaining()
+            if left is not None and left <= delay:
+                # The retry could not finish before the caller's deadline
+                self._stats["deadline_exceeded"] += 1
+                return None
+            if self.budget is not None and not self.budget.withdraw():
+                self._stats["budget_exhausted"] += 1
+                return None
+            self._stats["retries"] += 1
+            self._reasons[reason] += 1
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get retry metrics.
+
+        Returns:
+            Counts of calls, retries, calls that gave up after max_attempts ("exhausted"), because
+            the server asked for too long a wait ("retry_after_too_long"), because the retry budget
+            ran out ("budget_exhausted") or because the deadline would pass ("deadline_exceeded"),
+            and retries by reason
+        """
+        with self._lock:
+            stats = {
+                key: self._stats[key]
+                for key in (
+                    "calls",
+                    "retries",
+                    "exhausted",
+                    "retry_after_too_long",
+                    "budget_exhausted",
+                    "deadline_exceeded",
+                )
+            }
+            stats["reasons"] = dict(self._reasons)
+            return stats
@@ -0,0 +1,128 @@
+# usepolvo/arms/session_pool.py
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from usepolvo.arms.cassette import Cassette, get_cassette
+from usepolvo.arms.deadline import timeout_for
+
+
+class SessionPool:
+    """
+    Thread-safe pool of keep-alive HTTP connections shared by a client and its auth.
+
+    A single HTTPAdapter (and therefore a single urllib3 PoolManager) is shared by
+    every thread, while each thread gets its own lightweight requests.Session so
+    cookies and default headers are never mutated concurrently.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        keep_alive: bool = True,
+        pool_block: bool = False,
+        timeout: Optional[float] = 30.0,
+        cassette: Optional[Cassette] = None,
+    ):
+        """
+        Initialize the session pool.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum number of connections kept alive per host
+            max_retries: Retries for failed connection attempts (not HTTP errors)
+            keep_alive: Whether to reuse connections between requests
+            pool_block: Whether to block when a host pool is exhausted instead of opening a throwaway connection
+            timeout: Default connect and read timeout in seconds for requests that do not set one
+            cassette: Record every request to, or replay every response from, this cassette
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.cassette = cassette
+        adapter_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "max_retries": Retry(total=max_retries, read=False, redirect=False, raise_on_status=False),
+            "pool_block": pool_block,
+        }
+        self.adapter = cassette.adapter(**adapter_options) if cassette is not None else HTTPAdapter(**adapter_options)
+        self._local = threading.local()
+
+    @classmethod
+    def from_settings(cls, settings) -> "SessionPool":
+        """Build a session pool from PolvoSettings."""
+        return cls(
+            pool_connections=settings.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+            max_retries=settings.HTTP_MAX_RETRIES,
+            keep_alive=settings.HTTP_KEEP_ALIVE,
+            pool_block=settings.HTTP_POOL_BLOCK,
+            timeout=settings.HTTP_TIMEOUT,
+            cassette=get_cassette(settings),
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.create_session()
+        return session
+
+    def create_session(self) -> requests.Session:
+        """
+        Create a session sending requests through the pooled connections.
+
+        For libraries that manage their own session, like the Stripe SDK. Do not close it:
+        closing a session closes its adapter, and with it every pooled connection.
+        """
+        session = requests.Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled connections, never waiting past the current deadline."""
+        kwargs["timeout"] = timeout_for(kwargs.get("timeout", self.timeout))
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def prewarm(self, url: str, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Open a connection to the host of the given URL so the first real call skips the TCP/TLS handshake.
+
+        Args:
+            url: Any URL on the host to warm up
+            timeout: Timeout for the warm-up request in seconds
+
+        Returns:
+            True if the connection was established, False otherwise
+        """
+        try:
+            self.request("HEAD", url, timeout=timeout, allow_redirects=False)
+            return True
+        except requests.exceptions.RequestException:
+            return False
+
+    def close(self):
+        """Close the calling thread's session and every pooled connection."""
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+        self.adapter.close()
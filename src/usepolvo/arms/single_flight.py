@@ -0,0 +1,117 @@
+# usepolvo/arms/single_flight.py
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _Call:
+    """State of an in-flight call shared by its leader and followers."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    The first caller for a key (the leader) runs the function; callers arriving
+    while it is in flight wait for and share its result or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (e.g. a cache key)
+            func: The function to run
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            The result of the leader's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Get counts of executed, coalesced and currently in-flight calls."""
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Asyncio variant of SingleFlight; followers await the leader's task."""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Await func once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (e.g. a cache key)
+            func: The coroutine function to run
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            The result of the leader's call
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # Shield so a cancelled follower does not cancel the shared call
+            return await asyncio.shield(future)
+
+        self.executed += 1
+        future = asyncio.ensure_future(func(*args, **kwargs))
+        self._calls[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._calls.pop(key, None)
+            else:
+                future.add_done_callback(lambda _: self._calls.pop(key, None))
+
+    def stats(self) -> Dict[str, int]:
+        """Get counts of executed, coalesced and currently in-flight calls."""
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": len(self._calls)}
@@ -6,7 +6,14 @@ from typing import Optional
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from usepolvo.beak.enums import PaginationMethod
+from usepolvo.beak.enums import (
+    CacheBackend,
+    CassetteMode,
+    GraphQLSchemaMode,
+    PaginationMethod,
+    RateLimitAlgorithm,
+    RateLimitMode,
+)
 
 load_dotenv()
 
@@ -32,7 +39,60 @@ class PolvoBaseSettings(BaseSettings):
 
 
 class PolvoSettings(PolvoBaseSettings):
+    CACHE_BACKEND: CacheBackend = CacheBackend.MEMORY  # Where cached responses are stored
+    CACHE_PATH: Optional[str] = (
+        None  # SQLite cache file, defaults to ~/.cache/usepolvo/cache.sqlite3 (private to the user)
+    )
+    CACHE_URL: Optional[str] = None  # Redis URL for the redis cache backend
     CACHE_SIZE: int = 100  # Default cache size
     CACHE_TTL: int = 600  # Default cache TTL (in seconds)
+    CACHE_STALE_TTL: int = 3600  # How long expired entries with ETag/Last-Modified are kept for revalidation
+    CACHE_MAX_ENTRY_SIZE: Optional[int] = None  # Largest response body (in bytes) to cache, None for no limit
+    REQUEST_COALESCING: bool = True  # Share one upstream request between concurrent identical GETs
     PAGINATION_METHOD: PaginationMethod = PaginationMethod.OFFSET_LIMIT  # Default pagination method
+    DEFAULT_PAGE_SIZE: int = 100  # Records per page when iterating over every page of a list
+    PAGINATION_PREFETCH: bool = True  # Fetch the next page in the background while the current one is consumed
+    PAGINATION_FAN_OUT: int = 4  # Pages fetched concurrently by scan() when the total count is known
+    BULK_WORKERS: int = 8  # Items processed concurrently by bulk_get/bulk_create/bulk_update/bulk_delete
+    GRAPHQL_SCHEMA_MODE: GraphQLSchemaMode = GraphQLSchemaMode.CACHED  # How GraphQL clients get their schema
+    GRAPHQL_SCHEMA_CACHE_DIR: Optional[str] = None  # Schema snapshots, defaults to the temp directory
+    GRAPHQL_SCHEMA_MAX_AGE: int = 86400  # Age (in seconds) after which a snapshot is refreshed in the background
     ENCRYPTION_KEY: Optional[str] = None  # Encryption key for sensitive data
+    HTTP_POOL_CONNECTIONS: int = 10  # Number of per-host connection pools to keep
+    HTTP_POOL_MAXSIZE: int = 10  # Maximum keep-alive connections per host
+    HTTP_POOL_BLOCK: bool = False  # Block when a host pool is exhausted instead of opening extra connections
+    HTTP_MAX_RETRIES: int = 0  # Retries for failed connection attempts
+    HTTP_KEEP_ALIVE: bool = True  # Reuse connections between requests
+    HTTP_COMPRESSION_MIN_SIZE: int = 1024  # Smallest JSON body (in bytes) compressed when a tentacle enables it
+    HTTP_TIMEOUT: Optional[float] = 30.0  # Connect and read timeout per attempt (in seconds), None to wait forever
+    HTTP_PREWARM: bool = False  # Open a connection to the API host when a client is created
+    CASSETTE: Optional[str] = None  # File HTTP interactions are recorded to or replayed from, None to use the network
+    CASSETTE_MODE: CassetteMode = CassetteMode.REPLAY  # Whether to record or replay the CASSETTE
+    CASSETTE_TIME_SCALE: float = 1.0  # Replayed responses take the recorded time multiplied by this (0 for no delay)
+    STREAM_CHUNK_SIZE: int = 65536  # Bytes read at a time when streaming large responses
+    RATE_LIMIT_ALGORITHM: RateLimitAlgorithm = RateLimitAlgorithm.LOG  # How client-side limits are counted
+    RATE_LIMIT_MODE: RateLimitMode = RateLimitMode.WAIT  # Whether requests wait for a rate limit slot or fail fast
+    RATE_LIMIT_MAX_QUEUE: Optional[int] = None  # Requests allowed to wait on a rate limiter at once, None for no limit
+    RETRY_MAX_ATTEMPTS: int = 3  # Total attempts per request, including the first
+    RETRY_BASE_DELAY: float = 0.5  # Backoff base (in seconds); retries wait a random time up to base * 2^n
+    RETRY_MAX_DELAY: float = 30.0  # Longest backoff between attempts (in seconds)
+    RETRY_MAX_RETRY_AFTER: float = 60.0  # Give up instead of waiting when Retry-After asks for longer (in seconds)
+    RETRY_BUDGET_RATIO: float = 0.1  # Retries allowed per request, on average
+    RETRY_BUDGET_RESERVE: int = 10  # Retries that can be banked for bursts
+    CIRCUIT_BREAKER: bool = True  # Fail fast while an API host is unhealthy instead of waiting on every call
+    CIRCUIT_FAILURE_RATE: float = 0.5  # Fraction of failed calls (5xx or transport errors) that opens the circuit
+    CIRCUIT_SLOW_CALL_DURATION: Optional[float] = None  # Calls slower than this (in seconds) count as slow
+    CIRCUIT_SLOW_CALL_RATE: float = 0.8  # Fraction of slow calls that opens the circuit
+    CIRCUIT_MIN_CALLS: int = 20  # Calls to observe before the circuit can open
+    CIRCUIT_WINDOW: int = 100  # Number of recent calls the rates are computed over
+    CIRCUIT_OPEN_DURATION: float = 30.0  # Seconds to fail fast before sending trial calls
+    CIRCUIT_HALF_OPEN_CALLS: int = 3  # Trial calls that must succeed to close the circuit
+    METRICS: bool = False  # Record request metrics in the shared usepolvo.arms.metrics collector
+    LOG_LEVEL: Optional[str] = None  # Level of the usepolvo loggers (INFO unless the app set one); DEBUG logs requests
+    LOG_FILE: Optional[str] = None  # File usepolvo logs are written to, None for stderr
+    LOG_CONSOLE: bool = True  # Log to stderr when there is no LOG_FILE and the application has not configured logging
+    LOG_FORMAT: str = "text"  # "text" or "json" (one object per line)
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0  # Fraction of successful requests logged at DEBUG level
+    HEDGE_REQUESTS: bool = False  # Send a second copy of GETs slower than the observed p95 (see Hedger)
+    HEDGE_QUANTILE: float = 0.95  # Latency quantile after which a GET is hedged
+    HEDGE_MIN_SAMPLES: int = 20  # Latencies to observe before hedging starts
@@ -7,3 +7,35 @@ class PaginationMethod(Enum):
     OFFSET_LIMIT = "offset_limit"
     PAGE_SIZE = "page_size"
     PAGE = "page"
+    CURSOR = "cursor"
+
+
+class CacheBackend(Enum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+    REDIS = "redis"
+
+
+class GraphQLSchemaMode(Enum):
+    CACHED = "cached"  # Validate queries against a schema snapshot on disk, refreshed in the background
+    FETCH = "fetch"  # Introspect the API on every client, before the first query
+    NONE = "none"  # Skip client-side validation; the API still validates every query
+
+
+class CassetteMode(Enum):
+    RECORD = "record"  # Send requests to the API and store every response in the cassette
+    REPLAY = "replay"  # Answer requests from the cassette without any network access
+
+
+class RateLimitAlgorithm(Enum):
+    SLIDING_WINDOW = (
+        "sliding_window"  # Two weighted fixed-window counters; constant memory, may admit about a third over the limit
+    )
+    GCRA = "gcra"  # Evenly spaced requests with a burst of up to the limit
+    TOKEN_BUCKET = "token_bucket"  # Same admissions as GCRA, as a bucket of tokens
+    LOG = "log"  # One timestamp per request in the window; exact (the default), but memory grows with the limit
+
+
+class RateLimitMode(Enum):
+    WAIT = "wait"  # Sleep until the rate limiter has a slot
+    REJECT = "reject"  # Raise RateLimitError with the time until the next slot instead of sleeping
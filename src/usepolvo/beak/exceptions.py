@@ -27,10 +27,28 @@ class APIError(PolvoError):
         super().__init__(full_message)
 
 
+class DeadlineExceededError(APIError):
+    """Exception raised when a call does not finish before its deadline."""
+
+    def __init__(self, message: str = "Deadline exceeded"):
+        super().__init__(message)
+
+
+class CircuitOpenError(APIError):
+    """Exception raised without calling the API while its circuit breaker is open."""
+
+    def __init__(self, message: str = "Circuit open", retry_after: float = None):
+        self.retry_after = retry_after
+        full_message = message
+        if retry_after is not None:
+            full_message += f". Retry after {retry_after:.1f} seconds"
+        super().__init__(full_message)
+
+
 class RateLimitError(PolvoError):
     """Exception raised when rate limits are exceeded."""
 
-    def __init__(self, message: str = "Rate limit exceeded", retry_after: int = None):
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: float = None):
         self.retry_after = retry_after
         full_message = message
         if retry_after:
@@ -38,6 +56,13 @@ class RateLimitError(PolvoError):
         super().__init__(full_message)
 
 
+class RateLimitRejectedError(RateLimitError):
+    """Exception raised by a client-side rate limiter that will not wait for a slot; never retried."""
+
+    def __init__(self, message: str = "Rate limit reached", retry_after: float = None):
+        super().__init__(message, retry_after=retry_after)
+
+
 class ResourceNotFoundError(PolvoError):
     """Exception raised when a requested resource is not found."""
 
@@ -61,6 +86,14 @@ class ValidationError(PolvoError):
         super().__init__(full_message)
 
 
+class BulkOperationError(PolvoError):
+    """Exception raised when some items of a bulk operation failed."""
+
+    def __init__(self, message: str = "Bulk operation failed", result=None):
+        self.result = result
+        super().__init__(message)
+
+
 class ConfigurationError(PolvoError):
     """Exception raised when there are configuration issues."""
 
@@ -88,3 +121,10 @@ class SDKError(PolvoError):
         if provider:
             full_message = f"[{provider}] {message}"
         super().__init__(full_message)
+
+
+class CassetteError(PolvoError):
+    """Exception raised when a cassette cannot be read or has no recording of a replayed request."""
+
+    def __init__(self, message: str = "Cassette error"):
+        super().__init__(message)
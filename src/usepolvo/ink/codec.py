@@ -0,0 +1,86 @@
+# usepolvo/ink/codec.py
+
+"""
+JSON encoding and decoding on bytes.
+
+Uses orjson or msgspec when one is installed (pip install usepolvo[fast]) and
+falls back to the standard library otherwise. Every backend produces compact,
+UTF-8 encoded JSON and raises ValueError on malformed input, so callers never
+need to know which one is in use.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+# Errors raised when a native codec cannot encode a value stdlib json can
+_ENCODE_ERRORS = (TypeError, ValueError, OverflowError)
+if msgspec is not None:
+    _msgspec_decoder = msgspec.json.Decoder()
+    _ENCODE_ERRORS += (msgspec.EncodeError,)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: The document, ideally as the raw bytes received
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+
+    Args:
+        obj: The value to encode
+        default: Called for objects the codec cannot encode; returns an encodable value
+
+    Returns:
+        The encoded document
+
+    Raises:
+        TypeError: If the value cannot be encoded
+    """
+    try:
+        if BACKEND == "orjson":
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        if BACKEND == "msgspec":
+            return msgspec.json.encode(obj, enc_hook=default)
+    except _ENCODE_ERRORS:
+        # Native codecs reject a few things stdlib json accepts (e.g. integers over 64 bits)
+        pass
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,293 @@
+# usepolvo/ink/json_stream.py
+
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+# Characters that can change the nesting of a value, inside and outside strings
+_STRING_SPECIAL = re.compile(r'["\\]')
+_CONTAINER_SPECIAL = re.compile(r'["\[\]{}]')
+# Characters that can end a number or literal
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+class JSONArrayParser:
+    """
+    Incremental parser that yields the items of one JSON array as the document arrives.
+
+    The array is either the document itself or found by following object keys
+    (e.g. ("records",) for {"totalSize": 2, "records": [...]}). Only the item
+    being parsed is buffered, so memory stays bounded by the largest item rather
+    than the whole response. Each character of an item is scanned once to find where it
+    ends, and the item is decoded once it has fully arrived, so large items cost linear time.
+
+    Example:
+        parser = JSONArrayParser(path=("results",))
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self, path: Sequence[str] = ()):
+        """
+        Args:
+            path: Object keys leading from the document root to the array
+        """
+        self.path = tuple(path)
+        self._depth = 0
+        self._key = None
+        self._state = "object_start" if self.path else "array_start"
+        self._text = ""
+        self._pos = 0
+        # Text received after _text, joined to it only once the value being scanned is complete
+        self._tail: List[str] = []
+        self._eof = False
+        self._reset_scan()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def _reset_scan(self):
+        # Scanner state of the value starting at _pos: where scanning stopped (-1 for _text or an
+        # index into _tail, and an offset), the kind of value, and its nesting and string state
+        self._scan_at: Optional[Tuple[int, int]] = None
+        self._scan_mode: Optional[str] = None
+        self._scan_depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole array has been parsed (or the path was not found)."""
+        return self._state == "done"
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Feed the next chunk of the document.
+
+        Args:
+            data: Raw bytes of the next chunk
+
+        Returns:
+            Items completed by this chunk
+        """
+        self._tail.append(self._utf8.decode(data))
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the document.
+
+        Returns:
+            Items completed by the end of the document
+
+        Raises:
+            ValueError: If the document ended before the array did
+        """
+        self._tail.append(self._utf8.decode(b"", final=True))
+        self._eof = True
+        items = self._parse()
+        if not self.done:
+            raise ValueError("JSON document ended before the array was complete")
+        return items
+
+    def _parse(self) -> List[Any]:
+        items = []
+        while self._state != "done" and self._step(items):
+            pass
+        return items
+
+    def _step(self, items: List[Any]) -> bool:
+        """Advance the state machine by one token, returning False when more data is needed."""
+        state = self._state
+
+        if state in ("object_start", "key", "colon", "after_value", "array_start", "first_item", "after_item"):
+            char = self._peek()
+            if char is None:
+                return False
+            if state == "object_start":
+                self._expect(char, "{")
+                self._state = "key"
+            elif state == "key":
+                if char == "}":
+                    self._state = "done"  # Path not found: no items
+                    return True
+                ok, self._key = self._decode()
+                if not ok:
+                    return False
+                self._state = "colon"
+            elif state == "colon":
+                self._expect(char, ":")
+                self._state = "value"
+            elif state == "after_value":
+                if char == "}":
+                    self._state = "done"
+                else:
+                    self._expect(char, ",")
+                    self._state = "key"
+            elif state == "array_start":
+                if char == "n":
+                    self._state = "done"  # "key": null
+                else:
+                    self._expect(char, "[")
+                    self._state = "first_item"
+            elif state == "first_item":
+                if char == "]":
+                    self._state = "done"
+                else:
+                    self._state = "item"
+            elif state == "after_item":
+                if char == "]":
+                    self._state = "done"
+                else:
+                    self._expect(char, ",")
+                    self._state = "item"
+            return True
+
+        if state == "value":
+            if self._key == self.path[self._depth]:
+                self._depth += 1
+                self._state = "array_start" if self._depth == len(self.path) else "object_start"
+                return True
+            # Skip values outside the path
+            ok, _ = self._decode()
+            if not ok:
+                return False
+            self._state = "after_value"
+            return True
+
+        # state == "item"
+        ok, item = self._decode()
+        if not ok:
+            return False
+        items.append(item)
+        self._state = "after_item"
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character, or None if more data is needed."""
+        while True:
+            text, pos = self._text, self._pos
+            while pos < len(text) and text[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(text):
+                return text[pos]
+            if not self._tail:
+                break
+            self._join()
+        if self._eof:
+            raise ValueError("JSON document ended before the array was complete")
+        return None
+
+    def _join(self):
+        """Move the received text after _pos into a single buffer."""
+        self._text = self._text[self._pos :] + "".join(self._tail)
+        self._pos = 0
+        self._tail = []
+        self._reset_scan()
+
+    def _expect(self, char: str, expected: str):
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at position {self._pos}, found {char!r}")
+        self._pos += 1
+
+    def _decode(self):
+        """Decode the next complete value, returning (False, None) if it has not fully arrived."""
+        if self._peek() is None:
+            return False, None
+        if not self._complete() and not self._eof:
+            return False, None
+        self._join()
+        value, self._pos = _decoder.raw_decode(self._text, self._pos)
+        return True, value
+
+    def _complete(self) -> bool:
+        """Scan the text received since the last call for the end of the value at _pos."""
+        index, pos = self._scan_at or (-1, self._pos)
+        while True:
+            piece = self._text if index < 0 else self._tail[index]
+            if pos < len(piece) and self._scan(piece, pos) is not None:
+                return True
+            if index + 1 == len(self._tail):
+                self._scan_at = (index, len(piece))
+                return False
+            index, pos = index + 1, 0
+
+    def _scan(self, piece: str, pos: int) -> Optional[int]:
+        """Scan a piece of text from pos, returning where the value ends in it or None if it goes on."""
+        if self._scan_mode is None:
+            char = piece[pos]
+            self._scan_mode = "container" if char in "[{" else "string" if char == '"' else "scalar"
+            if self._scan_mode == "scalar":
+                pos += 1
+        if self._scan_mode == "scalar":
+            match = _SCALAR_END.search(piece, pos)
+            return match.start() if match else None
+
+        while pos < len(piece):
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+            match = (_STRING_SPECIAL if self._in_string else _CONTAINER_SPECIAL).search(piece, pos)
+            if match is None:
+                return None
+            char, pos = match.group(), match.end()
+            if char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = not self._in_string
+                if not self._in_string and self._scan_depth == 0:
+                    return pos
+            elif char in "[{":
+                self._scan_depth += 1
+            else:
+                self._scan_depth -= 1
+                if self._scan_depth == 0:
+                    return pos
+        return None
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Sequence[str] = ()) -> Iterator[Any]:
+    """
+    Yield the items of a JSON array from a stream of byte chunks.
+
+    Args:
+        chunks: The document as byte chunks (e.g. requests' Response.iter_content())
+        path: Object keys leading from the document root to the array
+
+    Yields:
+        Each decoded item of the array
+    """
+    parser = JSONArrayParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], path: Sequence[str] = ()) -> AsyncIterator[Any]:
+    """Async variant of iter_json_array (e.g. for aiohttp's response.content.iter_chunked())."""
+    parser = JSONArrayParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+    for item in parser.close():
+        yield item
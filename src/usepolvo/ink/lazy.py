@@ -0,0 +1,41 @@
+# usepolvo/ink/lazy.py
+
+"""
+Lazy package exports.
+
+Tentacle packages re-export their clients and webhooks, but importing a client pulls
+in its vendor SDK (and a webhook pulls in aiohttp and pyngrok). Packages declare their
+exports with `lazy_exports` instead, so nothing is imported until a name is first used:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"CertnClient": "usepolvo.tentacles.certn.client"})
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level `__getattr__` and `__dir__` functions (PEP 562) for a package.
+
+    Args:
+        package: The package's `__name__`
+        exports: Exported name -> module it is defined in
+
+    Returns:
+        The `__getattr__` and `__dir__` functions to assign in the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name]), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,11 +1,12 @@
 # src/usepolvo/ink/tokens.py
 
-import json
 from pathlib import Path
 from typing import Dict, Optional
 
 from cryptography.fernet import Fernet
 
+from usepolvo.ink import codec
+
 
 class SecureTokenStore:
     """Optional secure token storage utility."""
@@ -23,7 +24,7 @@ class SecureTokenStore:
 
     def save_tokens(self, service_name: str, tokens: Dict[str, str]) -> None:
         """Save tokens for a service."""
-        token_data = json.dumps(tokens).encode()
+        token_data = codec.dumps(tokens)
 
         if self.fernet:
             token_data = self.fernet.encrypt(token_data)
@@ -42,7 +43,7 @@ class SecureTokenStore:
             token_data = token_file.read_bytes()
             if self.fernet:
                 token_data = self.fernet.decrypt(token_data)
-            return json.loads(token_data)
+            return codec.loads(token_data)
         except Exception:
             return None
 
@@ -1,13 +1,14 @@
 import hashlib
 import hmac
+from typing import Union
 
 
-def verify_hmac_signature(payload: str, signature: str, secret_key: str):
+def verify_hmac_signature(payload: Union[str, bytes], signature: str, secret_key: str):
     """
     Verify webhook signature using HMAC-SHA256.
 
     Args:
-        payload: Raw request body as string
+        payload: Raw request body
         signature: The signature from webhook header
         secret_key: The webhook secret key
 
@@ -19,9 +20,9 @@ def verify_hmac_signature(payload: str, signature: str, secret_key: str):
     secret_key = secret_key.strip('"')
 
     # Compute HMAC
-    computed_signature = hmac.new(
-        key=secret_key.encode("utf-8"), msg=payload.encode("utf-8"), digestmod=hashlib.sha256
-    ).hexdigest()
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    computed_signature = hmac.new(key=secret_key.encode("utf-8"), msg=payload, digestmod=hashlib.sha256).hexdigest()
 
     # Use constant-time comparison
     if not hmac.compare_digest(computed_signature, signature):
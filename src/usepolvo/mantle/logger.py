@@ -1,3 +1,207 @@
-from loguru import logger
+# usepolvo/mantle/logger.py
 
-logger.add("debug.log", format="{time} {level} {message}", level="DEBUG")
+import atexit
+import logging
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+from usepolvo.arms.metrics import endpoint_template, tentacle_name
+from usepolvo.beak.config import get_settings
+from usepolvo.ink import codec
+
+ROOT = "usepolvo"
+
+# Structured fields attached to records with `extra=` and rendered after the message
+FIELDS = ("tentacle", "method", "endpoint", "status", "latency_ms", "attempt", "delay", "bytes_in", "bytes_out")
+
+# Importing usepolvo never configures output; sinks are set up by configure_logging on first client use
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+_lock = threading.Lock()
+_configured = False
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def get_logger(name: str = "") -> logging.Logger:
+    """
+    Get a usepolvo logger.
+
+    Args:
+        name: Module or component name; loggers are children of "usepolvo"
+
+    Returns:
+        The logger
+    """
+    if not name or name == ROOT:
+        return logging.getLogger(ROOT)
+    if name.startswith(ROOT + "."):
+        return logging.getLogger(name)
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as text with trailing key=value fields, or as one JSON object per line."""
+
+    def __init__(self, json: bool = False):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        self.json = json
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {field: getattr(record, field) for field in FIELDS if getattr(record, field, None) is not None}
+        if self.json:
+            entry = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+                **fields,
+            }
+            if record.exc_info:
+                entry["exception"] = self.formatException(record.exc_info)
+            return codec.dumps(entry, default=str).decode()
+        text = super().format(record)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+def configure_logging(settings: Any = None, force: bool = False):
+    """
+    Set up usepolvo's log sinks from settings. Called lazily when a client or webhook is created.
+
+    Records are put on an in-memory queue and written by a background thread, so logging
+    never blocks a request on disk or terminal I/O. Without POLVO_LOG_FILE, records go to
+    stderr only if the application has not configured logging itself (they always propagate
+    to the application's handlers). The level is only set when POLVO_LOG_LEVEL is given or
+    the application has not set one on the usepolvo logger.
+
+    Args:
+        settings: PolvoSettings (defaults to get_settings())
+        force: Reconfigure even if already configured (e.g. after changing settings)
+    """
+    global _configured, _listener, _queue_handler
+    if _configured and not force:
+        return
+
+    with _lock:
+        if _configured and not force:
+            return
+        settings = settings or get_settings()
+
+        root = logging.getLogger(ROOT)
+        _shutdown()
+        if settings.LOG_LEVEL:
+            root.setLevel(settings.LOG_LEVEL.upper())
+        elif root.level == logging.NOTSET:
+            # Keep any level the application set on the usepolvo logger
+            root.setLevel(logging.INFO)
+
+        formatter = StructuredFormatter(json=settings.LOG_FORMAT.lower() == "json")
+        handlers = []
+        if settings.LOG_FILE:
+            handlers.append(logging.FileHandler(settings.LOG_FILE, delay=True))
+        if settings.LOG_CONSOLE and not settings.LOG_FILE and not logging.getLogger().handlers:
+            handlers.append(logging.StreamHandler(sys.stderr))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        if handlers:
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            _queue_handler = QueueHandler(records)
+            _listener = QueueListener(records, *handlers, respect_handler_level=True)
+            _listener.start()
+            root.addHandler(_queue_handler)
+        _configured = True
+
+
+def _shutdown():
+    """Stop the background writer, flushing queued records. Must hold the lock."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger(ROOT).removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+@atexit.register
+def shutdown_logging():
+    """Flush queued records and stop the background writer."""
+    with _lock:
+        _shutdown()
+
+
+class RequestLogger:
+    """
+    Logs per-request events at DEBUG level, sampled to keep their volume down.
+
+    Subscribed to a client's hooks only when DEBUG logging is enabled, so it costs
+    nothing otherwise. Retries are always logged; completed attempts are logged
+    for a `sample_rate` fraction of requests, and failed ones always.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            sample_rate: Fraction of successful attempts logged, between 0 and 1
+            logger: Logger to write to (defaults to usepolvo.requests)
+        """
+        self.sample_rate = sample_rate
+        self.logger = logger or get_logger("requests")
+
+    def on_response(
+        self,
+        client: Any,
+        method: str,
+        url: str,
+        status: Optional[int],
+        duration: float,
+        bytes_in: Optional[int],
+        bytes_out: int,
+        error: Optional[BaseException] = None,
+    ):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        failed = status is None or status >= 400
+        if not failed and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        self.logger.debug(
+            "%s %s -> %s",
+            method,
+            url,
+            status if status is not None else f"error: {error!r}",
+            extra={
+                "tentacle": tentacle_name(client),
+                "method": method,
+                "endpoint": endpoint_template(url),
+                "status": status,
+                "latency_ms": round(duration * 1000, 1),
+                "bytes_in": bytes_in,
+                "bytes_out": bytes_out,
+            },
+        )
+
+    def on_retry(self, client: Any, method: str, url: str, attempt: int, delay: float, error: BaseException):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(
+            "Retrying %s %s after %r",
+            method,
+            url,
+            error,
+            extra={
+                "tentacle": tentacle_name(client),
+                "method": method,
+                "endpoint": endpoint_template(url),
+                "attempt": attempt,
+                "delay": round(delay, 3),
+            },
+        )
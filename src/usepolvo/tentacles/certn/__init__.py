@@ -1,4 +1,20 @@
-from usepolvo.tentacles.certn.client import CertnClient
-from usepolvo.tentacles.certn.webhook.handler import CertnWebhook
+from typing import TYPE_CHECKING
 
-__all__ = ["CertnClient", "CertnWebhook"]
+from usepolvo.ink.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from usepolvo.tentacles.certn.async_client import AsyncCertnClient
+    from usepolvo.tentacles.certn.client import CertnClient
+    from usepolvo.tentacles.certn.webhook.handler import CertnWebhook
+
+__all__ = ["AsyncCertnClient", "CertnClient", "CertnWebhook"]
+
+# Clients and webhooks pull in HTTP stacks and vendor SDKs, so they are only imported when first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncCertnClient": "usepolvo.tentacles.certn.async_client",
+        "CertnClient": "usepolvo.tentacles.certn.client",
+        "CertnWebhook": "usepolvo.tentacles.certn.webhook.handler",
+    },
+)
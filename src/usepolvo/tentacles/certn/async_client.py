@@ -0,0 +1,64 @@
+from typing import Any, Dict, Optional
+
+from usepolvo.arms.base_async_client import AsyncBaseClient
+from usepolvo.tentacles.certn.auth import CertnAuth
+from usepolvo.tentacles.certn.config import get_settings
+from usepolvo.tentacles.certn.exceptions import handle_certn_error
+from usepolvo.tentacles.certn.rate_limiter import CertnRateLimiter
+from usepolvo.tentacles.certn.resources.applications import AsyncApplicationResource
+
+
+class AsyncCertnClient(AsyncBaseClient):
+    """
+    Asyncio Certn API client with API key authentication.
+
+    Example usage:
+        async with AsyncCertnClient(api_key="your-api-key") as client:
+            applications = await client.applications.list()
+    """
+
+    def __init__(self, api_key: Optional[str] = None):
+        """Initialize the async Certn client."""
+        super().__init__()
+
+        # Initialize settings and auth
+        self.settings = get_settings()
+        self.base_url = self.settings.CERTN_BASE_URL
+        self.auth = CertnAuth(api_key=api_key)
+
+        # Compress large request bodies if enabled for this API
+        self.request_compression = self.settings.CERTN_REQUEST_COMPRESSION
+
+        # Initialize rate limiter
+        self.rate_limiter = CertnRateLimiter()
+
+        # Initialize resources
+        self._applications = None
+
+    @property
+    def applications(self) -> AsyncApplicationResource:
+        """Access the applications resource."""
+        if self._applications is None:
+            self._applications = AsyncApplicationResource(self)
+        return self._applications
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make a rate-limited request to the Certn API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response data
+        """
+        try:
+            return await super()._request(method=method, endpoint=endpoint, **kwargs)
+        except Exception as e:
+            raise handle_certn_error(e)
+
+    def get_pagination_params(self, page: int, size: int) -> Dict[str, Any]:
+        """Get Certn-specific pagination parameters."""
+        return {"page": page, "size": size}
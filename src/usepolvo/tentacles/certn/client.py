@@ -1,7 +1,6 @@
 from typing import Any, Dict, Optional
 
 from usepolvo.arms.base_client import BaseClient
-from usepolvo.arms.base_rate_limiter import BaseRateLimiter
 from usepolvo.tentacles.certn.auth import CertnAuth
 from usepolvo.tentacles.certn.config import get_settings
 from usepolvo.tentacles.certn.exceptions import handle_certn_error
@@ -27,12 +26,19 @@ class CertnClient(BaseClient):
         self.base_url = self.settings.CERTN_BASE_URL
         self.auth = CertnAuth(api_key=api_key)
 
+        # Compress large request bodies if enabled for this API
+        self.request_compression = self.settings.CERTN_REQUEST_COMPRESSION
+
         # Initialize rate limiter
         self.rate_limiter = CertnRateLimiter()
 
         # Initialize resources
         self._applications = None
 
+        # Open a connection to the API host ahead of the first request
+        if self.prewarm_connections:
+            self.prewarm()
+
     @property
     def applications(self):
         """Access the applications resource."""
@@ -40,7 +46,6 @@ class CertnClient(BaseClient):
             self._applications = ApplicationResource(self)
         return self._applications
 
-    @BaseRateLimiter.rate_limited
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make a rate-limited request to the Certn API.
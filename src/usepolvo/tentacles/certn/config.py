@@ -14,3 +14,4 @@ def get_settings():
 class CertnSettings(PolvoBaseSettings):
     CERTN_API_KEY: Optional[str] = None
     CERTN_BASE_URL: str = "https://demo-api.certn.co"  # Default API URL
+    CERTN_REQUEST_COMPRESSION: Optional[str] = None  # Compress large request bodies (e.g. gzip)
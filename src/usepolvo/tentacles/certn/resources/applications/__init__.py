@@ -1,3 +1,3 @@
-from .resource import ApplicationResource
+from .resource import ApplicationResource, AsyncApplicationResource
 
-__all__ = ["ApplicationResource"]
+__all__ = ["ApplicationResource", "AsyncApplicationResource"]
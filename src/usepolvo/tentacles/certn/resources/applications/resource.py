@@ -1,5 +1,6 @@
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Union
 
+from usepolvo.arms.base_async_resource import AsyncBaseResource
 from usepolvo.arms.base_resource import BaseResource
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
 from usepolvo.tentacles.certn.resources.applications.schemas import (
@@ -9,13 +10,22 @@ from usepolvo.tentacles.certn.resources.applications.schemas import (
 
 
 class ApplicationResource(BaseResource):
+    records_key = "results"
+    count_key = "count"
+    record_schema = ApplicationResponse
+
     def __init__(self, client):
         super().__init__(client)
         self.base_path = "/hr/v1/applicants/"
 
-    def list(self, page: int = 1, size: int = 10) -> ApplicationListResponse:
+    def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[ApplicationListResponse, Iterator[ApplicationResponse]]:
+        params = self.client.get_pagination_params(page, size)
+        if stream:
+            # Yield validated applications as they arrive instead of loading the whole page
+            return self._stream_records(self.base_path, ("results",), ApplicationResponse, params=params)
         try:
-            params = self.client.get_pagination_params(page, size)
             response = self.client._request("GET", self.base_path, params=params)
             result = ApplicationListResponse(**response)
             return result
@@ -52,3 +62,57 @@ class ApplicationResource(BaseResource):
             self.client._request("DELETE", f"{self.base_path}{resource_id}/")
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Application with ID {resource_id} not found")
+
+
+class AsyncApplicationResource(AsyncBaseResource):
+    records_key = "results"
+    count_key = "count"
+    record_schema = ApplicationResponse
+
+    def __init__(self, client):
+        super().__init__(client)
+        self.base_path = "/hr/v1/applicants/"
+
+    async def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[ApplicationListResponse, AsyncIterator[ApplicationResponse]]:
+        params = self.client.get_pagination_params(page, size)
+        if stream:
+            # Yield validated applications as they arrive instead of loading the whole page
+            return self._stream_records(self.base_path, ("results",), ApplicationResponse, params=params)
+        try:
+            response = await self.client._request("GET", self.base_path, params=params)
+            return ApplicationListResponse(**response)
+        except Exception as e:
+            self.client.handle_error(e)
+
+    async def get(self, resource_id: str) -> ApplicationResponse:
+        try:
+            response = await self.client._request("GET", f"{self.base_path}{resource_id}/")
+            return ApplicationResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Application with ID {resource_id} not found")
+
+    async def create(self, data: Dict[str, Any]) -> ApplicationResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("POST", self.base_path, json=prepared_data)
+            return ApplicationResponse(**response)
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for creating application: {str(e)}")
+
+    async def update(self, resource_id: str, data: Dict[str, Any]) -> ApplicationResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("PUT", f"{self.base_path}{resource_id}/", json=prepared_data)
+            return ApplicationResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Application with ID {resource_id} not found")
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for updating application: {str(e)}")
+
+    async def delete(self, resource_id: str) -> None:
+        try:
+            await self.client._request("DELETE", f"{self.base_path}{resource_id}/")
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Application with ID {resource_id} not found")
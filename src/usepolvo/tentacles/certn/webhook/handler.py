@@ -1,8 +1,11 @@
 from typing import Any, Dict
 
 from usepolvo.arms.base_webhook import BaseWebhook
+from usepolvo.mantle.logger import get_logger
 from usepolvo.tentacles.certn.webhook.schemas import CertnWebhookPayload
 
+logger = get_logger(__name__)
+
 
 class CertnWebhook(BaseWebhook):
     def __init__(self):
@@ -27,12 +30,15 @@ class CertnWebhook(BaseWebhook):
         return await handler(validated_payload)
 
     async def default_handler(self, payload: CertnWebhookPayload):
-        print(f"Unhandled event: {payload.get_event_type()}")
-        print(f"Payload: {payload.model_dump()}")
+        logger.info("Unhandled event: %s", payload.get_event_type())
+        logger.debug("Payload: %s", payload.model_dump())
 
     async def handle_enhanced_identity_verification(self, payload: CertnWebhookPayload):
-        print(f"Enhanced identity verification requested")
-        print(f"Created: {payload.created}, Submitted: {payload.submitted_time}")
+        logger.info(
+            "Enhanced identity verification requested (created: %s, submitted: %s)",
+            payload.created,
+            payload.submitted_time,
+        )
         # Add more processing as needed
 
     # Add more specific handlers for other event types as needed
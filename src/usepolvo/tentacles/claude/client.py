@@ -1,7 +1,5 @@
 from typing import Optional
 
-from anthropic import Anthropic
-
 from usepolvo.arms.base_client import BaseClient
 from usepolvo.tentacles.claude.auth import ClaudeAuth
 from usepolvo.tentacles.claude.completions import CompletionResource
@@ -26,8 +24,11 @@ class ClaudeClient(BaseClient):
         self.settings = get_settings()
         self.auth = ClaudeAuth(api_key=api_key)
 
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=self.auth.api_key)
+        # Initialize Anthropic client (the SDK is imported here to keep importing the tentacle fast)
+        from anthropic import Anthropic
+
+        cassette = self.http.cassette
+        self.client = Anthropic(api_key=self.auth.api_key, http_client=cassette.httpx_client() if cassette else None)
 
         # Initialize rate limiter
         self.rate_limiter = ClaudeRateLimiter()
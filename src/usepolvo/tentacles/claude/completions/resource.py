@@ -18,7 +18,7 @@ class CompletionResource(BaseResource):
         :raises ValidationError: If the data is invalid
         """
         try:
-            self.client.rate_limiter.wait_if_needed()
+            self.client.rate_limiter.acquire()
             response = self.anthropic.completions.create(**data)
             return response.model_dump()
         except ValueError as e:
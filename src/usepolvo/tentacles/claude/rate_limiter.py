@@ -8,8 +8,7 @@ class ClaudeRateLimiter(BaseRateLimiter):
         self._initialize_window("requests")
 
     def wait_if_needed(self):
-        with self.lock:
-            self._wait_if_window_full("requests", self.limit, 60)  # 60 second window
+        self._wait_if_window_full("requests", self.limit, 60)  # 60 second window
 
     def get_limits(self):
         return {"requests_per_minute": self.limit}
@@ -1,7 +1,5 @@
 from typing import Dict, Optional
 
-import google.generativeai as genai
-
 from usepolvo.arms.base_auth import BaseAuth
 from usepolvo.beak.exceptions import AuthenticationError
 from usepolvo.tentacles.gemini.config import get_settings
@@ -18,8 +16,11 @@ class GeminiAuth(BaseAuth):
         if not self.api_key:
             raise AuthenticationError("API key is required")
 
-        # Configure Google AI SDK
+        # Configure Google AI SDK (imported here to keep importing the tentacle fast)
+        import google.generativeai as genai
+
         genai.configure(api_key=self.api_key)
+        self._genai = genai
 
     def get_auth_headers(self) -> Dict[str, str]:
         """Get Gemini-specific authentication headers."""
@@ -28,4 +29,4 @@ class GeminiAuth(BaseAuth):
     @property
     def client(self):
         """Get configured Google AI client."""
-        return genai
+        return self._genai
@@ -1,7 +1,5 @@
 from typing import Any, Dict
 
-from google.api_core import exceptions as google_exceptions
-
 from usepolvo.arms.base_resource import BaseResource
 from usepolvo.beak.exceptions import ValidationError
 
@@ -19,8 +17,10 @@ class CompletionResource(BaseResource):
         :return: The created completion object
         :raises ValidationError: If the data is invalid
         """
+        from google.api_core import exceptions as google_exceptions
+
         try:
-            self.client.rate_limiter.wait_if_needed()
+            self.client.rate_limiter.acquire()
             model = self.genai.GenerativeModel(data.pop("model"))
             response = model.generate_content(data.pop("prompt"), **data)
             return response.text
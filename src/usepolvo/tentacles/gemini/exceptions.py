@@ -1,12 +1,11 @@
-from google.api_core import exceptions as google_exceptions
-
-
 class GeminiError(Exception):
     """Base class for all Gemini-related exceptions."""
 
     @staticmethod
     def handle(e: Exception):
         """Handles Gemini exceptions and raises appropriate usepolvo exceptions."""
+        from google.api_core import exceptions as google_exceptions
+
         if isinstance(e, google_exceptions.PermissionDenied):
             raise GeminiAuthenticationError(f"Authentication error: {e}")
         elif isinstance(e, google_exceptions.InvalidArgument):
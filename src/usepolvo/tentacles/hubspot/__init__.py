@@ -1,3 +1,16 @@
-from usepolvo.tentacles.hubspot.client import HubSpotClient
+from typing import TYPE_CHECKING
+
+from usepolvo.ink.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from usepolvo.tentacles.hubspot.client import HubSpotClient
 
 __all__ = ["HubSpotClient"]
+
+# Clients and webhooks pull in HTTP stacks and vendor SDKs, so they are only imported when first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "HubSpotClient": "usepolvo.tentacles.hubspot.client",
+    },
+)
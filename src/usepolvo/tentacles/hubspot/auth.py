@@ -4,8 +4,6 @@ import time
 from typing import Dict, List, Optional
 from urllib.parse import parse_qs, urlparse
 
-import requests
-
 from usepolvo.arms.base_auth import BaseAuth
 from usepolvo.beak.exceptions import AuthenticationError
 from usepolvo.ink.tokens import SecureTokenStore
@@ -63,10 +61,10 @@ class HubSpotAuth(BaseAuth):
             f"&response_type=code"
         )
 
-        print("Please visit this URL to authenticate:")
-        print(auth_url)
-        print("\nAfter authenticating, paste the complete redirect URL here:")
-        redirect_url = input().strip()
+        redirect_url = input(
+            f"Please visit this URL to authenticate:\n{auth_url}\n\n"
+            "After authenticating, paste the complete redirect URL here:\n"
+        ).strip()
 
         # Parse auth code from redirect
         parsed_url = urlparse(redirect_url)
@@ -84,7 +82,7 @@ class HubSpotAuth(BaseAuth):
             "code": code,
         }
 
-        response = requests.post(self.token_url, data=token_data)
+        response = self.http.post(self.token_url, data=token_data)
         if response.status_code != 200:
             raise AuthenticationError(f"Token request failed: {response.text}")
 
@@ -120,7 +118,7 @@ class HubSpotAuth(BaseAuth):
             "refresh_token": self.refresh_token,
         }
 
-        response = requests.post(self.token_url, data=token_data)
+        response = self.http.post(self.token_url, data=token_data)
         if response.status_code != 200:
             raise AuthenticationError(f"Token refresh failed: {response.text}")
 
@@ -1,17 +1,35 @@
-from typing import Any, Callable, Dict, List, Optional
-
-import hubspot
-from hubspot.crm.contacts import ApiException
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from usepolvo.arms.base_client import BaseClient
 from usepolvo.tentacles.hubspot.auth import HubSpotAuth
 from usepolvo.tentacles.hubspot.config import get_settings
 from usepolvo.tentacles.hubspot.exceptions import handle_hubspot_error
 from usepolvo.tentacles.hubspot.rate_limiter import HubSpotRateLimiter
-from usepolvo.tentacles.hubspot.resources.contacts import ContactResource
-from usepolvo.tentacles.hubspot.resources.deals.resource import DealResource
-from usepolvo.tentacles.hubspot.resources.notes import NoteResource
-from usepolvo.tentacles.hubspot.resources.tasks import TaskResource
+
+if TYPE_CHECKING:
+    from usepolvo.arms.cassette import Cassette
+    from usepolvo.tentacles.hubspot.resources.contacts import ContactResource
+    from usepolvo.tentacles.hubspot.resources.deals.resource import DealResource
+    from usepolvo.tentacles.hubspot.resources.notes import NoteResource
+    from usepolvo.tentacles.hubspot.resources.tasks import TaskResource
+
+
+def _hubspot():
+    """Import the HubSpot SDK on first use; it takes far longer to import than the rest of the tentacle."""
+    import hubspot.crm.contacts
+
+    return hubspot
+
+
+def _cassette_api_factory(cassette: "Cassette", api_client_package, api_name: str, config: Dict[str, Any]):
+    """Build a HubSpot API like the SDK does, with its requests recorded to or replayed from a cassette."""
+    from hubspot.discovery.discovery_base import DiscoveryBase
+
+    api = DiscoveryBase._default_api_factory(api_client_package, api_name, config)
+    rest_client = api.api_client.rest_client
+    rest_client.pool_manager = cassette.pool_manager(rest_client.pool_manager)
+    return api
 
 
 class HubSpotClient(BaseClient):
@@ -55,10 +73,10 @@ class HubSpotClient(BaseClient):
         self.rate_limiter = HubSpotRateLimiter()
 
         # Initialize resources
-        self._contacts: Optional[ContactResource] = None
-        self._tasks: Optional[TaskResource] = None
-        self._notes: Optional[NoteResource] = None
-        self._deals: Optional[DealResource] = None
+        self._contacts: Optional["ContactResource"] = None
+        self._tasks: Optional["TaskResource"] = None
+        self._notes: Optional["NoteResource"] = None
+        self._deals: Optional["DealResource"] = None
 
         # Handle authentication
         self._handle_authentication()
@@ -70,7 +88,7 @@ class HubSpotClient(BaseClient):
             self.auth.start_auth_flow()
 
         # Initialize the SDK client
-        self.client = hubspot.Client.create(access_token=self.auth.access_token)
+        self.client = self._create_sdk_client(self.auth.access_token)
 
     def authenticate(self) -> Dict[str, str]:
         """Start the OAuth2 authentication flow and initialize the SDK client."""
@@ -82,10 +100,17 @@ class HubSpotClient(BaseClient):
         """Initialize or refresh the HubSpot SDK client."""
         # If we have a token, use it
         if self.auth.access_token:
-            self.client = hubspot.Client.create(access_token=self.auth.access_token)
+            self.client = self._create_sdk_client(self.auth.access_token)
         else:
             # Otherwise, initialize with a dummy client that will be updated after authentication
-            self.client = hubspot.Client()
+            self.client = self._create_sdk_client()
+
+    def _create_sdk_client(self, access_token: Optional[str] = None):
+        """Create an SDK client, with its requests going through the cassette when one is in use."""
+        options: Dict[str, Any] = {"access_token": access_token}
+        if self.http.cassette is not None:
+            options["api_factory"] = partial(_cassette_api_factory, self.http.cassette)
+        return _hubspot().Client.create(**options)
 
     def _ensure_client_authenticated(self):
         """Ensure the SDK client is authenticated with a valid token."""
@@ -102,9 +127,12 @@ class HubSpotClient(BaseClient):
         if self.client.configuration.access_token != self.auth.access_token:
             self._initialize_sdk_client()
 
-    def rate_limited_execute(self, api_call: Callable) -> Any:
+    def rate_limited_execute(self, api_call: Callable, method: str = "POST") -> Any:
         """
-        Execute a HubSpot SDK function with rate limiting and auth checks.
+        Execute a HubSpot SDK function with rate limiting, retries and auth checks.
+
+        Rate-limited calls are always retried; reads ("GET") and deletes are also
+        retried on 5xx and connection errors.
         """
         # Pass the refresh function to ensure_valid_token
         self.auth.ensure_valid_token(
@@ -115,41 +143,52 @@ class HubSpotClient(BaseClient):
         if self.client.access_token != self.auth.access_token:
             self._initialize_sdk_client()
 
-        # Apply rate limiting and execute the API call
-        self.rate_limiter.wait_if_needed()
-        try:
+        # Apply rate limiting to every attempt and execute the API call
+        def attempt():
+            self.rate_limiter.acquire()
             return api_call()
-        except ApiException as e:
+
+        try:
+            return self.retrier.call(attempt, method)
+        except _hubspot().crm.contacts.ApiException as e:
             raise handle_hubspot_error(e)
         except Exception as e:
             self.handle_error(e)
             raise
 
     @property
-    def contacts(self) -> ContactResource:
+    def contacts(self) -> "ContactResource":
         """Access the contacts resource."""
         if self._contacts is None:
+            from usepolvo.tentacles.hubspot.resources.contacts import ContactResource
+
             self._contacts = ContactResource(self)
         return self._contacts
 
     @property
-    def tasks(self) -> TaskResource:
+    def tasks(self) -> "TaskResource":
         """Access the tasks resource."""
         if self._tasks is None:
+            from usepolvo.tentacles.hubspot.resources.tasks import TaskResource
+
             self._tasks = TaskResource(self)
         return self._tasks
 
     @property
-    def notes(self) -> NoteResource:
+    def notes(self) -> "NoteResource":
         """Access the notes resource."""
         if self._notes is None:
+            from usepolvo.tentacles.hubspot.resources.notes import NoteResource
+
             self._notes = NoteResource(self)
         return self._notes
 
     @property
-    def deals(self) -> DealResource:
+    def deals(self) -> "DealResource":
         """Access the deals resource."""
         if self._deals is None:
+            from usepolvo.tentacles.hubspot.resources.deals.resource import DealResource
+
             self._deals = DealResource(self)
         return self._deals
 
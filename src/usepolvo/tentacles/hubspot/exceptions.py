@@ -1,6 +1,3 @@
-from hubspot.crm.contacts import ApiException
-
-
 class HubSpotError(Exception):
     """Base class for all HubSpot-related exceptions."""
 
@@ -27,6 +24,8 @@ class HubSpotRateLimitError(HubSpotError):
 
 def handle_hubspot_error(e: Exception):
     """Handles HubSpot exceptions and raises appropriate usepolvo exceptions."""
+    from hubspot.crm.contacts import ApiException
+
     if isinstance(e, ApiException):
         if e.status == 401:
             raise HubSpotAuthenticationError(f"Authentication error: {e}")
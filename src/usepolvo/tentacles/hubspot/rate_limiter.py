@@ -8,8 +8,7 @@ class HubSpotRateLimiter(BaseRateLimiter):
         self._initialize_window("api")
 
     def wait_if_needed(self):
-        with self.lock:
-            self._wait_if_window_full("api", self.limit, 10)  # 10 second window
+        self._wait_if_window_full("api", self.limit, 10)  # 10 second window
 
     def get_limits(self):
         return {"api_limit": self.limit}
@@ -1,15 +1,24 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from hubspot.crm.contacts import (
     ApiException,
+    BatchInputSimplePublicObjectBatchInput,
+    BatchInputSimplePublicObjectId,
+    BatchReadInputSimplePublicObjectId,
+    SimplePublicObjectBatchInput,
     SimplePublicObjectInput,
     SimplePublicObjectInputForCreate,
 )
 
 from usepolvo.arms.base_resource import BaseResource
+from usepolvo.arms.bulk import BulkItem, BulkResult, chunked, run_bulk
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
 from usepolvo.tentacles.hubspot.resources.contacts.schemas import CreateContact
 
+# Most inputs HubSpot accepts in one batch request
+BATCH_SIZE = 100
+CONTACT_PROPERTIES = ["firstname", "lastname", "email"]
+
 
 class ContactResource(BaseResource):
     def __init__(self, client):
@@ -24,7 +33,7 @@ class ContactResource(BaseResource):
             api_call = lambda: self.client.client.crm.contacts.basic_api.get_page(**params)
 
             # Execute with rate limiting
-            response = self.client.rate_limited_execute(api_call)
+            response = self.client.rate_limited_execute(api_call, method="GET")
             return response.results
 
         except ApiException as e:
@@ -34,10 +43,10 @@ class ContactResource(BaseResource):
         try:
             # Create a lambda to wrap the API call
             api_call = lambda: self.client.client.crm.contacts.basic_api.get_by_id(
-                contact_id=resource_id, properties=["firstname", "lastname", "email"]
+                contact_id=resource_id, properties=CONTACT_PROPERTIES
             )
 
-            return self.client.rate_limited_execute(api_call)
+            return self.client.rate_limited_execute(api_call, method="GET")
 
         except ApiException as e:
             if e.status == 404:
@@ -84,9 +93,82 @@ class ContactResource(BaseResource):
             # Create a lambda to wrap the API call
             api_call = lambda: self.client.client.crm.contacts.basic_api.archive(contact_id=resource_id)
 
-            self.client.rate_limited_execute(api_call)
+            self.client.rate_limited_execute(api_call, method="DELETE")
 
         except ApiException as e:
             if e.status == 404:
                 raise ResourceNotFoundError(f"Contact with ID {resource_id} not found")
             self.client.handle_error(e)
+
+    def bulk_get(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """Retrieve contacts through HubSpot's batch read endpoint, up to 100 per request."""
+
+        def read(ids: List[str]) -> Dict[str, Any]:
+            batch = BatchReadInputSimplePublicObjectId(
+                inputs=[{"id": contact_id} for contact_id in ids], properties=CONTACT_PROPERTIES
+            )
+            api_call = lambda: self.client.client.crm.contacts.batch_api.read(
+                batch_read_input_simple_public_object_id=batch
+            )
+            # Reading is safe to retry even though the batch endpoint is a POST
+            return {contact.id: contact for contact in self.client.rate_limited_execute(api_call, method="GET").results}
+
+        return self._run_batches(read, resource_ids, lambda contact_id: contact_id, workers)
+
+    def bulk_update(self, updates: Iterable[Tuple[str, Dict[str, Any]]], workers: Optional[int] = None) -> BulkResult:
+        """Update contacts through HubSpot's batch update endpoint, up to 100 per request."""
+
+        def update(pairs: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+            batch = BatchInputSimplePublicObjectBatchInput(
+                inputs=[SimplePublicObjectBatchInput(id=contact_id, properties=data) for contact_id, data in pairs]
+            )
+            api_call = lambda: self.client.client.crm.contacts.batch_api.update(
+                batch_input_simple_public_object_batch_input=batch
+            )
+            return {contact.id: contact for contact in self.client.rate_limited_execute(api_call).results}
+
+        return self._run_batches(update, updates, lambda pair: pair[0], workers)
+
+    def bulk_delete(self, resource_ids: Iterable[str], workers: Optional[int] = None) -> BulkResult:
+        """Archive contacts through HubSpot's batch archive endpoint, up to 100 per request."""
+
+        def archive(ids: List[str]) -> None:
+            batch = BatchInputSimplePublicObjectId(inputs=[{"id": contact_id} for contact_id in ids])
+            api_call = lambda: self.client.client.crm.contacts.batch_api.archive(
+                batch_input_simple_public_object_id=batch
+            )
+            self.client.rate_limited_execute(api_call, method="DELETE")
+
+        return self._run_batches(archive, resource_ids, None, workers)
+
+    def _run_batches(
+        self,
+        call: Callable[[List[Any]], Optional[Dict[str, Any]]],
+        inputs: Iterable[Any],
+        key: Optional[Callable[[Any], str]],
+        workers: Optional[int],
+    ) -> BulkResult:
+        """
+        Send inputs in concurrent batches and report the outcome of every input.
+
+        :param call: Sends one batch, returning its contacts by ID (None if the endpoint returns nothing)
+        :param inputs: Items to process
+        :param key: Gets the contact ID of an input, to find its contact in the batch response
+        :param workers: Batches sent concurrently, defaults to POLVO_BULK_WORKERS
+        :return: The outcome of every input, in input order
+        """
+        batches = run_bulk(call, chunked(inputs, BATCH_SIZE), workers or self.client.bulk_workers)
+        items = []
+        for batch in batches:
+            for offset, value in enumerate(batch.input):
+                index = batch.index * BATCH_SIZE + offset
+                if not batch.ok:
+                    items.append(BulkItem(index, value, error=batch.error))
+                elif key is None:
+                    items.append(BulkItem(index, value))
+                elif key(value) in batch.result:
+                    items.append(BulkItem(index, value, batch.result[key(value)]))
+                else:
+                    error = ResourceNotFoundError(f"Contact with ID {key(value)} not found")
+                    items.append(BulkItem(index, value, error=error))
+        return BulkResult(items)
@@ -21,7 +21,7 @@ class DealResource(BaseResource):
         try:
             params = self.client.get_pagination_params(limit=limit, after=after)
             response = self.client.rate_limited_execute(
-                lambda: self.client.client.crm.deals.basic_api.get_page(**params)
+                lambda: self.client.client.crm.deals.basic_api.get_page(**params), method="GET"
             )
             return [Deal(**deal.to_dict()) for deal in response.results]
         except Exception as e:
@@ -43,7 +43,8 @@ class DealResource(BaseResource):
             response = self.client.rate_limited_execute(
                 lambda: self.client.client.crm.deals.basic_api.get_by_id(
                     deal_id=deal_id, associations=list(associations)
-                )
+                ),
+                method="GET",
             )
             return Deal(**response.to_dict())
         except ResourceNotFoundError:
@@ -86,6 +87,8 @@ class DealResource(BaseResource):
     def delete(self, deal_id: str) -> None:
         """Delete a deal."""
         try:
-            self.client.rate_limited_execute(lambda: self.client.client.crm.deals.basic_api.archive(deal_id))
+            self.client.rate_limited_execute(
+                lambda: self.client.client.crm.deals.basic_api.archive(deal_id), method="DELETE"
+            )
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Deal with ID {deal_id} not found")
@@ -1,3 +1,18 @@
-from usepolvo.tentacles.linear.client import LinearClient
+from typing import TYPE_CHECKING
 
-__all__ = ["LinearClient"]
+from usepolvo.ink.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from usepolvo.tentacles.linear.async_client import AsyncLinearClient
+    from usepolvo.tentacles.linear.client import LinearClient
+
+__all__ = ["AsyncLinearClient", "LinearClient"]
+
+# Clients and webhooks pull in HTTP stacks and vendor SDKs, so they are only imported when first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncLinearClient": "usepolvo.tentacles.linear.async_client",
+        "LinearClient": "usepolvo.tentacles.linear.client",
+    },
+)
@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional
+
+from usepolvo.arms.base_async_graphql_client import AsyncBaseGraphQLClient
+from usepolvo.tentacles.linear.auth import LinearAuth
+from usepolvo.tentacles.linear.client import RESOURCE_FIELDS
+from usepolvo.tentacles.linear.config import get_settings
+from usepolvo.tentacles.linear.exceptions import handle_linear_error
+from usepolvo.tentacles.linear.rate_limiter import LinearRateLimiter
+from usepolvo.tentacles.linear.resources.issues import AsyncIssueResource
+
+
+class AsyncLinearClient(AsyncBaseGraphQLClient):
+    """
+    Asyncio Linear API client supporting both API key and OAuth authentication.
+
+    Example usage:
+        async with AsyncLinearClient(api_key="your-api-key") as client:
+            issues = await client.issues.list()
+    """
+
+    def __init__(
+        self, api_key: Optional[str] = None, client_id: Optional[str] = None, client_secret: Optional[str] = None
+    ):
+        """Initialize the async Linear client."""
+        self.settings = get_settings()
+        self.base_url = self.settings.LINEAR_BASE_URL
+
+        # Initialize auth
+        self.auth = LinearAuth(api_key=api_key, client_id=client_id, client_secret=client_secret)
+
+        # Initialize rate limiter
+        self.rate_limiter = LinearRateLimiter()
+
+        # Initialize resources
+        self._issues = None
+
+        super().__init__()
+
+    @property
+    def issues(self) -> AsyncIssueResource:
+        """Access the issues resource."""
+        if self._issues is None:
+            self._issues = AsyncIssueResource(self)
+        return self._issues
+
+    def _get_resource_fields(self, resource_type: str) -> str:
+        """Get Linear-specific fields for each resource type."""
+        if resource_type in RESOURCE_FIELDS:
+            return RESOURCE_FIELDS[resource_type]
+        return super()._get_resource_fields(resource_type)
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make a rate-limited request to the Linear API.
+        Translates REST-style requests into GraphQL queries.
+        """
+        try:
+            query, variables = self._convert_rest_to_graphql(method, endpoint, **kwargs)
+            return await self.execute_query(query, variables)
+        except Exception as e:
+            raise handle_linear_error(e)
@@ -8,6 +8,22 @@ from usepolvo.tentacles.linear.exceptions import handle_linear_error
 from usepolvo.tentacles.linear.rate_limiter import LinearRateLimiter
 from usepolvo.tentacles.linear.resources.issues import IssueResource
 
+# Linear-specific fields queried for each resource type
+RESOURCE_FIELDS = {
+    "issue": """
+        title
+        description
+        state {
+            id
+            name
+        }
+        assignee {
+            id
+            name
+        }
+    """,
+}
+
 
 class LinearClient(BaseGraphQLClient):
     """
@@ -56,19 +72,8 @@ class LinearClient(BaseGraphQLClient):
 
     def _get_resource_fields(self, resource_type: str) -> str:
         """Get Linear-specific fields for each resource type."""
-        if resource_type == "issue":
-            return """
-                title
-                description
-                state {
-                    id
-                    name
-                }
-                assignee {
-                    id
-                    name
-                }
-            """
+        if resource_type in RESOURCE_FIELDS:
+            return RESOURCE_FIELDS[resource_type]
         return super()._get_resource_fields(resource_type)
 
     @BaseRateLimiter.rate_limited
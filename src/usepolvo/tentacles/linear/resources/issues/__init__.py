@@ -1,3 +1,3 @@
-from .resource import IssueResource
+from .resource import AsyncIssueResource, IssueResource
 
-__all__ = ["IssueResource"]
+__all__ = ["AsyncIssueResource", "IssueResource"]
@@ -1,9 +1,12 @@
 from typing import Any, Dict, Optional
 
 from usepolvo.arms.base_webhook import BaseWebhook
+from usepolvo.mantle.logger import get_logger
 from usepolvo.tentacles.linear.config import get_settings
 from usepolvo.tentacles.linear.webhooks.schemas import LinearWebhookPayload
 
+logger = get_logger(__name__)
+
 
 class LinearWebhook(BaseWebhook):
     def __init__(self, webhook_secret: Optional[str] = None):
@@ -25,7 +28,7 @@ class LinearWebhook(BaseWebhook):
         try:
             validated_payload = LinearWebhookPayload(**payload)
         except Exception as e:
-            print(f"Invalid payload: {e}")
+            logger.warning("Invalid payload: %s", e)
             raise
         event_type = validated_payload.get_event_type()
         handler = self.handlers.get(event_type, self.default_handler)
@@ -34,5 +37,5 @@ class LinearWebhook(BaseWebhook):
     async def default_handler(self, payload: LinearWebhookPayload):
         """Default handler for unhandled webhook events"""
         event_type = payload.get_event_type()
-        print(f"Unhandled event: {event_type}")
+        logger.info("Unhandled event: %s", event_type)
         return {"status": "ok"}
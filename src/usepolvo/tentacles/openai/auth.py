@@ -1,16 +1,18 @@
-from typing import Dict, Optional
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, Dict, Optional
 
 from usepolvo.arms.base_auth import BaseAuth
 from usepolvo.beak.exceptions import AuthenticationError
 from usepolvo.tentacles.openai.config import get_settings
 
+if TYPE_CHECKING:
+    import httpx
+    from openai import OpenAI
+
 
 class OpenAIAuth(BaseAuth):
     """OpenAI API key authentication implementation."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional["httpx.Client"] = None):
         super().__init__()
         self.settings = get_settings()
         self.api_key = api_key or self.settings.OPENAPI_API_KEY
@@ -18,14 +20,16 @@ class OpenAIAuth(BaseAuth):
         if not self.api_key:
             raise AuthenticationError("API key is required")
 
-        # Initialize OpenAI client
-        self._client = OpenAI(api_key=self.api_key)
+        # Initialize OpenAI client (the SDK is imported here to keep importing the tentacle fast)
+        from openai import OpenAI
+
+        self._client = OpenAI(api_key=self.api_key, http_client=http_client)
 
     def get_auth_headers(self) -> Dict[str, str]:
         """Get OpenAI-specific authentication headers."""
         return {"Authorization": f"Bearer {self.api_key}", "OpenAI-Organization": self.settings.OPENAI_ORG_ID or ""}
 
     @property
-    def client(self) -> OpenAI:
+    def client(self) -> "OpenAI":
         """Get configured OpenAI client."""
         return self._client
@@ -1,6 +1,4 @@
-from typing import Optional
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, Optional
 
 from usepolvo.arms.base_client import BaseClient
 from usepolvo.tentacles.openai.auth import OpenAIAuth
@@ -8,6 +6,9 @@ from usepolvo.tentacles.openai.completions.resource import CompletionResource
 from usepolvo.tentacles.openai.config import get_settings
 from usepolvo.tentacles.openai.rate_limiter import OpenAIRateLimiter
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 class OpenAIClient(BaseClient):
     """
@@ -27,10 +28,14 @@ class OpenAIClient(BaseClient):
 
         # Initialize settings and auth
         self.settings = get_settings()
-        self.auth = OpenAIAuth(api_key=api_key or self.settings.OPENAI_API_KEY)
+        cassette = self.http.cassette
+        self.auth = OpenAIAuth(
+            api_key=api_key or self.settings.OPENAI_API_KEY,
+            http_client=cassette.httpx_client() if cassette else None,
+        )
 
         # Get configured OpenAI client from auth
-        self.client: OpenAI = self.auth.client
+        self.client: "OpenAI" = self.auth.client
 
         # Initialize rate limiter
         self.rate_limiter = OpenAIRateLimiter()
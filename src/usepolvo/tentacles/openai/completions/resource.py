@@ -1,14 +1,15 @@
-from typing import Any, Dict
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, Any, Dict
 
 from usepolvo.arms.base_resource import BaseResource
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 class CompletionResource(BaseResource):
     def __init__(self, client):
         super().__init__(client)
-        self.openai: OpenAI = client.client
+        self.openai: "OpenAI" = client.client
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -19,7 +20,7 @@ class CompletionResource(BaseResource):
         :raises ValidationError: If the data is invalid
         """
         try:
-            self.client.rate_limiter.wait_if_needed()
+            self.client.rate_limiter.acquire()
             response = self.openai.chat.completions.create(**data)
             return response
         except Exception as e:
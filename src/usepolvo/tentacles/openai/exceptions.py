@@ -1,12 +1,11 @@
-import openai
-
-
 class OpenAIError(Exception):
     """Base class for all OpenAI-related exceptions."""
 
     @staticmethod
     def handle(e: Exception):
         """Handles OpenAI exceptions and raises appropriate usepolvo exceptions."""
+        import openai
+
         if isinstance(e, openai.error.AuthenticationError):
             raise OpenAIAuthenticationError(f"Authentication error: {e}")
         elif isinstance(e, openai.error.APIError):
@@ -1,3 +1,18 @@
-from usepolvo.tentacles.salesforce.client import SalesforceClient
+from typing import TYPE_CHECKING
 
-__all__ = ["SalesforceClient"]
+from usepolvo.ink.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from usepolvo.tentacles.salesforce.async_client import AsyncSalesforceClient
+    from usepolvo.tentacles.salesforce.client import SalesforceClient
+
+__all__ = ["AsyncSalesforceClient", "SalesforceClient"]
+
+# Clients and webhooks pull in HTTP stacks and vendor SDKs, so they are only imported when first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncSalesforceClient": "usepolvo.tentacles.salesforce.async_client",
+        "SalesforceClient": "usepolvo.tentacles.salesforce.client",
+    },
+)
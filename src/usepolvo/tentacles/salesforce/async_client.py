@@ -0,0 +1,99 @@
+from typing import Any, Dict, Optional
+
+from usepolvo.arms.base_async_client import AsyncBaseClient
+from usepolvo.beak.exceptions import AuthenticationError, PolvoError
+from usepolvo.tentacles.salesforce.auth import SalesforceAuth
+from usepolvo.tentacles.salesforce.client import CACHE_POLICIES
+from usepolvo.tentacles.salesforce.config import get_settings
+from usepolvo.tentacles.salesforce.exceptions import handle_salesforce_error
+from usepolvo.tentacles.salesforce.rate_limiter import SalesforceRateLimiter
+from usepolvo.tentacles.salesforce.resources.accounts import AsyncAccountResource
+from usepolvo.tentacles.salesforce.resources.opportunities import (
+    AsyncOpportunityResource,
+)
+
+
+class AsyncSalesforceClient(AsyncBaseClient):
+    """
+    Asyncio Salesforce API client with OAuth2 authentication.
+
+    Example usage:
+        async with AsyncSalesforceClient(
+            consumer_key="your-consumer-key",
+            consumer_secret="your-consumer-secret",
+            redirect_uri="your-redirect-uri"
+        ) as client:
+            accounts = await client.accounts.list()
+    """
+
+    def __init__(
+        self,
+        consumer_key: Optional[str] = None,
+        consumer_secret: Optional[str] = None,
+        redirect_uri: Optional[str] = None,
+    ):
+        """Initialize the async Salesforce client."""
+        super().__init__()
+
+        # Initialize settings and auth
+        self.settings = get_settings()
+        self.auth = SalesforceAuth(
+            consumer_key=consumer_key, consumer_secret=consumer_secret, redirect_uri=redirect_uri
+        )
+
+        # Set API URLs
+        self.base_url = self.settings.salesforce_api_base_url
+
+        # Compress large request bodies if enabled for this API
+        self.request_compression = self.settings.SALESFORCE_REQUEST_COMPRESSION
+
+        # Initialize rate limiter
+        self.rate_limiter = SalesforceRateLimiter()
+
+        # Register endpoint cache policies
+        for pattern, policy in CACHE_POLICIES:
+            self.cache_policies.add(pattern, **policy)
+
+        # Initialize resources
+        self._accounts = None
+        self._opportunities = None
+
+        # Handle authentication during initialization
+        self._handle_authentication()
+
+    def _handle_authentication(self) -> None:
+        """Start the OAuth2 flow if no access token exists yet."""
+        try:
+            if not self.auth.access_token:
+                self.auth.start_oauth_flow()
+        except Exception as e:
+            raise AuthenticationError(f"Failed to authenticate with Salesforce: {str(e)}")
+
+    @property
+    def accounts(self) -> AsyncAccountResource:
+        """Access the accounts resource."""
+        if self._accounts is None:
+            self._accounts = AsyncAccountResource(self)
+        return self._accounts
+
+    @property
+    def opportunities(self) -> AsyncOpportunityResource:
+        """Access the opportunities resource."""
+        if self._opportunities is None:
+            self._opportunities = AsyncOpportunityResource(self)
+        return self._opportunities
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        if not self.auth.instance_url:
+            raise AuthenticationError("Not authenticated. Call authenticate() first")
+
+        # Build the full URL using the instance_url, API version, and endpoint
+        url = f"{self.auth.instance_url}/services/data/{self.settings.SALESFORCE_API_VERSION}/{endpoint.lstrip('/')}"
+
+        try:
+            return await super()._request(method=method, endpoint=url, **kwargs)
+        except PolvoError:
+            # Rate limit, circuit and deadline errors already carry what callers need (e.g. retry_after)
+            raise
+        except Exception as e:
+            raise handle_salesforce_error(e)
@@ -60,10 +60,10 @@ class SalesforceAuth(BaseAuth):
             f"&redirect_uri={self.redirect_uri}"
         )
 
-        print("Please visit the following URL to authenticate with Salesforce:")
-        print(auth_url)
-        print("\nAfter authenticating, you will be redirected. Paste the entire redirect URL here:")
-        redirect_url = input().strip()
+        redirect_url = input(
+            f"Please visit the following URL to authenticate with Salesforce:\n{auth_url}\n\n"
+            "After authenticating, you will be redirected. Paste the entire redirect URL here:\n"
+        ).strip()
 
         # Parse the URL fragment where Salesforce returns the tokens
         parsed_url = urlparse(redirect_url)
@@ -1,14 +1,24 @@
 from typing import Any, Dict, Optional
 
 from usepolvo.arms.base_client import BaseClient
-from usepolvo.arms.base_rate_limiter import BaseRateLimiter
-from usepolvo.beak.exceptions import AuthenticationError
+from usepolvo.beak.exceptions import AuthenticationError, PolvoError
+from usepolvo.mantle.logger import get_logger
 from usepolvo.tentacles.salesforce.auth import SalesforceAuth
 from usepolvo.tentacles.salesforce.config import get_settings
 from usepolvo.tentacles.salesforce.exceptions import handle_salesforce_error
 from usepolvo.tentacles.salesforce.rate_limiter import SalesforceRateLimiter
 from usepolvo.tentacles.salesforce.resources.accounts import AccountResource
 
+logger = get_logger(__name__)
+
+# Object metadata changes rarely and can be cached for hours; org limits change on every call
+CACHE_POLICIES = [
+    (r"/sobjects/?$", {"ttl": 6 * 60 * 60}),
+    (r"/sobjects/\w+/describe/?$", {"ttl": 6 * 60 * 60}),
+    (r"/sobjects/\w+/?$", {"ttl": 60 * 60}),
+    (r"/limits/?$", {"cacheable": False}),
+]
+
 
 class SalesforceClient(BaseClient):
     """
@@ -46,15 +56,26 @@ class SalesforceClient(BaseClient):
         # Set API URLs
         self.base_url = self.settings.salesforce_api_base_url
 
+        # Compress large request bodies if enabled for this API
+        self.request_compression = self.settings.SALESFORCE_REQUEST_COMPRESSION
+
         # Initialize rate limiter
         self.rate_limiter = SalesforceRateLimiter()
 
+        # Register endpoint cache policies
+        for pattern, policy in CACHE_POLICIES:
+            self.cache_policies.add(pattern, **policy)
+
         # Initialize resources
         self._accounts = None
 
         # Handle authentication during initialization
         self._handle_authentication()
 
+        # Open a connection to the org's instance ahead of the first request
+        if self.prewarm_connections:
+            self.prewarm(self.auth.instance_url)
+
     def _handle_authentication(self) -> None:
         """
         Handle the authentication process during client initialization.
@@ -68,12 +89,10 @@ class SalesforceClient(BaseClient):
                 # Start OAuth2 flow to get tokens
                 tokens = self.auth.start_oauth_flow()
 
-                # Log successful authentication (optional)
-                print("Salesforce authentication successful")
+                logger.info("Salesforce authentication successful")
 
         except Exception as e:
-            # Log authentication failure
-            print(f"Salesforce authentication failed: {str(e)}")
+            logger.error("Salesforce authentication failed: %s", e)
             raise AuthenticationError(f"Failed to authenticate with Salesforce: {str(e)}")
 
     @property
@@ -83,7 +102,6 @@ class SalesforceClient(BaseClient):
             self._accounts = AccountResource(self)
         return self._accounts
 
-    @BaseRateLimiter.rate_limited
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         if not self.auth.instance_url:
             raise AuthenticationError("Not authenticated. Call authenticate() first")
@@ -94,6 +112,9 @@ class SalesforceClient(BaseClient):
         try:
             # Pass the full URL as the endpoint; do not pass base_url separately
             return super()._request(method=method, endpoint=url, **kwargs)
+        except PolvoError:
+            # Rate limit, circuit and deadline errors already carry what callers need (e.g. retry_after)
+            raise
         except Exception as e:
             raise handle_salesforce_error(e)
 
@@ -18,6 +18,7 @@ class SalesforceSettings(PolvoBaseSettings):
     SALESFORCE_ENV: str = "production"  # Can be 'production' or 'sandbox'
     SALESFORCE_CUSTOM_DOMAIN: Optional[str] = None
     SALESFORCE_API_VERSION: str = "v61.0"  # TODO: make this configurable
+    SALESFORCE_REQUEST_COMPRESSION: Optional[str] = None  # Compress large request bodies: gzip or deflate
 
     @property
     def salesforce_instance_url(self):
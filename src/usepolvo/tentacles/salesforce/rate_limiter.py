@@ -10,8 +10,7 @@ class SalesforceRateLimiter(BaseRateLimiter):
         self._initialize_window("day")
 
     def wait_if_needed(self):
-        with self.lock:
-            self._wait_if_window_full("day", self.requests_per_day, 86400)  # 24 hours in seconds
+        self._wait_if_window_full("day", self.requests_per_day, 86400)  # 24 hours in seconds
 
     def get_limits(self):
         return {"requests_per_day": self.requests_per_day}
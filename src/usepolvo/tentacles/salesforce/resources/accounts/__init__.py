@@ -1,3 +1,3 @@
-from .resource import AccountResource
+from .resource import AccountResource, AsyncAccountResource
 
-__all__ = ["AccountResource"]
+__all__ = ["AccountResource", "AsyncAccountResource"]
@@ -1,10 +1,12 @@
 # usepolvo/tentacles/salesforce/accounts/resource.py
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Union
 
+from usepolvo.arms.base_async_resource import AsyncBaseResource
 from usepolvo.arms.base_resource import BaseResource
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
 from usepolvo.tentacles.salesforce.resources.accounts.schemas import (
+    Account,
     AccountListResponse,
     AccountResponse,
 )
@@ -15,7 +17,12 @@ class AccountResource(BaseResource):
         super().__init__(client)
         self.base_path = "/sobjects/Account"
 
-    def list(self, page: int = 1, size: int = 10) -> AccountListResponse:
+    def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[AccountListResponse, Iterator[Account]]:
+        if stream:
+            # Yield validated accounts as they arrive instead of loading the whole response
+            return self._stream_records(self.base_path, ("recentItems",), Account)
         try:
             response = self.client._request("GET", self.base_path)
             result = AccountListResponse(**response)
@@ -50,6 +57,55 @@ class AccountResource(BaseResource):
 
     def delete(self, resource_id: str) -> None:
         try:
-            self.client._request("DELETE", f"{self.base_path}{resource_id}")
+            self.client._request("DELETE", f"{self.base_path}/{resource_id}")
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Account with ID {resource_id} not found")
+
+
+class AsyncAccountResource(AsyncBaseResource):
+    def __init__(self, client):
+        super().__init__(client)
+        self.base_path = "/sobjects/Account"
+
+    async def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[AccountListResponse, AsyncIterator[Account]]:
+        if stream:
+            # Yield validated accounts as they arrive instead of loading the whole response
+            return self._stream_records(self.base_path, ("recentItems",), Account)
+        try:
+            response = await self.client._request("GET", self.base_path)
+            return AccountListResponse(**response)
+        except Exception as e:
+            self.client.handle_error(e)
+
+    async def get(self, resource_id: str) -> AccountResponse:
+        try:
+            response = await self.client._request("GET", f"{self.base_path}/{resource_id}")
+            return AccountResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Account with ID {resource_id} not found")
+
+    async def create(self, data: Dict[str, Any]) -> AccountResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("POST", self.base_path, json=prepared_data)
+            return AccountResponse(**response)
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for creating account: {str(e)}")
+
+    async def update(self, resource_id: str, data: Dict[str, Any]) -> AccountResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("PATCH", f"{self.base_path}/{resource_id}", json=prepared_data)
+            return AccountResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Account with ID {resource_id} not found")
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for updating account: {str(e)}")
+
+    async def delete(self, resource_id: str) -> None:
+        try:
+            await self.client._request("DELETE", f"{self.base_path}/{resource_id}")
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Account with ID {resource_id} not found")
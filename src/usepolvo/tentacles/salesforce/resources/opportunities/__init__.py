@@ -1,3 +1,3 @@
-from .resource import OpportunityResource
+from .resource import AsyncOpportunityResource, OpportunityResource
 
-__all__ = ["OpportunityResource"]
+__all__ = ["OpportunityResource", "AsyncOpportunityResource"]
@@ -1,10 +1,12 @@
 # usepolvo/tentacles/salesforce/opportunities/resource.py
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Iterator, Union
 
+from usepolvo.arms.base_async_resource import AsyncBaseResource
 from usepolvo.arms.base_resource import BaseResource
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
 from usepolvo.tentacles.salesforce.resources.opportunities.schemas import (
+    Opportunity,
     OpportunityListResponse,
     OpportunityResponse,
 )
@@ -15,17 +17,16 @@ class OpportunityResource(BaseResource):
         super().__init__(client)
         self.base_path = "/sobjects/Opportunity"
 
-    def list(self, page: int = 1, size: int = 10) -> OpportunityListResponse:
-        cache_key = f"list_opportunities_page_{page}_size_{size}"
-        if cache_key in self.client.cache:
-            return self.client.cache[cache_key]
-
-        # Ensure the correct endpoint is being used
+    def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[OpportunityListResponse, Iterator[Opportunity]]:
+        if stream:
+            # Yield validated opportunities as they arrive instead of loading the whole response
+            return self._stream_records(self.base_path, ("recentItems",), Opportunity)
+        # GET responses are cached by the client
         try:
             response = self.client._request("GET", self.base_path)
-            result = OpportunityListResponse(**response)
-            self.client.cache[cache_key] = result
-            return result
+            return OpportunityListResponse(**response)
         except Exception as e:
             self.client.handle_error(e)
 
@@ -56,6 +57,55 @@ class OpportunityResource(BaseResource):
 
     def delete(self, resource_id: str) -> None:
         try:
-            self.client._request("DELETE", f"{self.base_path}{resource_id}")
+            self.client._request("DELETE", f"{self.base_path}/{resource_id}")
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Opportunity with ID {resource_id} not found")
+
+
+class AsyncOpportunityResource(AsyncBaseResource):
+    def __init__(self, client):
+        super().__init__(client)
+        self.base_path = "/sobjects/Opportunity"
+
+    async def list(
+        self, page: int = 1, size: int = 10, stream: bool = False
+    ) -> Union[OpportunityListResponse, AsyncIterator[Opportunity]]:
+        if stream:
+            # Yield validated opportunities as they arrive instead of loading the whole response
+            return self._stream_records(self.base_path, ("recentItems",), Opportunity)
+        try:
+            response = await self.client._request("GET", self.base_path)
+            return OpportunityListResponse(**response)
+        except Exception as e:
+            self.client.handle_error(e)
+
+    async def get(self, resource_id: str) -> OpportunityResponse:
+        try:
+            response = await self.client._request("GET", f"{self.base_path}/{resource_id}")
+            return OpportunityResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Opportunity with ID {resource_id} not found")
+
+    async def create(self, data: Dict[str, Any]) -> OpportunityResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("POST", self.base_path, json=prepared_data)
+            return OpportunityResponse(**response)
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for creating opportunity: {str(e)}")
+
+    async def update(self, resource_id: str, data: Dict[str, Any]) -> OpportunityResponse:
+        try:
+            prepared_data = self._prepare_request_data(data)
+            response = await self.client._request("PATCH", f"{self.base_path}/{resource_id}", json=prepared_data)
+            return OpportunityResponse(**response)
+        except ResourceNotFoundError:
+            raise ResourceNotFoundError(f"Opportunity with ID {resource_id} not found")
+        except ValidationError as e:
+            raise ValidationError(f"Invalid data for updating opportunity: {str(e)}")
+
+    async def delete(self, resource_id: str) -> None:
+        try:
+            await self.client._request("DELETE", f"{self.base_path}/{resource_id}")
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Opportunity with ID {resource_id} not found")
@@ -1,4 +1,18 @@
-from usepolvo.tentacles.stripe.client import StripeClient
-from usepolvo.tentacles.stripe.webhook.handler import StripeWebhook
+from typing import TYPE_CHECKING
+
+from usepolvo.ink.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from usepolvo.tentacles.stripe.client import StripeClient
+    from usepolvo.tentacles.stripe.webhook.handler import StripeWebhook
 
 __all__ = ["StripeClient", "StripeWebhook"]
+
+# Clients and webhooks pull in HTTP stacks and vendor SDKs, so they are only imported when first used
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "StripeClient": "usepolvo.tentacles.stripe.client",
+        "StripeWebhook": "usepolvo.tentacles.stripe.webhook.handler",
+    },
+)
@@ -1,8 +1,6 @@
-from functools import wraps
+import uuid
 from typing import Any, Dict, Optional
 
-import stripe
-
 from usepolvo.arms.base_client import BaseClient
 from usepolvo.tentacles.stripe.config import get_settings
 from usepolvo.tentacles.stripe.rate_limiter import StripeRateLimiter
@@ -13,9 +11,15 @@ class StripeClient(BaseClient):
     def __init__(self, api_key: Optional[str] = None):
         super().__init__()
         settings = get_settings()
+        # The SDK is imported here to keep importing the tentacle fast
+        import stripe
+
         stripe.api_key = api_key or settings.STRIPE_API_KEY
+        if self.http.cassette is not None:
+            stripe.default_http_client = stripe.RequestsClient(session=self.http.create_session())
         self.stripe = stripe
         self.rate_limiter = StripeRateLimiter()
+        self.retrier.policy.transient_errors += (stripe.error.APIConnectionError,)
         self._customers = None
 
     @property
@@ -24,14 +28,24 @@ class StripeClient(BaseClient):
             self._customers = CustomerResource(self)
         return self._customers
 
-    def rate_limited_execute(self, method, *args, **kwargs):
-        @wraps(method)
-        def wrapper(*args, **kwargs):
-            is_write_operation = kwargs.get("is_write_operation", False)
-            self.rate_limiter.wait_if_needed(is_write_operation=is_write_operation)
+    def rate_limited_execute(self, method, *args, is_write_operation: bool = False, **kwargs):
+        """
+        Execute a Stripe SDK method with rate limiting and retries.
+
+        Writes are sent with an idempotency key, so every call is safe to retry.
+
+        :param method: The Stripe SDK method to call (e.g. stripe.Customer.create)
+        :param is_write_operation: Whether the call creates, modifies or deletes objects
+        :return: The result of the SDK method
+        """
+        if is_write_operation:
+            kwargs.setdefault("idempotency_key", str(uuid.uuid4()))
+
+        def attempt():
+            self.rate_limiter.acquire(is_write_operation=is_write_operation)
             return method(*args, **kwargs)
 
-        return wrapper(*args, **kwargs)
+        return self.retrier.call(attempt, idempotent=True)
 
     def get_pagination_params(
         self, page: int = 1, size: int = 10, starting_after: Optional[str] = None, ending_before: Optional[str] = None
@@ -1,7 +1,5 @@
 # usepolvo/tentacles/stripe/exceptions.py
 
-import stripe
-
 
 class StripeError(Exception):
     """Base class for all Stripe-related exceptions."""
@@ -9,6 +7,8 @@ class StripeError(Exception):
     @staticmethod
     def handle(e: Exception):
         """Handles Stripe exceptions and raises appropriate usepolvo exceptions."""
+        import stripe
+
         if isinstance(e, stripe.error.AuthenticationError):
             raise StripeAuthenticationError(f"Authentication error: {e}")
         elif isinstance(e, stripe.error.APIConnectionError):
@@ -12,11 +12,10 @@ class StripeRateLimiter(BaseRateLimiter):
         self._initialize_window("write")
 
     def wait_if_needed(self, is_write_operation: bool = False):
-        with self.lock:
-            if is_write_operation:
-                self._wait_if_window_full("write", self.write_limit, 1)  # 1 second window
-            else:
-                self._wait_if_window_full("read", self.read_limit, 1)  # 1 second window
+        if is_write_operation:
+            self._wait_if_window_full("write", self.write_limit, 1)  # 1 second window
+        else:
+            self._wait_if_window_full("read", self.read_limit, 1)  # 1 second window
 
     def get_limits(self):
         return {"read_limit": self.read_limit, "write_limit": self.write_limit}
@@ -1,7 +1,5 @@
 from typing import Any, Dict, List
 
-from stripe.error import StripeError
-
 from usepolvo.arms.base_resource import BaseResource
 from usepolvo.beak.exceptions import ResourceNotFoundError, ValidationError
 
@@ -25,11 +23,10 @@ class CustomerResource(BaseResource):
         :return: A list of customer objects
         """
         try:
-            self.client.rate_limiter.wait_if_needed(is_write_operation=False)
             params = self.client.get_pagination_params(page, size, starting_after, ending_before)
             params.update(kwargs)
-            return self.stripe.Customer.list(**params)
-        except StripeError as e:
+            return self.client.rate_limited_execute(self.stripe.Customer.list, **params)
+        except self.stripe.error.StripeError as e:
             self.client.handle_error(e)
 
     def get(self, resource_id: str) -> Dict[str, Any]:
@@ -41,11 +38,10 @@ class CustomerResource(BaseResource):
         :raises ResourceNotFoundError: If the customer is not found
         """
         try:
-            self.client.rate_limiter.wait_if_needed(is_write_operation=False)
-            return self.stripe.Customer.retrieve(resource_id)
+            return self.client.rate_limited_execute(self.stripe.Customer.retrieve, resource_id)
         except self.stripe.error.InvalidRequestError:
             raise ResourceNotFoundError(f"Customer with ID {resource_id} not found")
-        except StripeError as e:
+        except self.stripe.error.StripeError as e:
             self.client.handle_error(e)
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -57,11 +53,10 @@ class CustomerResource(BaseResource):
         :raises ValidationError: If the data is invalid
         """
         try:
-            self.client.rate_limiter.wait_if_needed(is_write_operation=True)
-            return self.stripe.Customer.create(**data)
+            return self.client.rate_limited_execute(self.stripe.Customer.create, is_write_operation=True, **data)
         except self.stripe.error.InvalidRequestError as e:
             raise ValidationError(f"Invalid data for creating customer: {str(e)}")
-        except StripeError as e:
+        except self.stripe.error.StripeError as e:
             self.client.handle_error(e)
 
     def update(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -75,15 +70,16 @@ class CustomerResource(BaseResource):
         :raises ValidationError: If the data is invalid
         """
         try:
-            self.client.rate_limiter.wait_if_needed(is_write_operation=True)
-            customer = self.stripe.Customer.modify(resource_id, **data)
+            customer = self.client.rate_limited_execute(
+                self.stripe.Customer.modify, resource_id, is_write_operation=True, **data
+            )
             return customer
         except self.stripe.error.InvalidRequestError as e:
             if "No such customer" in str(e):
                 raise ResourceNotFoundError(f"Customer with ID {resource_id} not found")
             else:
                 raise ValidationError(f"Invalid data for updating customer: {str(e)}")
-        except StripeError as e:
+        except self.stripe.error.StripeError as e:
             self.client.handle_error(e)
 
     def delete(self, resource_id: str) -> None:
@@ -94,9 +90,8 @@ class CustomerResource(BaseResource):
         :raises ResourceNotFoundError: If the customer is not found
         """
         try:
-            self.client.rate_limiter.wait_if_needed(is_write_operation=True)
-            self.stripe.Customer.delete(resource_id)
+            self.client.rate_limited_execute(self.stripe.Customer.delete, resource_id, is_write_operation=True)
         except self.stripe.error.InvalidRequestError:
             raise ResourceNotFoundError(f"Customer with ID {resource_id} not found")
-        except StripeError as e:
+        except self.stripe.error.StripeError as e:
             self.client.handle_error(e)
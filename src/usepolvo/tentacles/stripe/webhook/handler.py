@@ -1,4 +1,7 @@
 from usepolvo.arms.base_webhook import BaseWebhook
+from usepolvo.mantle.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class StripeWebhook(BaseWebhook):
@@ -7,5 +10,5 @@ class StripeWebhook(BaseWebhook):
 
     async def default_handler(self, payload):
         """Default handler for unhandled Stripe webhook events."""
-        print(f"Received unhandled Stripe webhook event: {payload.get('type')}")
+        logger.info("Received unhandled Stripe webhook event: %s", payload.get("type"))
         return {"status": "unhandled", "event_type": payload.get("type")}
@@ -0,0 +1,77 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from usepolvo.arms.base_client import BaseClient
+from usepolvo.arms.circuit_breaker import CircuitBreakerRegistry
+from usepolvo.arms.retry import Retrier, RetryPolicy
+
+
+class DummyClient(BaseClient):
+    def __init__(self):
+        super().__init__()
+        self.base_url = "https://api.example.com"
+        self.retrier = Retrier(RetryPolicy(max_attempts=3, base_delay=0.001))
+        # Keep the failures a test provokes out of the circuit breakers every other client shares
+        self.circuit_breakers = CircuitBreakerRegistry()
+
+
+@pytest.fixture
+def make_client():
+    """
+    Build clients of https://api.example.com with fast retries and their own circuit breakers.
+
+    Keyword arguments are set as attributes of the client (e.g. rate_limiter=...).
+    """
+
+    def make(**attributes) -> DummyClient:
+        client = DummyClient()
+        for name, value in attributes.items():
+            setattr(client, name, value)
+        return client
+
+    return make
+
+
+@pytest.fixture
+def client(make_client) -> DummyClient:
+    return make_client()
+
+
+@pytest.fixture
+def make_response():
+    """
+    Build mock responses for patching client.http.request.
+
+    The body is `content`, or `data` encoded as JSON; statuses of 400 and above raise
+    HTTPError from raise_for_status(), like requests.
+    """
+
+    def make(status_code: int = 200, data=None, content: bytes = None, headers=None) -> MagicMock:
+        response = MagicMock(
+            status_code=status_code,
+            content=json.dumps(data).encode() if content is None else content,
+            headers=headers or {},
+            text="error",
+        )
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+        return response
+
+    return make
+
+
+@pytest.fixture
+def make_http_response():
+    """Build real requests.Response objects, for tests that go through a transport adapter (e.g. cassettes)."""
+
+    def make(status_code: int = 200, data=None, headers=None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(data).encode()
+        response.headers.update({"Content-Type": "application/json", **(headers or {})})
+        return response
+
+    return make
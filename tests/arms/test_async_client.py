@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from usepolvo.arms.base_async_client import AsyncBaseClient
+from usepolvo.arms.base_auth import BaseAuth
+from usepolvo.beak.exceptions import APIError, AuthenticationError
+
+
+class DummyAuth(BaseAuth):
+    def get_auth_headers(self):
+        return {"Authorization": "Bearer token"}
+
+
+class DummyAsyncClient(AsyncBaseClient):
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url
+        self.auth = DummyAuth()
+        self.retrier.policy.base_delay = 0.001
+
+
+@pytest_asyncio.fixture
+async def server():
+    calls = []
+
+    async def item(request):
+        calls.append(request.headers.get("Authorization"))
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": request.match_info["item_id"]})
+
+    async def forbidden(request):
+        return web.Response(status=403, text="nope")
+
+    async def broken(request):
+        return web.Response(status=500, text="boom")
+
+    app = web.Application()
+    app.router.add_get("/items/{item_id}", item)
+    app.router.add_get("/forbidden", forbidden)
+    app.router.add_get("/broken", broken)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", calls
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests(server):
+    base_url, calls = server
+    async with DummyAsyncClient(base_url) as client:
+        results = await asyncio.gather(*(client._request("GET", f"/items/{i}") for i in range(20)))
+    assert [result["id"] for result in results] == [str(i) for i in range(20)]
+    assert calls == ["Bearer token"] * 20
+
+
+@pytest.mark.asyncio
+async def test_get_responses_are_cached(server):
+    base_url, calls = server
+    async with DummyAsyncClient(base_url) as client:
+        await client._request("GET", "/items/1")
+        await client._request("GET", "/items/1")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_error_mapping(server):
+    base_url, _ = server
+    async with DummyAsyncClient(base_url) as client:
+        with pytest.raises(AuthenticationError):
+            await client._request("GET", "/forbidden")
+        with pytest.raises(APIError):
+            await client._request("GET", "/broken")
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from usepolvo.arms.base_async_resource import AsyncBaseResource
+from usepolvo.arms.base_resource import BaseResource
+from usepolvo.arms.bulk import arun_bulk, chunked, run_bulk
+from usepolvo.beak.exceptions import (
+    BulkOperationError,
+    ResourceNotFoundError,
+    ValidationError,
+)
+
+
+class ItemResource(BaseResource):
+    def __init__(self, client):
+        super().__init__(client)
+        self.items = {}
+        self.lock = threading.Lock()
+
+    def list(self):
+        return list(self.items.values())
+
+    def get(self, resource_id):
+        if resource_id not in self.items:
+            raise ResourceNotFoundError(resource_type="Item", resource_id=resource_id)
+        return self.items[resource_id]
+
+    def create(self, data):
+        if "name" not in data:
+            raise ValidationError("name is required")
+        with self.lock:
+            self.items[data["name"]] = data
+        return data
+
+    def update(self, resource_id, data):
+        item = self.get(resource_id)
+        item.update(data)
+        return item
+
+    def delete(self, resource_id):
+        self.get(resource_id)
+        del self.items[resource_id]
+
+
+class AsyncItemResource(AsyncBaseResource):
+    list = get = update = delete = None
+
+    async def create(self, data):
+        await asyncio.sleep(0)
+        if "name" not in data:
+            raise ValidationError("name is required")
+        return data
+
+
+def test_results_keep_input_order_and_failures_do_not_abort():
+    def work(n):
+        time.sleep(0.001 * (10 - n))
+        if n % 3 == 0:
+            raise ValueError(n)
+        return n * 2
+
+    result = run_bulk(work, range(10), workers=4)
+    assert [item.index for item in result] == list(range(10))
+    assert [item.input for item in result.failed] == [0, 3, 6, 9]
+    assert [item.result for item in result.succeeded] == [2, 4, 8, 10, 14, 16]
+    assert result.results[:3] == [None, 2, 4]
+    with pytest.raises(BulkOperationError) as excinfo:
+        result.raise_for_errors()
+    assert excinfo.value.result is result
+
+
+def test_concurrency_is_bounded_by_workers():
+    active = peak = 0
+    lock = threading.Lock()
+
+    def work(n):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.005)
+        with lock:
+            active -= 1
+
+    run_bulk(work, range(30), workers=3)
+    assert 1 < peak <= 3
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_resource_bulk_methods(client):
+    resource = ItemResource(client)
+
+    created = resource.bulk_create([{"name": "a"}, {"title": "missing name"}, {"name": "b"}])
+    assert [item.ok for item in created] == [True, False, True]
+    assert isinstance(created.failed[0].error, ValidationError)
+
+    updated = resource.bulk_update([("a", {"size": 1}), ("missing", {"size": 2})])
+    assert updated.results == [{"name": "a", "size": 1}, None]
+    assert isinstance(updated.failed[0].error, ResourceNotFoundError)
+
+    assert resource.bulk_get(["a", "b"]).results == [{"name": "a", "size": 1}, {"name": "b"}]
+    resource.bulk_delete(["a", "b"]).raise_for_errors()
+    assert resource.items == {}
+
+
+def test_async_bulk(client):
+    async def run():
+        resource = AsyncItemResource(client)
+        return await resource.bulk_create([{"name": "a"}, {}, {"name": "b"}], workers=2)
+
+    result = asyncio.run(run())
+    assert [item.ok for item in result] == [True, False, True]
+    assert result.results == [{"name": "a"}, None, {"name": "b"}]
+
+
+def test_async_concurrency_is_bounded_by_workers():
+    active = peak = 0
+
+    async def work(n):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return n
+
+    result = asyncio.run(arun_bulk(work, range(20), workers=4))
+    assert result.results == list(range(20))
+    assert peak == 4
+
+
+def test_async_inputs_are_pulled_as_workers_free_up():
+    pulled = 0
+
+    def inputs():
+        nonlocal pulled
+        for n in range(1000):
+            pulled += 1
+            yield n
+
+    async def work(n):
+        # Never more than one input per worker taken ahead of the calls made so far
+        assert pulled <= n + 4
+        await asyncio.sleep(0)
+        return n
+
+    assert asyncio.run(arun_bulk(work, inputs(), workers=4)).results == list(range(1000))
@@ -0,0 +1,132 @@
+from unittest.mock import patch
+
+from usepolvo.arms.cache import CachePolicy, CachePolicyTable, build_cache_key
+
+
+def cached_entry(client, endpoint, params=None):
+    request = {"params": params, "headers": client._build_headers()}
+    return client.cache.get(client._get_cache_key("GET", client._build_url(endpoint), True, request))
+
+
+def expire(client, endpoint):
+    cached_entry(client, endpoint).expires_at = 0
+
+
+def test_cache_key_ignores_param_order():
+    first = build_cache_key("GET", "https://api.example.com/items", params={"a": 1, "b": "x"})
+    second = build_cache_key("get", "https://API.example.com/items", params={"b": "x", "a": "1"})
+    assert first == second
+    assert len(first) == 64
+
+
+def test_cache_key_merges_url_query_and_drops_none():
+    first = build_cache_key("GET", "https://api.example.com/items?b=2", params={"a": 1, "c": None})
+    second = build_cache_key("GET", "https://api.example.com/items", params=[("b", 2), ("a", 1)])
+    assert first == second
+
+
+def test_cache_key_is_scoped_by_auth_headers():
+    first = build_cache_key("GET", "https://api.example.com/items", headers={"Authorization": "Bearer a"})
+    second = build_cache_key("GET", "https://api.example.com/items", headers={"Authorization": "Bearer b"})
+    assert first != second
+
+
+def test_policy_table_first_match_wins():
+    table = CachePolicyTable(CachePolicy(ttl=600))
+    table.add(r"/describe/?$", ttl=3600)
+    table.add(r"/limits/?$", cacheable=False)
+    assert table.get("https://x/sobjects/Account/describe").ttl == 3600
+    assert not table.get("https://x/limits").cacheable
+    assert table.get("https://x/other").ttl == 600
+
+
+def test_uncacheable_endpoint_is_always_fetched(client, make_response):
+    client.cache_policies.add(r"/volatile$", cacheable=False)
+    with patch.object(client.http, "request", return_value=make_response(200, {"n": 1})) as mock_request:
+        client._request("GET", "/volatile")
+        client._request("GET", "/volatile")
+    assert mock_request.call_count == 2
+
+
+def test_oversized_entries_are_not_cached(client, make_response):
+    client.cache_policies.add(r"/big$", max_entry_size=10)
+    with patch.object(
+        client.http, "request", return_value=make_response(200, {"n": 1}, b'{"n": "xx"}')
+    ) as mock_request:
+        client._request("GET", "/big")
+        client._request("GET", "/big")
+    assert mock_request.call_count == 2
+
+
+def test_reordered_params_hit_cache(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {"n": 1})) as mock_request:
+        client._request("GET", "/items", params={"page": 1, "size": 10})
+        assert client._request("GET", "/items", params={"size": 10, "page": 1}) == {"n": 1}
+    assert mock_request.call_count == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(client, make_response):
+    first = make_response(200, {"n": 1}, headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+    not_modified = make_response(304, content=b"")
+    with patch.object(client.http, "request", side_effect=[first, not_modified]) as mock_request:
+        client._request("GET", "/items")
+        expire(client, "/items")
+        assert client._request("GET", "/items") == {"n": 1}
+        # The 304 refreshed the entry, so this is a fresh cache hit
+        assert client._request("GET", "/items") == {"n": 1}
+
+    assert mock_request.call_count == 2
+    headers = mock_request.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    not_modified.json.assert_not_called()
+
+
+def test_changed_resource_replaces_entry(client, make_response):
+    first = make_response(200, {"n": 1}, headers={"ETag": '"v1"'})
+    changed = make_response(200, {"n": 2}, headers={"ETag": '"v2"'})
+    with patch.object(client.http, "request", side_effect=[first, changed]):
+        client._request("GET", "/items")
+        expire(client, "/items")
+        assert client._request("GET", "/items") == {"n": 2}
+    assert cached_entry(client, "/items").etag == '"v2"'
+
+
+def test_expired_entry_without_validators_is_not_returned(client, make_response):
+    with patch.object(client.http, "request", side_effect=[make_response(200, {"n": 1}), make_response(200, {"n": 2})]):
+        client._request("GET", "/items")
+        expire(client, "/items")
+        assert client._request("GET", "/items") == {"n": 2}
+
+
+def test_writes_evict_affected_entries_only(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {"n": 1})) as mock_request:
+        for endpoint in ("/accounts", "/accounts/1", "/accounts/1/contacts", "/accounts/2"):
+            client._request("GET", endpoint)
+        client._request("PATCH", "/accounts/1", json={"name": "x"})
+        assert mock_request.call_count == 5
+
+        assert cached_entry(client, "/accounts") is None
+        assert cached_entry(client, "/accounts/1") is None
+        assert cached_entry(client, "/accounts/1/contacts") is None
+        assert cached_entry(client, "/accounts/2") is not None
+
+
+def test_create_evicts_list_pages(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {"n": 1})):
+        client._request("GET", "/accounts/", params={"page": 2})
+        client._request("GET", "/accounts/2")
+        client._request("POST", "/accounts/", json={"name": "x"})
+    assert cached_entry(client, "/accounts/", params={"page": 2}) is None
+    assert cached_entry(client, "/accounts/2") is not None
+
+
+def test_streamed_list_is_not_cached(client, make_response):
+    response = make_response()
+    response.iter_content.return_value = iter([b'{"records": [{"id": 1},', b' {"id": 2}]}'])
+    with patch.object(client.http, "request", return_value=response) as mock_request:
+        records = client._request("GET", "/accounts", stream=True, stream_path=("records",))
+        assert list(records) == [{"id": 1}, {"id": 2}]
+    assert mock_request.call_args.kwargs["stream"] is True
+    response.__exit__.assert_called_once()
+    assert cached_entry(client, "/accounts") is None
@@ -0,0 +1,147 @@
+import fnmatch
+import os
+import stat
+import time
+
+import pytest
+
+from usepolvo.arms.cache import CacheEntry
+from usepolvo.arms.cache_backends import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+    create_cache_backend,
+)
+from usepolvo.beak.config import PolvoSettings
+from usepolvo.beak.enums import CacheBackend
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, 0))
+        return value if expires_at > time.time() else None
+
+    def set(self, key, value, px):
+        self.data[key] = (value, time.time() + px / 1000)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def sadd(self, key, member):
+        members, expires_at = self.data.get(key, (set(), float("inf")))
+        self.data[key] = (members | {member}, expires_at)
+
+    def smembers(self, key):
+        return self.get(key) or set()
+
+    def pexpire(self, key, ms, nx=False, gt=False):
+        members, expires_at = self.data[key]
+        new_expires_at = time.time() + ms / 1000
+        if (nx and expires_at != float("inf")) or (gt and new_expires_at <= expires_at):
+            return False
+        self.data[key] = (members, new_expires_at)
+        return True
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCacheBackend(maxsize=10)
+    elif request.param == "sqlite":
+        backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"), maxsize=10)
+        yield backend
+        backend.close()
+    else:
+        yield RedisCacheBackend(FakeRedis())
+
+
+def test_entry_round_trips_through_bytes():
+    entry = CacheEntry({"id": 1, "tags": ["a"]}, 60, etag='"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+    restored = CacheEntry.from_bytes(entry.to_bytes())
+    assert restored.value == entry.value
+    assert (restored.ttl, restored.etag, restored.last_modified) == (60, '"v1"', entry.last_modified)
+    assert restored.expires_at == entry.expires_at
+
+
+def test_backend_get_set_delete_clear(backend):
+    backend.set("a", CacheEntry({"n": 1}, 60), 60)
+    assert backend.get("a").value == {"n": 1}
+    backend.delete("a")
+    assert backend.get("a") is None
+    backend.set("b", CacheEntry({"n": 2}, 60), 60)
+    backend.clear()
+    assert backend.get("b") is None
+
+
+def test_backend_evicts_after_retention(backend):
+    backend.set("a", CacheEntry({"n": 1}, 0.01), 0.01)
+    time.sleep(0.05)
+    assert backend.get("a") is None
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer = SQLiteCacheBackend(path=path)
+    reader = SQLiteCacheBackend(path=path)
+    writer.set("a", CacheEntry({"n": 1}, 60, etag='"v1"'), 60)
+    assert reader.get("a").etag == '"v1"'
+
+
+def test_sqlite_backend_files_are_private_to_the_user(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    backend = SQLiteCacheBackend()
+    backend.set("a", CacheEntry({"n": 1}, 60), 60)
+    assert backend.path == str(tmp_path / "usepolvo" / "cache.sqlite3")
+    assert stat.S_IMODE(os.stat(tmp_path / "usepolvo").st_mode) == 0o700
+    for path in (backend.path, backend.path + "-wal"):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    backend.close()
+
+
+def test_sqlite_backend_keeps_newest_entries(tmp_path):
+    backend = SQLiteCacheBackend(path=str(tmp_path / "cache.sqlite3"), maxsize=2)
+    for key in ("a", "b", "c"):
+        backend.set(key, CacheEntry({}, 60), 60)
+    assert backend.get("a") is None
+    assert backend.get("c") is not None
+
+
+def test_backend_selected_from_settings(tmp_path):
+    settings = PolvoSettings(CACHE_BACKEND=CacheBackend.SQLITE, CACHE_PATH=str(tmp_path / "c.sqlite3"))
+    assert isinstance(create_cache_backend(settings), SQLiteCacheBackend)
+    assert isinstance(create_cache_backend(PolvoSettings()), MemoryCacheBackend)
+    with pytest.raises(ValueError):
+        create_cache_backend(PolvoSettings(CACHE_BACKEND=CacheBackend.REDIS))
+
+
+def test_backend_invalidates_by_tag_and_prefix(backend):
+    backend.set("list", CacheEntry({}, 60), 60, tags=["https://x/accounts"])
+    backend.set("record", CacheEntry({}, 60), 60, tags=["https://x/accounts/1"])
+    backend.set("child", CacheEntry({}, 60), 60, tags=["https://x/accounts/1/contacts"])
+    backend.set("grandchild", CacheEntry({}, 60), 60, tags=["https://x/accounts/1/contacts/7/notes"])
+    backend.set("other", CacheEntry({}, 60), 60, tags=["https://x/accounts/10"])
+
+    removed = backend.invalidate(["https://x/accounts/1", "https://x/accounts"], ["https://x/accounts/1/"])
+
+    assert removed == 4
+    assert [backend.get(key) for key in ("list", "record", "child", "grandchild")] == [None] * 4
+    assert backend.get("other") is not None
+
+
+def test_redis_prefix_invalidation_does_not_scan_the_keyspace():
+    backend = RedisCacheBackend(FakeRedis())
+    backend.set("child", CacheEntry({}, 60), 60, tags=["https://x/accounts/1/contacts"])
+    backend.client.scan_iter = None
+
+    assert backend.invalidate(["https://x/accounts/1"], ["https://x/accounts/1/"]) == 1
+    assert backend.get("child") is None
@@ -0,0 +1,158 @@
+import gzip
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from urllib3 import HTTPResponse
+
+from usepolvo.arms import cassette as cassette_module
+from usepolvo.arms.cassette import Cassette, request_key
+from usepolvo.arms.session_pool import SessionPool
+from usepolvo.beak.config import get_settings
+from usepolvo.beak.enums import CassetteMode
+from usepolvo.beak.exceptions import CassetteError
+
+
+def record(path, *responses, elapsed=None):
+    """Record GETs of https://api.example.com/things/<n>, answered with the given responses."""
+    cassette = Cassette(str(path), CassetteMode.RECORD)
+    pool = SessionPool(cassette=cassette)
+    with patch("requests.adapters.HTTPAdapter.send", side_effect=responses):
+        for i, _ in enumerate(responses):
+            pool.get(f"https://api.example.com/things/{i % 2}")
+    if elapsed is not None:
+        for interaction in cassette.interactions:
+            interaction["elapsed"] = elapsed
+    cassette.save()
+    return cassette
+
+
+def test_request_key():
+    assert request_key("get", "https://api.example.com/a?b=2&a=1") == request_key(
+        "GET", "https://api.example.com/a?a=1&b=2"
+    )
+    assert request_key("POST", "https://api.example.com/a", b"{}") != request_key("POST", "https://api.example.com/a")
+    assert request_key("POST", "https://api.example.com/a", '{"a": 1}') == request_key(
+        "POST", "https://api.example.com/a", gzip.compress(b'{"a": 1}'), "gzip"
+    )
+
+
+def test_record_and_replay_through_session_pool(tmp_path, make_http_response):
+    path = tmp_path / "cassette.json.gz"
+    record(
+        path,
+        make_http_response(200, {"id": 0}, headers={"Content-Encoding": "gzip", "X-RateLimit-Remaining": "9"}),
+        elapsed=0,
+    )
+    assert json.loads(gzip.decompress(path.read_bytes()))["interactions"][0]["status"] == 200
+
+    pool = SessionPool(cassette=Cassette(str(path)))
+    with patch("requests.adapters.HTTPAdapter.send", side_effect=AssertionError("network used")):
+        response = pool.get("https://api.example.com/things/0")
+    assert response.status_code == 200
+    assert response.json() == {"id": 0}
+    assert response.headers["X-RateLimit-Remaining"] == "9"
+    assert "Content-Encoding" not in response.headers
+
+
+def test_identical_requests_replay_in_order_then_repeat(tmp_path, make_http_response):
+    path = tmp_path / "cassette.json"
+    record(
+        path,
+        make_http_response(200, {"n": 1}),
+        make_http_response(200, {"n": 2}),
+        make_http_response(200, {"n": 3}),
+        elapsed=0,
+    )
+    pool = SessionPool(cassette=Cassette(str(path)))
+    assert [pool.get("https://api.example.com/things/0").json()["n"] for _ in range(3)] == [1, 3, 3]
+    assert pool.get("https://api.example.com/things/1").json() == {"n": 2}
+
+
+def test_credentials_are_redacted_when_recording(tmp_path, make_http_response):
+    path = tmp_path / "cassette.json"
+    token = {"access_token": "00Dxx!secret", "refresh_token": "5Aep-secret", "instance_url": "https://x.example.com"}
+    cassette = Cassette(str(path), CassetteMode.RECORD)
+    with patch(
+        "requests.adapters.HTTPAdapter.send", return_value=make_http_response(200, token, headers={"X-Api-Key": "k"})
+    ):
+        SessionPool(cassette=cassette).post("https://login.example.com/services/oauth2/token?password=hunter2")
+    cassette.save()
+    assert "secret" not in path.read_text() and "hunter2" not in path.read_text()
+
+    pool = SessionPool(cassette=Cassette(str(path)))
+    response = pool.post("https://login.example.com/services/oauth2/token?password=other")
+    assert response.json() == {**token, "access_token": "REDACTED", "refresh_token": "REDACTED"}
+    assert response.headers["X-Api-Key"] == "REDACTED"
+
+
+def test_redaction_hook_replaces_the_default(tmp_path, make_http_response):
+    def drop_names(interaction):
+        interaction["body"] = interaction["body"].replace("Ada", "***")
+        return interaction
+
+    cassette = Cassette(str(tmp_path / "cassette.json"), CassetteMode.RECORD, redact=drop_names)
+    with patch(
+        "requests.adapters.HTTPAdapter.send", return_value=make_http_response(200, {"name": "Ada", "token": "t"})
+    ):
+        SessionPool(cassette=cassette).get("https://api.example.com/things/0")
+    assert json.loads(cassette.interactions[0]["body"]) == {"name": "***", "token": "t"}
+
+
+def test_unrecorded_request_raises(tmp_path, make_http_response):
+    path = tmp_path / "cassette.json"
+    record(path, make_http_response(200, {}))
+    with pytest.raises(CassetteError):
+        SessionPool(cassette=Cassette(str(path))).get("https://api.example.com/other")
+    with pytest.raises(CassetteError):
+        Cassette(str(tmp_path / "missing.json"))
+
+
+def test_replay_timing_is_scaled(tmp_path, make_http_response):
+    path = tmp_path / "cassette.json"
+    record(path, make_http_response(200, {}), elapsed=0.5)
+    with patch("usepolvo.arms.cassette.time.sleep") as sleep:
+        SessionPool(cassette=Cassette(str(path), time_scale=0.1)).get("https://api.example.com/things/0")
+    sleep.assert_called_once_with(pytest.approx(0.05))
+
+
+def test_httpx_transport_round_trip(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    recorder = Cassette(path, CassetteMode.RECORD)
+    client = recorder.httpx_client()
+    client._transport.transport = httpx.MockTransport(lambda request: httpx.Response(201, json={"echo": 1}))
+    assert client.post("https://api.example.com/v1/chat", json={"q": "hi"}).json() == {"echo": 1}
+    recorder.save()
+
+    response = Cassette(path).httpx_client().post("https://api.example.com/v1/chat", json={"q": "hi"})
+    assert response.status_code == 201
+    assert response.json() == {"echo": 1}
+
+
+def test_urllib3_pool_manager_round_trip(tmp_path):
+    class FakePoolManager:
+        def request(self, method, url, **kwargs):
+            return HTTPResponse(body=b'{"results": []}', status=200, headers={"Content-Type": "application/json"})
+
+    path = str(tmp_path / "cassette.json")
+    recorder = Cassette(path, CassetteMode.RECORD)
+    recorder.pool_manager(FakePoolManager()).request("GET", "https://api.example.com/contacts", fields={"limit": 2})
+    recorder.save()
+
+    response = Cassette(path).pool_manager(None).request("GET", "https://api.example.com/contacts?limit=2")
+    assert response.status == 200
+    assert response.data == b'{"results": []}'
+
+
+def test_clients_share_the_cassette_selected_by_settings(tmp_path, monkeypatch, make_client, make_http_response):
+    path = str(tmp_path / "cassette.json")
+    record(path, make_http_response(200, {"id": 0}))
+    settings = get_settings()
+    monkeypatch.setattr(settings, "CASSETTE", path)
+    monkeypatch.setattr(settings, "CASSETTE_TIME_SCALE", 0)
+    monkeypatch.setattr(cassette_module, "_cassettes", {})
+
+    client = make_client()
+    assert client.http.cassette is make_client().http.cassette
+    assert client._request("GET", "/things/0", use_cache=False) == {"id": 0}
@@ -0,0 +1,104 @@
+import time
+from contextlib import nullcontext
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from usepolvo.arms.circuit_breaker import CircuitBreaker, is_failure
+from usepolvo.arms.retry import TRANSIENT_ERRORS
+from usepolvo.beak.exceptions import APIError, CircuitOpenError
+
+
+class CountingRateLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def wait_if_needed(self):
+        self.calls += 1
+
+
+@pytest.fixture
+def client(make_client):
+    client = make_client(rate_limiter=CountingRateLimiter())
+    client.circuit_breaker_config.update(min_calls=2, open_duration=60)
+    return client
+
+
+def classify(error):
+    return is_failure(error, TRANSIENT_ERRORS)
+
+
+def run(breaker, error=None, duration=0.0):
+    with pytest.raises(type(error)) if error else nullcontext():
+        with breaker.guard(classify):
+            time.sleep(duration)
+            if error:
+                raise error
+
+
+def test_opens_at_failure_rate_and_fails_fast():
+    breaker = CircuitBreaker("api", failure_rate=0.5, min_calls=4)
+    run(breaker)
+    run(breaker)
+    run(breaker, APIError("boom", status_code=503))
+    assert breaker.state == "closed"
+    run(breaker, ConnectionError("reset"))
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.check()
+    assert 0 < exc_info.value.retry_after <= 30
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_client_errors_do_not_count_as_failures():
+    breaker = CircuitBreaker("api", min_calls=2)
+    for _ in range(5):
+        run(breaker, APIError("bad", status_code=404))
+    assert breaker.state == "closed"
+    assert breaker.stats()["successes"] == 5
+
+
+def test_half_open_trials_close_or_reopen():
+    breaker = CircuitBreaker("api", min_calls=1, open_duration=0.05, half_open_calls=2)
+    run(breaker, ConnectionError("reset"))
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.state == "half_open"
+    run(breaker)
+    run(breaker, APIError("boom", status_code=500))
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    run(breaker)
+    run(breaker)
+    assert breaker.state == "closed"
+    assert breaker.stats()["opened"] == 2
+
+
+def test_slow_calls_open_the_circuit():
+    breaker = CircuitBreaker("api", slow_call_duration=0.01, slow_call_rate=0.5, min_calls=2)
+    run(breaker, duration=0.02)
+    run(breaker, duration=0.02)
+    assert breaker.state == "open"
+
+
+def test_open_circuit_spends_no_requests_or_rate_limit(client):
+    with patch.object(client.http, "request", side_effect=requests.exceptions.ConnectionError("reset")) as mock_request:
+        # The third attempt is rejected by the circuit the first two opened
+        with pytest.raises(CircuitOpenError):
+            client._request("GET", "/accounts")
+        with pytest.raises(CircuitOpenError):
+            client._request("GET", "/accounts/1")
+    assert mock_request.call_count == 2
+    assert client.rate_limiter.calls == 2
+    assert client.get_circuit_stats()["api.example.com"]["state"] == "open"
+
+
+def test_hosts_have_separate_circuits(client, make_response):
+    response = make_response(200, {})
+    with patch.object(client.http, "request", side_effect=requests.exceptions.ConnectionError("reset")):
+        with pytest.raises(CircuitOpenError):
+            client._request("GET", "/accounts")
+    with patch.object(client.http, "request", return_value=response):
+        assert client._request("GET", "https://other.example.com/accounts") == {}
@@ -0,0 +1,87 @@
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from usepolvo.arms.base_async_client import AsyncBaseClient
+from usepolvo.beak.exceptions import ConfigurationError
+
+RECORDS = [{"Name": f"Account {i}", "Industry": "Technology"} for i in range(200)]
+
+
+class DummyAsyncClient(AsyncBaseClient):
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url
+        self.request_compression = "gzip"
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(request_compression="gzip")
+
+
+def sent(mock_request):
+    return mock_request.call_args.kwargs
+
+
+def test_large_write_body_is_compressed(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {})) as mock_request:
+        client._request("POST", "/composite", json={"records": RECORDS})
+
+    kwargs = sent(mock_request)
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == {"records": RECORDS}
+    stats = client.get_compression_stats()
+    assert stats["requests_compressed"] == 1
+    assert stats["request_ratio"] > 5
+
+
+def test_small_bodies_and_reads_are_sent_as_is(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {})) as mock_request:
+        client._request("POST", "/accounts", json={"Name": "Acme"})
+        assert sent(mock_request)["json"] == {"Name": "Acme"}
+        client._request("GET", "/accounts", use_cache=False)
+        assert "Content-Encoding" not in sent(mock_request)["headers"]
+        assert "gzip" in sent(mock_request)["headers"]["Accept-Encoding"]
+    assert client.get_compression_stats()["requests_compressed"] == 0
+
+
+def test_unsupported_encoding_is_a_configuration_error(client):
+    client.request_compression = "lzma"
+    with pytest.raises(ConfigurationError):
+        client._request("POST", "/composite", json={"records": RECORDS})
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def composite(request):
+        # aiohttp decompresses the request body transparently
+        payload = await request.json()
+        body = gzip.compress(json.dumps({"received": payload["records"]}).encode())
+        return web.Response(body=body, headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+
+    app = web.Application()
+    app.router.add_post("/composite", composite)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_round_trip_is_compressed_both_ways(server):
+    async with DummyAsyncClient(server) as client:
+        result = await client._request("POST", "/composite", json={"records": RECORDS})
+    assert result == {"received": RECORDS}
+    stats = client.get_compression_stats()
+    assert stats["requests_compressed"] == 1
+    assert stats["responses_compressed"] == 1
+    assert stats["response_ratio"] > 5
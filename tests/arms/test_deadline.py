@@ -0,0 +1,91 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from usepolvo.arms.base_rate_limiter import BaseRateLimiter
+from usepolvo.arms.deadline import deadline_scope, remaining, timeout_for
+from usepolvo.beak.exceptions import DeadlineExceededError, RateLimitError
+
+
+class OnePerMinuteRateLimiter(BaseRateLimiter):
+    def __init__(self):
+        super().__init__()
+        self._initialize_window("minute")
+
+    def wait_if_needed(self):
+        with self.lock:
+            self._wait_if_window_full("minute", 1, 60)
+
+    def get_limits(self):
+        return {"minute": 1}
+
+
+def test_nested_scopes_only_shorten():
+    assert remaining() is None
+    with deadline_scope(10):
+        with deadline_scope(0.5):
+            assert remaining() <= 0.5
+        with deadline_scope(60):
+            assert 9 < remaining() <= 10
+    assert remaining() is None
+
+
+def test_timeouts_are_clamped_to_deadline():
+    assert timeout_for(30) == 30
+    with deadline_scope(1):
+        assert timeout_for(30) <= 1
+        assert timeout_for(None) <= 1
+        connect, read = timeout_for((0.1, 30))
+        assert connect == 0.1 and read <= 1
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededError):
+            timeout_for(30)
+
+
+def test_every_attempt_has_a_timeout_within_deadline(client, make_response):
+    with patch.object(client.http.session, "request", return_value=make_response(200, {})) as mock_request:
+        client._request("GET", "/items")
+        assert mock_request.call_args.kwargs["timeout"] == client.settings.HTTP_TIMEOUT
+        client._request("GET", "/other", deadline=2)
+        assert 0 < mock_request.call_args.kwargs["timeout"] <= 2
+
+
+def test_retries_stop_at_deadline(client, make_response):
+    response = make_response(429, headers={"Retry-After": "1"})
+    start = time.monotonic()
+    with patch.object(client.http.session, "request", return_value=response) as mock_request:
+        with pytest.raises(RateLimitError):
+            client._request("GET", "/items", deadline=0.5)
+    assert time.monotonic() - start < 0.5
+    assert mock_request.call_count == 1
+    assert client.get_retry_stats()["deadline_exceeded"] == 1
+
+
+def test_rate_limit_wait_fails_fast_past_deadline(make_client, make_response):
+    client = make_client(rate_limiter=OnePerMinuteRateLimiter())
+    with patch.object(client.http.session, "request", return_value=make_response(200, {})):
+        client._request("GET", "/items")
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            client._request("GET", "/other", deadline=1)
+    assert time.monotonic() - start < 0.5
+
+
+def test_streamed_body_is_read_within_deadline(client, make_response):
+    def slow_chunks(chunk_size):
+        yield b'[{"id": 1},'
+        time.sleep(0.2)
+        yield b' {"id": 2},'
+        time.sleep(0.2)
+        yield b' {"id": 3}]'
+
+    response = make_response()
+    response.iter_content.side_effect = slow_chunks
+    with patch.object(client.http.session, "request", return_value=response):
+        items = client._request("GET", "/items", stream=True, deadline=0.3)
+        # The call has returned, but reading the rest of the body still counts against the deadline
+        assert next(items) == {"id": 1}
+        with pytest.raises(DeadlineExceededError):
+            list(items)
+    response.__exit__.assert_called_once()
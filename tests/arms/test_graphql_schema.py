@@ -0,0 +1,114 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from graphql import build_schema, introspection_from_schema
+
+from usepolvo.arms.base_graphql_client import BaseGraphQLClient
+from usepolvo.arms.graphql_schema import SchemaCache
+from usepolvo.beak.config import get_settings
+from usepolvo.beak.enums import GraphQLSchemaMode
+from usepolvo.beak.exceptions import APIError
+
+ENDPOINT = "https://api.example.com/graphql"
+INTROSPECTION = introspection_from_schema(
+    build_schema("type Query { issue(id: ID!): Issue } type Issue { id: ID! title: String }")
+)
+
+
+class DummyAuth:
+    def get_auth_headers(self):
+        return {"Authorization": "token"}
+
+
+class ExampleClient(BaseGraphQLClient):
+    def __init__(self):
+        self.base_url = ENDPOINT
+        self.auth = DummyAuth()
+        super().__init__()
+
+
+@pytest.fixture(autouse=True)
+def schema_settings(monkeypatch, tmp_path):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "GRAPHQL_SCHEMA_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "GRAPHQL_SCHEMA_MODE", GraphQLSchemaMode.CACHED)
+    return settings
+
+
+def test_snapshot_round_trip(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    assert cache.load(ENDPOINT) is None
+    cache.save(ENDPOINT, "2024-01", INTROSPECTION)
+    introspection, saved_at = cache.load(ENDPOINT, "2024-01")
+    assert introspection == INTROSPECTION
+    assert saved_at == pytest.approx(time.time(), abs=5)
+    assert cache.load(ENDPOINT, "2024-02") is None
+    assert cache.load("https://other.example.com/graphql", "2024-01") is None
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    cache = SchemaCache(str(tmp_path))
+    with open(cache.path(ENDPOINT), "w") as f:
+        f.write("{not json")
+    assert cache.load(ENDPOINT) is None
+
+
+def test_missing_snapshot_is_fetched_in_the_background(tmp_path, make_response):
+    with patch("requests.Session.request", return_value=make_response(200, {"data": INTROSPECTION})) as request:
+        client = ExampleClient()
+        client._schema_refresh.join()
+
+    assert request.call_args.kwargs["json"]["query"].lstrip().startswith("query IntrospectionQuery")
+    assert client._client.schema.get_type("Issue") is not None
+    assert SchemaCache(str(tmp_path)).load(ENDPOINT) is not None
+
+
+def test_fresh_snapshot_is_used_without_introspection(tmp_path):
+    SchemaCache(str(tmp_path)).save(ENDPOINT, "", INTROSPECTION)
+    with patch("requests.Session.request") as request:
+        client = ExampleClient()
+    request.assert_not_called()
+    assert client._schema_refresh is None
+
+    # Invalid queries are rejected locally, without a round trip
+    with patch.object(client._client.transport, "execute") as execute, patch.object(client, "handle_error") as handle:
+        client.execute_query("{ issue(id: 1) { missing } }")
+    execute.assert_not_called()
+    assert "missing" in str(handle.call_args.args[0])
+
+
+def test_stale_snapshot_is_used_while_refreshing(tmp_path, schema_settings, monkeypatch, make_response):
+    SchemaCache(str(tmp_path)).save(ENDPOINT, "", INTROSPECTION)
+    monkeypatch.setattr(schema_settings, "GRAPHQL_SCHEMA_MAX_AGE", 0)
+    with patch("requests.Session.request", return_value=make_response(200, {"data": INTROSPECTION})) as request:
+        client = ExampleClient()
+        assert client._client.schema is not None
+        client._schema_refresh.join()
+    request.assert_called_once()
+
+
+def test_failed_background_refresh_keeps_running_unvalidated(make_response):
+    with patch("requests.Session.request", return_value=make_response(200, {"errors": [{"message": "nope"}]})):
+        client = ExampleClient()
+        client._schema_refresh.join()
+    assert client._client.schema is None
+
+
+def test_explicit_refresh_raises_on_errors(make_response):
+    with patch("requests.Session.request", return_value=make_response(200, {"errors": [{"message": "nope"}]})):
+        client = ExampleClient()
+        client._schema_refresh.join()
+        with pytest.raises(APIError):
+            client.refresh_schema()
+
+
+def test_validation_can_be_disabled(schema_settings, monkeypatch):
+    monkeypatch.setattr(schema_settings, "GRAPHQL_SCHEMA_MODE", GraphQLSchemaMode.NONE)
+    with patch("requests.Session.request") as request:
+        client = ExampleClient()
+    request.assert_not_called()
+    assert client._client.schema is None
+    assert client._client.fetch_schema_from_transport is False
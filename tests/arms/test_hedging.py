@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from usepolvo.arms.base_rate_limiter import BaseRateLimiter
+from usepolvo.arms.hedging import Hedger, LatencyTracker
+from usepolvo.beak.enums import RateLimitAlgorithm
+
+
+class PerMinuteRateLimiter(BaseRateLimiter):
+    def __init__(self, limit):
+        super().__init__(RateLimitAlgorithm.LOG)
+        self.limit = limit
+        self._initialize_window("minute")
+
+    def wait_if_needed(self):
+        self._wait_if_window_full("minute", self.limit, 60)
+
+    def get_limits(self):
+        return {"requests_per_minute": self.limit}
+
+
+@pytest.fixture
+def slow_first_response(make_response):
+    calls = []
+    lock = threading.Lock()
+
+    def request(*args, **kwargs):
+        with lock:
+            calls.append(None)
+            first = len(calls) == 1
+        time.sleep(0.3 if first else 0.01)
+        return make_response(200, {"copy": 1 if first else 2})
+
+    return request
+
+
+def warmed_hedger(latency=0.01):
+    hedger = Hedger(min_samples=5)
+    for _ in range(5):
+        hedger.latencies.record(latency)
+    return hedger
+
+
+def test_quantile():
+    tracker = LatencyTracker(window=100)
+    assert tracker.quantile(0.95) is None
+    for ms in range(100):
+        tracker.record(ms / 1000)
+    assert tracker.quantile(0.95) == 0.095
+    assert tracker.quantile(0.5) == 0.05
+
+
+def test_no_hedging_until_warmed_up():
+    hedger = Hedger(min_samples=5)
+    assert hedger.call(lambda: "ok") == "ok"
+    assert hedger.stats()["hedged"] == 0
+    assert hedger.stats()["delay"] is None
+
+
+def test_stalled_request_is_answered_by_its_hedge():
+    hedger = warmed_hedger()
+    threads = []
+
+    def request():
+        threads.append(threading.current_thread())
+        if len(threads) == 1:
+            time.sleep(0.3)
+            raise TimeoutError("read timed out")
+        return "hedge"
+
+    assert hedger.call(request) == "hedge"
+    # The first copy is sent by the caller; only the hedge uses a worker
+    assert threads[0] is threading.current_thread()
+    assert threads[1] is not threading.current_thread()
+    stats = hedger.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    hedger.close()
+
+
+def test_slow_answer_is_kept_and_hedge_response_closed():
+    hedger = warmed_hedger()
+    hedge_response = MagicMock()
+
+    def request():
+        time.sleep(0.1)
+        return "slow"
+
+    assert hedger.call(request, hedge_func=lambda: hedge_response) == "slow"
+    assert hedger.stats()["hedged"] == 1
+    assert hedger.stats()["hedge_wins"] == 0
+    hedge_response.close.assert_called_once()
+    hedger.close()
+
+
+def test_concurrency_is_not_capped_by_hedge_workers():
+    hedger = Hedger(min_samples=5, max_workers=2)
+    for _ in range(5):
+        hedger.latencies.record(0.01)
+
+    def request():
+        time.sleep(0.1)
+        return "ok"
+
+    threads = [threading.Thread(target=hedger.call, args=(request,)) for _ in range(20)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start < 0.3
+    stats = hedger.stats()
+    # No hedge waits for a worker: those that found none were skipped
+    assert stats["hedged"] <= 4
+    assert stats["hedged"] + stats["skipped"] == 20
+    hedger.close()
+
+
+def test_hedge_failure_falls_back_to_primary():
+    hedger = warmed_hedger()
+    calls = []
+
+    def request():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            return "primary"
+        raise ConnectionError("reset")
+
+    assert hedger.call(request) == "primary"
+    assert hedger.stats()["hedge_wins"] == 0
+    hedger.close()
+
+
+@pytest.mark.asyncio
+async def test_async_loser_is_cancelled():
+    hedger = warmed_hedger()
+    cancelled = asyncio.Event()
+    calls = []
+
+    async def request():
+        calls.append(None)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "fast"
+
+    assert await hedger.async_call(request) == "fast"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.parametrize("limit, copies", [(1, 1), (2, 2)])
+def test_client_hedges_only_with_a_free_rate_limit_slot(make_client, slow_first_response, limit, copies):
+    client = make_client(hedger=warmed_hedger(), rate_limiter=PerMinuteRateLimiter(limit))
+    with patch.object(client.http, "request", side_effect=slow_first_response) as request:
+        data = client._request("GET", "/items", use_cache=False)
+    assert request.call_count == copies
+    # The caller's own copy answered
+    assert data == {"copy": 1}
+    assert client.hedger.stats()["skipped"] == 2 - copies
+    # Every copy sent took a slot: the limiter is now full
+    assert not client.rate_limiter.try_acquire()
+    # And was counted by the host's breaker
+    assert client.circuit_breakers.stats()["api.example.com"]["successes"] == copies
+    client.hedger.close()
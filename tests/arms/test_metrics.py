@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from usepolvo.arms.hooks import Hooks
+from usepolvo.arms.metrics import (
+    Histogram,
+    MetricsCollector,
+    endpoint_template,
+    tentacle_name,
+)
+from usepolvo.beak.exceptions import ConfigurationError
+
+
+class DummyRateLimiter:
+    def wait_if_needed(self):
+        pass
+
+
+@pytest.fixture
+def make_client(make_client):
+    return lambda: make_client(rate_limiter=DummyRateLimiter())
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
+
+
+def test_endpoint_template_hides_ids():
+    assert endpoint_template("https://api.example.com/hr/v1/applicants/4f1c2a/") == "/hr/v1/applicants/{id}/"
+    assert endpoint_template("https://x.my.salesforce.com/services/data/v61.0/sobjects/Account/001xx") == (
+        "/services/data/v61.0/sobjects/Account/{id}"
+    )
+    assert endpoint_template("https://api.example.com/items?page=2") == "/items"
+
+
+def test_tentacle_name(client):
+    assert tentacle_name(client) == "dummy"
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(0.99) is None
+
+
+def test_hooks_are_called_through_the_request_lifecycle(client, make_response):
+    events = []
+    for event in ("on_request", "on_response", "on_retry", "on_rate_limit_wait", "on_cache_hit", "on_cache_miss"):
+        client.add_hook(event, lambda event=event, **info: events.append((event, info)))
+
+    responses = [make_response(503), make_response(200, {"ok": True})]
+    with patch.object(client.http, "request", side_effect=responses):
+        client._request("GET", "/items")
+        client._request("GET", "/items")
+
+    names = [event for event, _ in events]
+    assert names == [
+        "on_cache_miss",
+        "on_rate_limit_wait",
+        "on_request",
+        "on_response",
+        "on_retry",
+        "on_rate_limit_wait",
+        "on_request",
+        "on_response",
+        "on_cache_hit",
+    ]
+    responses = [info for event, info in events if event == "on_response"]
+    assert [info["status"] for info in responses] == [503, 200]
+    assert responses[1]["bytes_in"] == len(b'{"ok": true}')
+    retry = next(info for event, info in events if event == "on_retry")
+    assert retry["attempt"] == 1 and retry["error"].status_code == 503
+    assert all(info["client"] is client for _, info in events)
+
+
+def test_failing_hook_does_not_fail_the_request(client, make_response):
+    client.add_hook("on_request", lambda **info: 1 / 0)
+    with patch.object(client.http, "request", return_value=make_response(200, {"ok": True})):
+        with pytest.warns(RuntimeWarning):
+            assert client._request("POST", "/items", json={}) == {"ok": True}
+
+
+def test_unknown_hook_is_rejected():
+    with pytest.raises(ConfigurationError):
+        Hooks().register("on_everything", print)
+
+
+def test_metrics_collector(client, make_response):
+    collector = client.enable_metrics()
+
+    responses = [make_response(503), make_response(200, {"ok": True}), make_response(201, {"id": 1})]
+    with patch.object(client.http, "request", side_effect=responses):
+        client._request("GET", "/items/42")
+        client._request("GET", "/items/42")
+        client._request("POST", "/items", json={"name": "a"})
+    with patch.object(client.http, "request", side_effect=requests.exceptions.ConnectionError("down")):
+        with pytest.raises(Exception):
+            client._request("DELETE", "/items/42", use_cache=False)
+
+    totals = collector.snapshot()["tentacles"]["dummy"]
+    assert totals["requests"] == 6  # 503 + 200 + 201 + 3 failed DELETE attempts
+    assert totals["errors"] == 4
+    assert totals["retries"] == 3
+    assert totals["cache_hits"] == 1 and totals["cache_misses"] == 1
+    assert totals["cache_hit_ratio"] == 0.5
+    assert totals["bytes_out"] == len(b'{"name":"a"}')
+
+    routes = {(r["method"], r["endpoint"], r["status"]): r["count"] for r in collector.snapshot()["requests"]}
+    assert routes == {
+        ("GET", "/items/{id}", "503"): 1,
+        ("GET", "/items/{id}", "200"): 1,
+        ("POST", "/items", "201"): 1,
+        ("DELETE", "/items/{id}", "error"): 3,
+    }
+
+    text = collector.to_prometheus()
+    assert "# TYPE usepolvo_request_duration_seconds histogram" in text
+    assert (
+        'usepolvo_request_duration_seconds_count{tentacle="dummy",method="GET",endpoint="/items/{id}",status="200"} 1'
+        in text
+    )
+    assert 'usepolvo_cache_hits_total{tentacle="dummy"} 1' in text
+    assert 'usepolvo_retries_total{tentacle="dummy"} 3' in text
+
+
+def test_collector_is_shared_between_clients(make_client, make_response):
+    collector = MetricsCollector()
+    first, second = make_client(), make_client()
+    first.enable_metrics(collector)
+    second.enable_metrics(collector)
+    with patch.object(first.http, "request", return_value=make_response(200, {})):
+        first._request("POST", "/items", json={})
+    with patch.object(second.http, "request", return_value=make_response(200, {})):
+        second._request("POST", "/items", json={})
+    assert collector.snapshot()["tentacles"]["dummy"]["requests"] == 2
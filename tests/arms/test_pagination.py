@@ -0,0 +1,244 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from usepolvo.arms.base_async_resource import AsyncBaseResource
+from usepolvo.arms.base_resource import BaseResource
+from usepolvo.beak.enums import PaginationMethod
+
+RECORDS = [{"id": i} for i in range(25)]
+
+
+class ItemServer:
+    """Serves RECORDS in place of a client's _request, recording every call."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+        # Largest page the server returns, whatever size is asked for
+        self.max_page_size = len(RECORDS)
+
+    def __call__(self, method, endpoint, params=None, **kwargs):
+        self.calls.append((endpoint, params))
+        if self.client.pagination_method == PaginationMethod.CURSOR:
+            if endpoint.startswith("https://"):
+                start = int(endpoint.rsplit("=", 1)[1])
+            else:
+                start = int(params.get("after", 0))
+            end = start + params["limit"] if params else start + 10
+            if end >= len(RECORDS):
+                return {"results": RECORDS[start:end], "next": None}
+            # Alternate between bare cursors and next links
+            cursor = f"https://api.example.com/items?after={end}" if start else str(end)
+            return {"results": RECORDS[start:end], "next": cursor}
+        if "offset" in params:
+            start = params["offset"]
+        else:
+            start = (params["page"] - 1) * params["per_page"]
+        size = min(params.get("limit") or params.get("per_page"), self.max_page_size)
+        return {"count": len(RECORDS), "results": RECORDS[start : start + size]}
+
+
+class AsyncItemServer(ItemServer):
+    async def __call__(self, method, endpoint, params=None, **kwargs):
+        await asyncio.sleep(0)
+        return ItemServer.__call__(self, method, endpoint, params=params, **kwargs)
+
+
+@pytest.fixture
+def make_client(make_client):
+    def make(method=PaginationMethod.OFFSET_LIMIT, server=ItemServer):
+        client = make_client(pagination_method=method)
+        client.server = client._request = server(client)
+        return client
+
+    return make
+
+
+class Item:
+    def __init__(self, id):
+        self.id = id
+
+
+class ItemResource(BaseResource):
+    list_path = "/items"
+    records_key = "results"
+    count_key = "count"
+    record_schema = Item
+
+    list = get = create = update = delete = None
+
+
+class AsyncItemResource(AsyncBaseResource):
+    list_path = "/items"
+    records_key = "results"
+    count_key = "count"
+    record_schema = Item
+
+    list = get = create = update = delete = None
+
+
+def test_pagination_params_follow_the_method(client):
+    assert client.get_pagination_params(3, 10) == {"offset": 20, "limit": 10}
+    client.pagination_method = PaginationMethod.PAGE
+    assert client.get_pagination_params(3, 10) == {"page": 3, "per_page": 10}
+    client.pagination_method = PaginationMethod.PAGE_SIZE
+    assert client.get_pagination_params(3) == {"page": 3, "size": client.default_page_size}
+    client.pagination_method = PaginationMethod.CURSOR
+    assert client.get_pagination_params(size=10) == {"limit": 10}
+    assert client.get_pagination_params(size=10, cursor="abc") == {"limit": 10, "after": "abc"}
+
+
+@pytest.mark.parametrize("method", [PaginationMethod.OFFSET_LIMIT, PaginationMethod.PAGE, PaginationMethod.CURSOR])
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_all_yields_every_record(make_client, method, prefetch):
+    client = make_client(method)
+    resource = ItemResource(client)
+
+    pages = list(resource.pages(size=10, prefetch=prefetch))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [item.id for item in resource.iter_all(size=10, prefetch=prefetch)] == list(range(25))
+
+
+def test_cursor_pagination_follows_next_links(make_client):
+    client = make_client(PaginationMethod.CURSOR)
+    list(ItemResource(client).pages(size=10, prefetch=False))
+    assert client.server.calls == [
+        ("/items", {"limit": 10}),
+        ("/items", {"limit": 10, "after": "10"}),
+        ("https://api.example.com/items?after=20", None),
+    ]
+
+
+def test_extra_params_are_sent_with_every_page(client):
+    list(ItemResource(client).pages(size=10, prefetch=False, status="active"))
+    assert all(params["status"] == "active" for _, params in client.server.calls)
+
+
+def test_next_page_is_fetched_while_current_page_is_consumed(client):
+    fetched = threading.Event()
+    request = client._request
+
+    def slow_request(*args, **kwargs):
+        time.sleep(0.05)
+        result = request(*args, **kwargs)
+        if len(client.server.calls) == 2:
+            fetched.set()
+        return result
+
+    client._request = slow_request
+    pages = ItemResource(client).pages(size=10, prefetch=True)
+    next(pages)
+    # The second page arrives without asking for it
+    assert fetched.wait(1)
+    pages.close()
+
+
+def test_stopping_early_fetches_at_most_one_extra_page(client):
+    pages = ItemResource(client).pages(size=10, prefetch=True)
+    next(pages)
+    pages.close()
+    time.sleep(0.05)
+    assert len(client.server.calls) <= 2
+
+
+@pytest.mark.parametrize("method", [PaginationMethod.OFFSET_LIMIT, PaginationMethod.CURSOR])
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_async_iter_all_yields_every_record(make_client, method, prefetch):
+    async def scan():
+        resource = AsyncItemResource(make_client(method, AsyncItemServer))
+        return [item.id async for item in resource.iter_all(size=10, prefetch=prefetch)]
+
+    assert asyncio.run(scan()) == list(range(25))
+
+
+class ConcurrencyProbe:
+    """Wraps a client's _request to record how many requests run at once."""
+
+    def __init__(self, client, delay=0.02):
+        self.request = client._request
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        client._request = self
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            return self.request(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_scan_fetches_known_pages_in_parallel(client):
+    probe = ConcurrencyProbe(client)
+
+    assert [item.id for item in ItemResource(client).scan(size=5, workers=4)] == list(range(25))
+    assert len(client.server.calls) == 5
+    assert probe.peak > 1
+
+
+def test_unordered_scan_yields_pages_as_they_arrive(make_client):
+    client = make_client(PaginationMethod.PAGE)
+    request = client._request
+
+    def request_with_slow_second_page(*args, params=None, **kwargs):
+        if params["page"] == 2:
+            time.sleep(0.1)
+        return request(*args, params=params, **kwargs)
+
+    client._request = request_with_slow_second_page
+    ids = [item.id for item in ItemResource(client).scan(size=5, workers=4, ordered=False)]
+    assert sorted(ids) == list(range(25))
+    assert ids[-5:] == list(range(5, 10))
+
+
+@pytest.mark.parametrize("method", [PaginationMethod.OFFSET_LIMIT, PaginationMethod.PAGE])
+@pytest.mark.parametrize("count_key", ["count", None])
+def test_pages_capped_by_the_server_are_all_fetched(make_client, method, count_key):
+    client = make_client(method)
+    client.server.max_page_size = 7
+    resource = ItemResource(client)
+    resource.count_key = count_key
+
+    assert [item.id for item in resource.iter_all(size=10, prefetch=False)] == list(range(25))
+    assert [item.id for item in resource.scan(size=10, workers=4)] == list(range(25))
+
+
+def test_scan_without_total_count_fetches_sequentially(client):
+    probe = ConcurrencyProbe(client)
+    resource = ItemResource(client)
+    resource.count_key = None
+
+    assert [item.id for item in resource.scan(size=5, workers=4)] == list(range(25))
+    assert probe.peak == 1
+
+
+def test_async_scan_fetches_known_pages_concurrently(make_client):
+    active = peak = 0
+
+    async def slow_request(*args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return await client.server(*args, **kwargs)
+
+    client = make_client(server=AsyncItemServer)
+    client._request = slow_request
+
+    async def scan(ordered):
+        resource = AsyncItemResource(client)
+        return [item.id async for item in resource.scan(size=5, workers=4, ordered=ordered)]
+
+    assert asyncio.run(scan(True)) == list(range(25))
+    assert sorted(asyncio.run(scan(False))) == list(range(25))
+    assert peak > 1
@@ -0,0 +1,336 @@
+import asyncio
+import bisect
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from usepolvo.arms.base_rate_limiter import BaseRateLimiter
+from usepolvo.arms.deadline import deadline_scope
+from usepolvo.arms.rate_limit_windows import (
+    GCRAWindow,
+    LogWindow,
+    SlidingWindowCounter,
+    create_window,
+)
+from usepolvo.beak.config import PolvoSettings, get_settings
+from usepolvo.beak.enums import RateLimitAlgorithm, RateLimitMode
+from usepolvo.beak.exceptions import (
+    DeadlineExceededError,
+    RateLimitError,
+    RateLimitRejectedError,
+)
+
+
+class ExampleRateLimiter(BaseRateLimiter):
+    def __init__(self, algorithm=None, mode=None):
+        super().__init__(algorithm, mode)
+        self._initialize_window("minute")
+
+    def wait_if_needed(self):
+        self._wait_if_window_full("minute", 2, 60)
+
+    def get_limits(self):
+        return {"requests_per_minute": 2}
+
+
+class TwoWindowRateLimiter(BaseRateLimiter):
+    def __init__(self):
+        super().__init__(RateLimitAlgorithm.GCRA)
+        self._initialize_window("second")
+        self._initialize_window("minute")
+
+    def wait_if_needed(self):
+        self._wait_if_window_full("second", 10, 1)
+        self._wait_if_window_full("minute", 1, 60)
+
+    def get_limits(self):
+        return {"requests_per_second": 10, "requests_per_minute": 1}
+
+
+def simulate(window, limit, time_frame, duration, start=1000.0):
+    """Admit requests as fast as the window allows, returning when each was admitted."""
+    now, admitted = start, []
+    while now < start + duration:
+        now += window.delay(now, limit, time_frame)
+        window.admit(now, limit, time_frame)
+        admitted.append(now)
+    return admitted
+
+
+def max_in_rolling_window(times, time_frame):
+    return max(i - bisect.bisect_right(times, t - time_frame + 1e-9) + 1 for i, t in enumerate(times))
+
+
+@pytest.mark.parametrize("algorithm", list(RateLimitAlgorithm))
+def test_idle_window_admits_a_burst_up_to_the_limit(algorithm):
+    window = create_window(algorithm)
+    for _ in range(5):
+        assert window.delay(1000.0, 5, 10) == 0
+        window.admit(1000.0, 5, 10)
+    assert window.delay(1000.0, 5, 10) > 0
+
+
+@pytest.mark.parametrize("start", [1000.0, 1003.7])
+def test_log_window_is_exact(start):
+    admitted = simulate(LogWindow(), 10, 10, 100, start)
+    assert max_in_rolling_window(admitted, 10) == 10
+    assert len(admitted) == 101
+
+
+@pytest.mark.parametrize("start", [1000.0, 1003.7])
+def test_sliding_window_counter_stays_close_to_the_log(start):
+    admitted = simulate(SlidingWindowCounter(), 10, 10, 100, start)
+    assert max_in_rolling_window(admitted, 10) <= 13
+    assert 90 <= len(admitted) <= 101
+
+
+def test_gcra_and_token_bucket_admit_the_same_traffic():
+    gcra = simulate(GCRAWindow(), 10, 10, 100)
+    bucket = simulate(create_window(RateLimitAlgorithm.TOKEN_BUCKET), 10, 10, 100)
+    assert gcra == pytest.approx(bucket)
+    # Burst of 10, then one request a second
+    assert gcra[10] - gcra[9] == pytest.approx(1)
+
+
+def test_windows_keep_constant_state():
+    for algorithm in (RateLimitAlgorithm.SLIDING_WINDOW, RateLimitAlgorithm.GCRA, RateLimitAlgorithm.TOKEN_BUCKET):
+        window = create_window(algorithm)
+        simulate(window, 100000, 86400, 1)
+        assert all(not isinstance(value, (list, dict)) for value in vars(window).values())
+        assert "requests" not in vars(window)
+
+
+def test_default_algorithm_is_exact():
+    assert PolvoSettings().RATE_LIMIT_ALGORITHM == RateLimitAlgorithm.LOG
+
+
+def test_algorithm_defaults_to_settings(monkeypatch):
+    monkeypatch.setattr(get_settings(), "RATE_LIMIT_ALGORITHM", RateLimitAlgorithm.GCRA)
+    assert isinstance(ExampleRateLimiter().windows["minute"], GCRAWindow)
+    assert isinstance(ExampleRateLimiter(RateLimitAlgorithm.LOG).windows["minute"], LogWindow)
+
+
+def test_rate_limiter_sleeps_until_admitted():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.GCRA)
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0), patch(
+        "usepolvo.arms.base_rate_limiter.time.sleep"
+    ) as sleep:
+        for _ in range(3):
+            limiter.wait_if_needed()
+    sleep.assert_called_once_with(pytest.approx(30))
+
+
+def test_waiters_get_successive_slots_first_in_first_out():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.LOG)
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0), patch(
+        "usepolvo.arms.base_rate_limiter.time.sleep"
+    ) as sleep:
+        slots = [limiter._wait_if_window_full("minute", 2, 60) for _ in range(5)]
+    assert slots == [1000, 1000, 1060, 1060, 1120]
+    assert [call.args[0] for call in sleep.call_args_list] == [60, 60, 120]
+
+
+def test_sleeps_without_holding_any_lock():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.GCRA)
+    window = limiter.windows["minute"]
+
+    held = []
+
+    def sleep(seconds):
+        # Locks are not reentrant: acquiring one this thread holds would time out
+        for lock in (window.lock, limiter.lock):
+            if lock.acquire(timeout=1):
+                lock.release()
+            else:
+                held.append(lock)
+
+    with patch("usepolvo.arms.base_rate_limiter.time.sleep", side_effect=sleep) as mock_sleep:
+        threads = [threading.Thread(target=limiter.wait_if_needed) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert mock_sleep.call_count == 2
+    assert held == []
+
+
+def test_slot_past_the_deadline_is_not_claimed():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.GCRA)
+    limiter.wait_if_needed()
+    limiter.wait_if_needed()
+    window = limiter.windows["minute"]
+    reserved, tat = window.reserved, window.tat
+    with deadline_scope(1), pytest.raises(DeadlineExceededError):
+        limiter.wait_if_needed()
+    assert (window.reserved, window.tat) == (reserved, tat)
+
+
+def test_windows_do_not_block_each_other():
+    from usepolvo.tentacles.stripe.rate_limiter import StripeRateLimiter
+
+    limiter = StripeRateLimiter(read_limit=1, write_limit=1)
+    limiter.wait_if_needed()
+    sleeping, release = threading.Event(), threading.Event()
+
+    def sleep(seconds):
+        sleeping.set()
+        release.wait(5)
+
+    with patch("usepolvo.arms.base_rate_limiter.time.sleep", side_effect=sleep):
+        reader = threading.Thread(target=limiter.wait_if_needed)
+        reader.start()
+        assert sleeping.wait(5)
+        # A write goes through while a read waits for its slot
+        limiter.wait_if_needed(is_write_operation=True)
+        release.set()
+        reader.join()
+
+
+@pytest.mark.parametrize("algorithm", list(RateLimitAlgorithm))
+def test_try_acquire_never_waits_or_takes_capacity_when_full(algorithm):
+    limiter = ExampleRateLimiter(algorithm)
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0), patch(
+        "usepolvo.arms.base_rate_limiter.time.sleep"
+    ) as sleep:
+        assert [limiter.try_acquire() for _ in range(4)] == [True, True, False, False]
+    sleep.assert_not_called()
+    window = limiter.windows["minute"]
+    assert window.delay(1060.0, 2, 60) == 0
+
+
+@pytest.mark.parametrize("algorithm", list(RateLimitAlgorithm))
+def test_limit_of_zero_always_rejects(algorithm):
+    with pytest.raises(RateLimitRejectedError) as e:
+        create_window(algorithm).reserve(1000.0, 0, 60)
+    assert e.value.retry_after is None
+
+    class ClosedRateLimiter(ExampleRateLimiter):
+        def wait_if_needed(self):
+            self._wait_if_window_full("minute", 0, 60)
+
+    limiter = ClosedRateLimiter(algorithm)
+    assert not limiter.try_acquire()
+    with pytest.raises(RateLimitRejectedError):
+        limiter.acquire()
+    with pytest.raises(RateLimitRejectedError):
+        limiter.wait_if_needed()
+
+
+def test_acquire_timeout_reports_the_wait_it_refused():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.GCRA)
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0), patch(
+        "usepolvo.arms.base_rate_limiter.time.sleep"
+    ) as sleep:
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        with pytest.raises(RateLimitRejectedError) as e:
+            limiter.acquire(timeout=10)
+        assert e.value.retry_after == pytest.approx(30)
+        assert limiter.acquire(timeout=30) == pytest.approx(30)
+    sleep.assert_called_once_with(pytest.approx(30))
+
+
+def test_reject_mode_fails_fast_with_retry_after():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.LOG, RateLimitMode.REJECT)
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0):
+        limiter.acquire()
+        limiter.acquire()
+        with pytest.raises(RateLimitError) as e:
+            limiter.acquire()
+    assert e.value.retry_after == pytest.approx(60)
+
+
+def test_callers_beyond_max_queue_are_shed(monkeypatch):
+    monkeypatch.setattr(get_settings(), "RATE_LIMIT_MAX_QUEUE", 1)
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.LOG)
+    limiter.acquire()
+    limiter.acquire()
+    sleeping, release = threading.Event(), threading.Event()
+
+    def sleep(seconds):
+        sleeping.set()
+        release.wait(5)
+
+    with patch("usepolvo.arms.base_rate_limiter.time.sleep", side_effect=sleep):
+        waiter = threading.Thread(target=limiter.acquire)
+        waiter.start()
+        assert sleeping.wait(5)
+        with pytest.raises(RateLimitRejectedError, match="queue is full") as e:
+            limiter.acquire()
+        release.set()
+        waiter.join()
+    assert e.value.retry_after == pytest.approx(60, abs=1)
+    # The shed caller's slot was given back: only the waiter's is taken in the next minute
+    window = limiter.windows["minute"]
+    assert len(window.requests) == 1
+    assert window.delay(window.requests[0], 2, 60) == 0
+    assert limiter.waiting == 0
+
+
+def test_rejection_in_a_later_window_releases_earlier_slots():
+    limiter = TwoWindowRateLimiter()
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0):
+        assert limiter.try_acquire()
+        second = limiter.windows["second"].tat
+        assert not limiter.try_acquire()
+    assert limiter.windows["second"].tat == second
+
+
+class MinuteAndDayRateLimiter(BaseRateLimiter):
+    def __init__(self):
+        super().__init__(RateLimitAlgorithm.LOG)
+        self._initialize_window("minute")
+        self._initialize_window("day")
+
+    def wait_if_needed(self):
+        self._wait_if_window_full("minute", 2, 60)
+        self._wait_if_window_full("day", 1, 1000)
+
+    def get_limits(self):
+        return {"requests_per_minute": 2, "requests_per_day": 1}
+
+
+@pytest.mark.parametrize("wait", ["acquire", "wait_if_needed"])
+def test_every_window_counts_the_request_when_it_is_sent(wait):
+    limiter = MinuteAndDayRateLimiter()
+    with patch("usepolvo.arms.base_rate_limiter.time.time", return_value=1000.0), patch(
+        "usepolvo.arms.base_rate_limiter.time.sleep"
+    ) as sleep:
+        getattr(limiter, wait)()
+        sleep.assert_not_called()
+        # The day window holds the request back until 2000: the minute window must count it then
+        getattr(limiter, wait)()
+        sleep.assert_called_once_with(pytest.approx(1000))
+    # (the first request, at 1000, has left both windows by then)
+    assert list(limiter.windows["minute"].requests) == [2000]
+    assert list(limiter.windows["day"].requests) == [2000]
+
+
+def test_client_does_not_retry_a_rejected_request(make_client, make_response):
+    client = make_client(rate_limiter=ExampleRateLimiter(RateLimitAlgorithm.GCRA, RateLimitMode.REJECT))
+    with patch.object(client.http.session, "request", return_value=make_response(200, {})) as request:
+        client._request("GET", "/a", use_cache=False)
+        client._request("GET", "/b", use_cache=False)
+        with pytest.raises(RateLimitError) as e:
+            client._request("GET", "/c", use_cache=False)
+    assert request.call_count == 2
+    assert 0 < e.value.retry_after <= 30
+
+
+@pytest.mark.asyncio
+async def test_async_wait_sleeps_on_the_loop_and_gives_the_slot_back_when_cancelled():
+    limiter = ExampleRateLimiter(RateLimitAlgorithm.LOG)
+    await limiter.async_acquire()
+    await limiter.async_acquire()
+    with patch("usepolvo.arms.base_rate_limiter.time.sleep", side_effect=AssertionError("blocking sleep")):
+        waiter = asyncio.ensure_future(limiter.async_wait_if_needed())
+        await asyncio.sleep(0.05)
+        assert limiter.waiting == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+    assert limiter.waiting == 0
+    # The cancelled request was never sent: its slot, a minute from now, is free again
+    assert all(sent <= time.time() for sent in limiter.windows["minute"].requests)
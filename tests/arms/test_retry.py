@@ -0,0 +1,112 @@
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+import requests
+import urllib3
+
+from usepolvo.arms.retry import Retrier, RetryBudget, RetryPolicy, parse_retry_after
+from usepolvo.beak.exceptions import APIError, RateLimitError
+
+
+def test_parse_retry_after_formats():
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert 8 <= parse_retry_after({"Retry-After": formatdate(time.time() + 10, usegmt=True)}) <= 10
+    assert 19 <= parse_retry_after({"X-RateLimit-Reset": str(int(time.time()) + 20)}) <= 20
+    assert 19 <= parse_retry_after({"X-RateLimit-Reset": str(int(time.time() * 1000) + 20_000)}) <= 20
+    assert parse_retry_after({}) is None
+
+
+def test_server_errors_are_retried_for_gets(client, make_response):
+    responses = [make_response(503), make_response(200, {"ok": True})]
+    with patch.object(client.http, "request", side_effect=responses) as mock_request:
+        assert client._request("GET", "/items") == {"ok": True}
+    assert mock_request.call_count == 2
+    assert client.get_retry_stats()["reasons"] == {"503": 1}
+
+
+def test_server_errors_are_not_retried_for_posts(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(503)) as mock_request:
+        with pytest.raises(APIError) as exc_info:
+            client._request("POST", "/items", json={})
+    assert mock_request.call_count == 1
+    assert exc_info.value.status_code == 503
+
+
+@pytest.mark.parametrize("coalescing", [True, False])
+def test_gets_marked_not_idempotent_are_not_retried(client, make_response, coalescing):
+    client.request_coalescing = coalescing
+    with patch.object(client.http, "request", return_value=make_response(503)) as mock_request:
+        with pytest.raises(APIError):
+            client._request("GET", "/report", idempotent=False)
+    assert mock_request.call_count == 1
+
+
+def test_posts_with_idempotency_key_are_retried(client, make_response):
+    responses = [make_response(502), make_response(200, {"ok": True})]
+    with patch.object(client.http, "request", side_effect=responses):
+        assert client._request("POST", "/items", headers={"Idempotency-Key": "abc"}, json={}) == {"ok": True}
+
+
+def test_rate_limited_writes_honor_retry_after(client, make_response):
+    responses = [make_response(429, headers={"Retry-After": "0.01"}), make_response(200, {"ok": True})]
+    with patch.object(client.http, "request", side_effect=responses), patch("usepolvo.arms.retry.time.sleep") as sleep:
+        assert client._request("POST", "/items", json={}) == {"ok": True}
+    sleep.assert_called_once_with(0.01)
+
+
+def test_gives_up_after_max_attempts(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(429)) as mock_request:
+        with pytest.raises(RateLimitError):
+            client._request("GET", "/items")
+    assert mock_request.call_count == 3
+    assert client.get_retry_stats()["exhausted"] == 1
+
+
+def test_transport_errors_are_retried(client, make_response):
+    responses = [requests.exceptions.ConnectionError("reset"), make_response(200, {"ok": True})]
+    with patch.object(client.http, "request", side_effect=responses):
+        assert client._request("GET", "/items") == {"ok": True}
+    assert client.get_retry_stats()["reasons"] == {"transport": 1}
+
+
+@pytest.mark.parametrize(
+    "error, reason",
+    [
+        (urllib3.exceptions.ProtocolError("Connection aborted"), "transport"),
+        (urllib3.exceptions.NewConnectionError(None, "refused"), "transport"),
+        (urllib3.exceptions.ReadTimeoutError(None, "/items", "timed out"), "transport"),
+        (urllib3.exceptions.LocationParseError("bad url"), None),
+        (urllib3.exceptions.DecodeError("bad gzip"), None),
+    ],
+)
+def test_only_urllib3_connection_and_timeout_errors_are_transient(error, reason):
+    assert RetryPolicy().classify(error, idempotent=True) == reason
+
+
+def test_budget_stops_retry_storms():
+    retrier = Retrier(RetryPolicy(max_attempts=5, base_delay=0), RetryBudget(ratio=0, reserve=2))
+
+    def fail():
+        raise RateLimitError()
+
+    with pytest.raises(RateLimitError):
+        retrier.call(fail)
+    stats = retrier.stats()
+    assert stats["retries"] == 2
+    assert stats["budget_exhausted"] == 1
+
+
+def test_long_retry_after_is_not_waited_for():
+    retrier = Retrier(RetryPolicy(max_retry_after=5))
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise RateLimitError(retry_after=3600)
+
+    with pytest.raises(RateLimitError):
+        retrier.call(fail)
+    assert len(calls) == 1
+    assert retrier.stats()["retry_after_too_long"] == 1
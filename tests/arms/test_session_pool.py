@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from usepolvo.arms.base_auth import BaseAuth
+from usepolvo.arms.session_pool import SessionPool
+
+
+class DummyAuth(BaseAuth):
+    def get_auth_headers(self):
+        return {"Authorization": "Bearer token"}
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(auth=DummyAuth())
+
+
+def test_sessions_are_per_thread_but_share_adapter():
+    pool = SessionPool(pool_maxsize=4)
+    sessions = []
+
+    def grab():
+        sessions.append(pool.session)
+
+    threads = [threading.Thread(target=grab) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 3
+    assert all(session.get_adapter("https://api.example.com") is pool.adapter for session in sessions)
+
+
+def test_keep_alive_disabled_sets_connection_close():
+    pool = SessionPool(keep_alive=False)
+    assert pool.session.headers["Connection"] == "close"
+
+
+def test_client_binds_auth_to_its_pool(client):
+    assert client.auth.session is client.http
+    assert client.auth.http is client.http
+
+
+def test_unbound_auth_falls_back_to_requests():
+    import requests
+
+    assert DummyAuth().http is requests
+
+
+def test_request_goes_through_pool(client, make_response):
+    with patch.object(client.http, "request", return_value=make_response(200, {"ok": True})) as mock_request:
+        assert client._request("GET", "/things") == {"ok": True}
+        mock_request.assert_called_once()
+        assert mock_request.call_args[0][:2] == ("GET", "https://api.example.com/things")
+
+
+def test_token_request_uses_pool():
+    auth = DummyAuth()
+    auth.session = MagicMock()
+    auth.session.post.return_value = MagicMock(status_code=200, json=lambda: {"access_token": "abc"})
+    auth._make_token_request("https://auth.example.com/token", {"grant_type": "client_credentials"})
+    auth.session.post.assert_called_once()
+    assert auth.access_token == "abc"
@@ -0,0 +1,92 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from usepolvo.arms.single_flight import SingleFlight
+
+
+class CountingRateLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def wait_if_needed(self):
+        self.calls += 1
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client(rate_limiter=CountingRateLimiter())
+
+
+def slow_response(*args, **kwargs):
+    time.sleep(0.1)
+    return MagicMock(status_code=200, content=b'{"id": "app_123"}')
+
+
+def run_concurrently(func, count):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(func())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_identical_gets_share_one_request(client):
+    with patch.object(client.http, "request", side_effect=slow_response) as mock_request:
+        results = run_concurrently(lambda: client._request("GET", "/applicants/app_123/"), 10)
+
+    assert mock_request.call_count == 1
+    assert client.rate_limiter.calls == 1
+    assert results == [{"id": "app_123"}] * 10
+    stats = client.get_coalescing_stats()
+    assert stats["executed"] == 1
+    assert stats["coalesced"] == 9
+
+
+def test_cache_hits_do_not_spend_rate_limit(client):
+    with patch.object(client.http, "request", side_effect=slow_response):
+        client._request("GET", "/applicants/app_123/")
+        client._request("GET", "/applicants/app_123/")
+    assert client.rate_limiter.calls == 1
+
+
+def test_followers_receive_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("key", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader] + followers:
+        thread.join()
+
+    assert len(errors) == 4
+    assert flight.stats() == {"executed": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_writes_are_never_coalesced(client):
+    with patch.object(client.http, "request", side_effect=slow_response) as mock_request:
+        run_concurrently(lambda: client._request("POST", "/applicants/", json={"a": 1}), 3)
+    assert mock_request.call_count == 3
+    # Every POST went upstream on its own, none through the single-flight group
+    assert client.single_flight.stats() == {"executed": 0, "coalesced": 0, "in_flight": 0}
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from usepolvo.arms.cache import CacheEntry
+from usepolvo.ink import codec
+
+
+@pytest.fixture(params=sorted({codec.BACKEND, "json"}))
+def backend(request, monkeypatch):
+    monkeypatch.setattr(codec, "BACKEND", request.param)
+    return request.param
+
+
+def test_round_trip_bytes(backend):
+    value = {"name": "Ada é", "ids": [1, 2.5, None, True], "nested": {"a": []}}
+    encoded = codec.dumps(value)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == value
+    assert json.loads(encoded) == value
+
+
+def test_loads_accepts_str_and_memoryview():
+    assert codec.loads('{"a": 1}') == {"a": 1}
+    assert codec.loads(memoryview(b"[1]")) == [1]
+
+
+def test_malformed_input_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"a": ')
+
+
+def test_default_and_stdlib_fallback(backend):
+    assert codec.loads(codec.dumps({"at": object}, default=lambda o: "x")) == {"at": "x"}
+    # Larger than 64 bits: only stdlib json can encode it
+    assert codec.loads(codec.dumps({"n": 2**70})) == {"n": 2**70}
+
+
+def test_cache_entry_bytes_are_interchangeable_with_stdlib_json():
+    entry = CacheEntry({"id": "é"}, 60, etag='"v1"')
+    payload = json.loads(entry.to_bytes())
+    assert payload[:3] == [{"id": "é"}, 60, '"v1"']
+    assert CacheEntry.from_bytes(json.dumps(payload).encode()).value == {"id": "é"}
@@ -0,0 +1,58 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from usepolvo.ink import json_stream
+from usepolvo.ink.json_stream import JSONArrayParser, iter_json_array
+
+DOCUMENT = {
+    "count": 3,
+    "meta": {"next": None, "tags": ["a", "]"]},
+    "results": [{"id": 1, "name": "Ada é"}, {"id": 2, "score": -12.5e3}, 42],
+}
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 4096])
+def test_items_are_identical_for_any_chunking(size):
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(chunked(data, size), ("results",))) == DOCUMENT["results"]
+
+
+def test_top_level_array():
+    assert list(iter_json_array([b"[1, 2", b"3, 4]"])) == [1, 23, 4]
+
+
+def test_nested_path():
+    data = b'{"data": {"items": [true, null]}}'
+    assert list(iter_json_array(chunked(data, 3), ("data", "items"))) == [True, None]
+
+
+def test_items_yielded_before_document_completes():
+    parser = JSONArrayParser(("results",))
+    assert parser.feed(b'{"results": [{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b": 2}]}") == [{"id": 2}]
+    assert parser.done
+
+
+@pytest.mark.parametrize("data", [b'{"count": 0}', b'{"results": null}', b'{"results": []}'])
+def test_missing_or_empty_array_yields_nothing(data):
+    assert list(iter_json_array([data], ("results",))) == []
+
+
+def test_large_items_are_decoded_once_they_have_arrived():
+    item = {"text": 'quote " backslash \\ ] } ' * 20000, "values": list(range(20000)), "nested": [{"a": [1]}]}
+    data = json.dumps({"results": [item, -1.5]}).encode("utf-8")
+    with patch.object(json_stream, "_decoder", wraps=json_stream._decoder) as decoder:
+        assert list(iter_json_array(chunked(data, 1024), ("results",))) == [item, -1.5]
+    # The key and the two items, never a partial item
+    assert decoder.raw_decode.call_count == 3
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"results": [{"id": 1}, {"id": 2'], ("results",)))
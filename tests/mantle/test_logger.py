@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from usepolvo.mantle import logger as mantle_logger
+from usepolvo.mantle.logger import (
+    RequestLogger,
+    StructuredFormatter,
+    configure_logging,
+    get_logger,
+    shutdown_logging,
+)
+
+
+class ExampleClient:
+    pass
+
+
+def make_settings(**overrides):
+    settings = {
+        "LOG_LEVEL": "DEBUG",
+        "LOG_FILE": None,
+        "LOG_CONSOLE": False,
+        "LOG_FORMAT": "text",
+    }
+    settings.update(overrides)
+    return SimpleNamespace(**settings)
+
+
+def make_record(**extra):
+    record = logging.LogRecord("usepolvo.requests", logging.DEBUG, __file__, 1, "GET %s", ("/items",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    yield
+    shutdown_logging()
+    mantle_logger._configured = False
+    logging.getLogger("usepolvo").setLevel(logging.NOTSET)
+
+
+def test_get_logger_names_are_under_usepolvo():
+    assert get_logger().name == "usepolvo"
+    assert get_logger("requests").name == "usepolvo.requests"
+    assert get_logger("usepolvo.arms.base_client").name == "usepolvo.arms.base_client"
+
+
+def test_text_format_appends_fields():
+    text = StructuredFormatter().format(make_record(tentacle="certn", status=200, latency_ms=12.5))
+    assert text.endswith("usepolvo.requests: GET /items tentacle=certn status=200 latency_ms=12.5")
+
+
+def test_json_format():
+    entry = json.loads(StructuredFormatter(json=True).format(make_record(tentacle="certn", status=None)))
+    assert entry["message"] == "GET /items"
+    assert entry["level"] == "DEBUG"
+    assert entry["tentacle"] == "certn"
+    assert "status" not in entry
+
+
+def test_importing_usepolvo_does_not_write_logs(tmp_path):
+    code = "import usepolvo.mantle.logger, usepolvo.arms.base_client, logging; print(logging.getLogger().handlers)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert output.returncode == 0, output.stderr
+    assert output.stdout.strip() == "[]"
+    assert os.listdir(tmp_path) == []
+
+
+def test_records_are_written_by_the_background_writer(tmp_path):
+    path = tmp_path / "usepolvo.log"
+    configure_logging(make_settings(LOG_FILE=str(path), LOG_FORMAT="json"))
+    get_logger("test").info("hello", extra={"tentacle": "certn"})
+    shutdown_logging()
+
+    entry = json.loads(path.read_text())
+    assert entry["logger"] == "usepolvo.test"
+    assert entry["message"] == "hello"
+    assert entry["tentacle"] == "certn"
+
+
+def test_configure_logging_runs_once(tmp_path):
+    configure_logging(make_settings(LOG_LEVEL="WARNING"))
+    configure_logging(make_settings(LOG_LEVEL="DEBUG"))
+    assert logging.getLogger("usepolvo").level == logging.WARNING
+    configure_logging(make_settings(LOG_LEVEL="DEBUG"), force=True)
+    assert logging.getLogger("usepolvo").level == logging.DEBUG
+
+
+def test_level_set_by_the_application_is_kept():
+    configure_logging(make_settings(LOG_LEVEL=None))
+    assert logging.getLogger("usepolvo").level == logging.INFO
+    logging.getLogger("usepolvo").setLevel(logging.ERROR)
+    configure_logging(make_settings(LOG_LEVEL=None), force=True)
+    assert logging.getLogger("usepolvo").level == logging.ERROR
+
+
+def test_request_logger_samples_successes_but_not_failures(caplog):
+    request_logger = RequestLogger(sample_rate=0.0)
+    info = {"method": "GET", "duration": 0.01, "bytes_in": 10, "bytes_out": 0}
+    with caplog.at_level(logging.DEBUG, logger="usepolvo.requests"):
+        request_logger.on_response(ExampleClient(), url="https://api.example.com/items/42", status=200, **info)
+        request_logger.on_response(ExampleClient(), url="https://api.example.com/items/42", status=503, **info)
+        request_logger.on_retry(
+            ExampleClient(), "GET", "https://api.example.com/items/42", attempt=1, delay=0.5, error=Exception()
+        )
+
+    assert [record.status if hasattr(record, "status") else None for record in caplog.records] == [503, None]
+    assert caplog.records[0].endpoint == "/items/{id}"
+    assert caplog.records[0].tentacle == "example"
+    assert caplog.records[1].attempt == 1
+
+
+def test_request_logger_is_silent_above_debug(caplog):
+    with caplog.at_level(logging.INFO, logger="usepolvo.requests"):
+        RequestLogger().on_response(ExampleClient(), "GET", "https://api.example.com/items", 200, 0.01, 10, 0)
+    assert caplog.records == []
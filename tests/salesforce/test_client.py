@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from usepolvo.arms.circuit_breaker import CircuitBreakerRegistry
+from usepolvo.arms.retry import Retrier, RetryPolicy
+from usepolvo.beak.enums import RateLimitMode
+from usepolvo.beak.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    RateLimitRejectedError,
+)
+from usepolvo.tentacles.salesforce.client import SalesforceClient
+from usepolvo.tentacles.salesforce.exceptions import SalesforceAPIError
+
+
+@pytest.fixture
+def client():
+    with patch.object(SalesforceClient, "_handle_authentication"):
+        client = SalesforceClient(consumer_key="key", consumer_secret="secret", redirect_uri="http://localhost")
+    client.auth.access_token = "token"
+    client.auth.instance_url = "https://example.my.salesforce.com"
+    client.retrier = Retrier(RetryPolicy(max_attempts=3, base_delay=0.001))
+    client.circuit_breakers = CircuitBreakerRegistry()
+    return client
+
+
+def test_rate_limit_rejection_keeps_its_retry_after(client):
+    client.rate_limiter.mode = RateLimitMode.REJECT
+    client.rate_limiter.requests_per_day = 1
+    with patch.object(client.http, "request", return_value=MagicMock(status_code=200, content=b"{}")):
+        client._request("GET", "/limits")
+        with pytest.raises(RateLimitRejectedError) as e:
+            client._request("GET", "/limits")
+    assert e.value.retry_after > 0
+
+
+def test_open_circuit_is_not_wrapped(client):
+    client.circuit_breaker_config.update(min_calls=2, open_duration=60)
+    with patch.object(client.http, "request", side_effect=requests.exceptions.ConnectionError("reset")):
+        with pytest.raises(CircuitOpenError):
+            client._request("GET", "/limits")
+
+
+def test_deadline_is_not_wrapped(client):
+    with pytest.raises(DeadlineExceededError):
+        client._request("GET", "/limits", deadline=0)
+
+
+def test_other_errors_are_mapped_to_salesforce_errors(client):
+    with patch.object(client, "_build_url", side_effect=requests.exceptions.Timeout("slow")):
+        with pytest.raises(SalesforceAPIError):
+            client._request("GET", "/limits")
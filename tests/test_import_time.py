@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+TENTACLES = ["certn", "claude", "gemini", "hubspot", "linear", "openai", "salesforce", "stripe"]
+
+# Vendor SDKs and server dependencies that must only be imported when a client or webhook is used
+HEAVY_MODULES = ["hubspot", "stripe", "openai", "anthropic", "google.generativeai", "gql", "pyngrok", "aiohttp"]
+
+# Import time budgets, in seconds. Generous enough for a slow CI machine; importing any vendor SDK blows them.
+PACKAGE_BUDGET = 0.1  # A tentacle package, which only declares its lazy exports
+CLIENT_BUDGET = 0.15  # A client module, on top of usepolvo.arms.base_client (requests, pydantic-settings)
+
+
+def import_in_subprocess(module):
+    """Import a module in a fresh interpreter; returns the heavy modules it loaded and cumulative import times."""
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in output.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1e6
+    loaded = [name for name in output.stdout.strip().split(",") if name]
+    return loaded, times
+
+
+@pytest.mark.parametrize("tentacle", TENTACLES)
+def test_tentacle_package_imports_nothing_heavy(tentacle):
+    module = f"usepolvo.tentacles.{tentacle}"
+    loaded, times = import_in_subprocess(module)
+    assert loaded == []
+    assert times[module] < PACKAGE_BUDGET
+
+
+@pytest.mark.parametrize("tentacle", TENTACLES)
+def test_client_module_defers_vendor_sdks(tentacle):
+    module = f"usepolvo.tentacles.{tentacle}.client"
+    loaded, times = import_in_subprocess(module)
+    assert loaded == []
+    assert times[module] - times["usepolvo.arms.base_client"] < CLIENT_BUDGET
+
+
+def test_exports_are_resolved_on_first_use():
+    code = (
+        "import sys, usepolvo.tentacles.stripe as stripe_tentacle; "
+        "assert 'StripeWebhook' in dir(stripe_tentacle); "
+        "assert 'usepolvo.tentacles.stripe.webhook.handler' not in sys.modules; "
+        "stripe_tentacle.StripeWebhook; "
+        "assert 'usepolvo.tentacles.stripe.webhook.handler' in sys.modules; "
+        "assert 'StripeWebhook' in vars(stripe_tentacle)"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_unknown_export_raises_attribute_error():
+    import usepolvo.tentacles.certn as certn
+
+    with pytest.raises(AttributeError):
+        certn.DoesNotExist